@@ -9,7 +9,10 @@ from aiohttp import CookieJar
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
 
 from .api import HiotApiClient
 from .const import (
@@ -21,12 +24,33 @@ from .const import (
     DEFAULT_ENERGY_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    FAST_POLL_INTERVAL,
     PLATFORMS,
 )
-from .coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
+from .command_journal import async_remove_journal_store
+from .coordinator import (
+    HiotDataUpdateCoordinator,
+    HiotEnergyCoordinator,
+    async_remove_closed_months_store,
+)
+from .energy_history import HiotEnergyHistoryImporter, async_remove_history_store
+from .energy_store import HiotEnergyStore, async_remove_energy_store
+from .entity import light_group_locations
+from .scheduler import HiotCommandScheduler, async_remove_scheduler_store
+from .services import async_setup_services
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the HT HomeService component."""
+    async_register_websocket_commands(hass)
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HT HomeService from a config entry."""
@@ -47,14 +71,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     scan_interval = _get_scan_interval(entry)
     coordinator = HiotDataUpdateCoordinator(hass, entry, client, scan_interval)
     await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_fast_poll,
+            FAST_POLL_INTERVAL,
+            name=f"{DOMAIN} fast poll",
+            cancel_on_shutdown=True,
+        )
+    )
 
     energy_scan_interval = _get_energy_scan_interval(entry)
     energy_coordinator = HiotEnergyCoordinator(hass, entry, client, energy_scan_interval)
     await energy_coordinator.async_config_entry_first_refresh()
 
+    energy_history = HiotEnergyHistoryImporter(hass, entry, energy_coordinator)
+    await energy_history.async_load()
+    entry.async_on_unload(
+        energy_coordinator.async_add_listener(energy_history.async_schedule_import)
+    )
+    energy_history.async_schedule_import()
+
+    energy_store = HiotEnergyStore(hass, entry, energy_coordinator)
+    await energy_store.async_open()
+    entry.async_on_unload(
+        energy_coordinator.async_add_listener(energy_store.async_schedule_append)
+    )
+    energy_store.async_schedule_append()
+
+    scheduler = HiotCommandScheduler(hass, entry, coordinator)
+    await scheduler.async_load()
+
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "coordinator": coordinator,
         "energy_coordinator": energy_coordinator,
+        "energy_history": energy_history,
+        "energy_store": energy_store,
+        "scheduler": scheduler,
+        # Light groups are created at platform setup; a change needs a reload
+        "light_group_locations": light_group_locations(entry, coordinator.devices),
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -72,6 +127,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry_data = hass.data[DOMAIN].pop(entry.entry_id)
         coordinator: HiotDataUpdateCoordinator = entry_data["coordinator"]
         energy_coordinator: HiotEnergyCoordinator = entry_data["energy_coordinator"]
+        energy_store: HiotEnergyStore = entry_data["energy_store"]
+        await energy_store.async_close()
+        scheduler: HiotCommandScheduler = entry_data["scheduler"]
+        await scheduler.async_unload()
         if energy_coordinator.api_client is coordinator.api_client:
             await coordinator.api_client.async_close()
         else:
@@ -84,19 +143,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    await async_remove_history_store(hass, entry.entry_id)
+    await async_remove_closed_months_store(hass, entry.entry_id)
+    await async_remove_energy_store(hass, entry.entry_id)
+    await async_remove_scheduler_store(hass, entry.entry_id)
+    await async_remove_journal_store(hass, entry.entry_id)
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update — adjust coordinator polling interval."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: HiotDataUpdateCoordinator = data["coordinator"]
+    if set(light_group_locations(entry, coordinator.devices)) != set(
+        data["light_group_locations"]
+    ):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
     energy_coordinator: HiotEnergyCoordinator = data["energy_coordinator"]
 
     coordinator.update_interval = _get_scan_interval(entry)
-    energy_coordinator.update_interval = _get_energy_scan_interval(entry)
+    energy_coordinator.scan_interval = _get_energy_scan_interval(entry)
 
     _LOGGER.debug(
         "Scan intervals updated: device=%s, energy=%s",
         coordinator.update_interval,
-        energy_coordinator.update_interval,
+        energy_coordinator.scan_interval,
     )
 def _get_scan_interval(entry: ConfigEntry) -> timedelta:
     """Get scan interval from options, falling back to default."""
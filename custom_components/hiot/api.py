@@ -3,14 +3,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from calendar import monthrange
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, Generic, TypeVar
 
 import aiohttp
 
 from .const import (
     API_BASE_URL,
     DEVICE_CATEGORY_MAP,
+    ENERGY_ITEM_PERIODS,
+    ENERGY_ITEM_TYPES,
+    ENERGY_PERIOD_MONTH,
+    ENERGY_PERIODS,
     ENERGY_TYPES,
     PATH_CTOC_TOKEN,
     PATH_DEVICES,
@@ -18,16 +27,42 @@ from .const import (
     PATH_EMS_FEE,
     PATH_EMS_USAGE,
     PATH_EMS_USAGE_GOAL,
+    PATH_EMS_USAGE_HISTORY,
     PATH_HOUSEHOLD,
     PATH_LOGIN,
 )
 from .crypto import encrypt
+from .json_stream import JsonListItemParser
+from .metrics import HiotApiMetrics, classify_endpoint
 
 _LOGGER = logging.getLogger(__name__)
 
 MAX_AUTH_RETRY_ATTEMPTS = 10
 MAX_AUTH_RETRY_DELAY_SECONDS = 10
 
+# Default limits for async_run_batch; complex servers are shared by all residents
+BATCH_CONCURRENCY = 4
+BATCH_ITEM_TIMEOUT_SECONDS = 30
+
+# Read size for streamed responses
+STREAM_CHUNK_SIZE = 16384
+
+# Keys that may carry the period of an EMS list item, in lookup order
+_DATE_KEYS = (
+    "date",
+    "usageDate",
+    "feeDate",
+    "goalDate",
+    "targetDate",
+    "yearMonth",
+    "ym",
+    "month",
+)
+_DATE_FORMATS = ("%Y-%m-%d", "%Y-%m", "%Y%m", "%Y%m%d")
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+_ResultT = TypeVar("_ResultT")
+
 
 class HiotApiError(Exception):
     """Base exception for HT HomeService API."""
@@ -41,12 +76,54 @@ class HiotConnectionError(HiotApiError):
     """Connection error."""
 
 
+# Failures meaning the server was not reached, as opposed to a rejected request
+SERVER_UNREACHABLE_ERRORS: tuple[type[BaseException], ...] = (HiotConnectionError, TimeoutError)
+
+
+@dataclass(frozen=True)
+class HiotBatchItemError:
+    """Why one item of a batch produced no result."""
+
+    key: Hashable
+    error_type: str
+    message: str
+    exception: BaseException | None = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_exception(cls, key: Hashable, err: BaseException) -> HiotBatchItemError:
+        """Build an item error from the exception the job ended with."""
+        return cls(key, type(err).__name__, str(err) or type(err).__name__, err)
+
+    def as_dict(self) -> dict[str, str]:
+        """Return a JSON-serialisable representation."""
+        key = (
+            "/".join(str(part) for part in self.key)
+            if isinstance(self.key, tuple)
+            else str(self.key)
+        )
+        return {"key": key, "error_type": self.error_type, "message": self.message}
+
+
+@dataclass
+class HiotBatchResult(Generic[_KeyT, _ResultT]):
+    """Partial results of a batch: successful values and per-item errors."""
+
+    results: dict[_KeyT, _ResultT] = field(default_factory=dict)
+    errors: dict[_KeyT, HiotBatchItemError] = field(default_factory=dict)
+    # Items set aside for a later retry instead of failing
+    queued: list[_KeyT] = field(default_factory=list)
+
+
 class HiotApiClient:
     """Async API client for HT HomeService."""
 
-    def __init__(self, session: aiohttp.ClientSession) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str = API_BASE_URL,
+    ) -> None:
         self._session = session
-        self._base_url = API_BASE_URL
+        self._base_url = base_url.rstrip("/")
         self._authenticated = False
         self._username: str | None = None
         self._password: str | None = None
@@ -54,6 +131,10 @@ class HiotApiClient:
         self._dong: str | None = None
         self._ho: str | None = None
         self._auth_lock = asyncio.Lock()
+        self._batch_tasks: set[asyncio.Task[Any]] = set()
+        # Date key last seen per EMS list type
+        self._date_key_memo: dict[str, str] = {}
+        self.metrics = HiotApiMetrics()
 
     async def async_login(self, username: str, password: str) -> None:
         """Login with encrypted credentials."""
@@ -170,56 +251,101 @@ class HiotApiClient:
         return {}
 
     @staticmethod
-    def _parse_sortable_date(value: Any) -> datetime | None:
-        if not isinstance(value, str):
-            return None
-
+    def _strptime_sort_key(value: str) -> int | None:
+        """Parse less common layouts (unpadded, padded with spaces) with strptime."""
         normalized = value.strip()
         if not normalized:
             return None
 
-        for date_format in ("%Y-%m-%d", "%Y-%m", "%Y%m", "%Y%m%d"):
+        for date_format in _DATE_FORMATS:
             try:
-                return datetime.strptime(normalized, date_format)
+                parsed = datetime.strptime(normalized, date_format)
             except ValueError:
                 continue
+            return parsed.year * 10000 + parsed.month * 100 + parsed.day
 
         return None
 
-    @classmethod
-    def _select_latest_list_item(cls, values: list[Any]) -> dict[str, Any]:
-        dict_items = [item for item in values if isinstance(item, dict)]
-        if not dict_items:
-            return {}
-        if len(dict_items) == 1:
-            return dict_items[0]
-
-        date_keys = (
-            "date",
-            "usageDate",
-            "feeDate",
-            "goalDate",
-            "targetDate",
-            "yearMonth",
-            "ym",
-            "month",
-        )
-
-        dated_items: list[tuple[datetime, dict[str, Any]]] = []
-        for item in dict_items:
-            for key in date_keys:
-                parsed_date = cls._parse_sortable_date(item.get(key))
-                if parsed_date is not None:
-                    dated_items.append((parsed_date, item))
-                    break
+    @staticmethod
+    def _date_sort_key(value: Any) -> int | None:
+        """Return a sortable YYYYMMDD integer for an EMS date string.
 
-        if dated_items:
-            return max(dated_items, key=lambda entry: entry[0])[1]
+        The fixed-width layouts the API uses are sliced directly; anything
+        else (or an invalid calendar date) falls back to strptime.
+        """
+        if not isinstance(value, str):
+            return None
 
-        return dict_items[0]
+        length = len(value)
+        if length == 10 and value[4] == "-" and value[7] == "-":
+            digits = value[:4] + value[5:7] + value[8:]
+        elif length == 7 and value[4] == "-":
+            digits = value[:4] + value[5:] + "01"
+        elif length == 6:
+            digits = value + "01"
+        elif length == 8:
+            digits = value
+        else:
+            return HiotApiClient._strptime_sort_key(value)
+
+        if digits.isascii() and digits.isdigit():
+            sort_key = int(digits)
+            year, month, day = sort_key // 10000, sort_key // 100 % 100, sort_key % 100
+            if (
+                year >= 1
+                and 1 <= month <= 12
+                and 1 <= day <= (28 if day <= 28 else monthrange(year, month)[1])
+            ):
+                return sort_key
+
+        return HiotApiClient._strptime_sort_key(value)
 
     @staticmethod
-    def _extract_first_list_item(response: Any, list_key: str) -> dict[str, Any]:
+    def _parse_sortable_date(value: Any) -> datetime | None:
+        sort_key = HiotApiClient._date_sort_key(value)
+        if sort_key is None:
+            return None
+        return datetime(sort_key // 10000, sort_key // 100 % 100, sort_key % 100)
+
+    def _select_latest_list_item(
+        self, values: list[Any], response_type: str | None = None
+    ) -> dict[str, Any]:
+        """Return the newest dict item of an EMS list in a single pass.
+
+        The date key found for a ``response_type`` is remembered and tried
+        first on later responses of the same type.
+        """
+        date_key = self._date_key_memo.get(response_type) if response_type else None
+        first_item: dict[str, Any] | None = None
+        latest_item: dict[str, Any] | None = None
+        latest_key = -1
+
+        for item in values:
+            if not isinstance(item, dict):
+                continue
+            if first_item is None:
+                first_item = item
+
+            sort_key = self._date_sort_key(item.get(date_key)) if date_key else None
+            if sort_key is None:
+                for key in _DATE_KEYS:
+                    sort_key = self._date_sort_key(item.get(key))
+                    if sort_key is not None:
+                        date_key = key
+                        break
+
+            if sort_key is not None and sort_key > latest_key:
+                latest_item = item
+                latest_key = sort_key
+
+        if response_type and date_key:
+            self._date_key_memo[response_type] = date_key
+
+        if latest_item is not None:
+            return latest_item
+        return first_item or {}
+
+    def _extract_first_list_item(self, response: Any, list_key: str) -> dict[str, Any]:
         if not isinstance(response, dict):
             return {}
 
@@ -231,61 +357,163 @@ class HiotApiClient:
         if not isinstance(values, list) or not values:
             return {}
 
-        return HiotApiClient._select_latest_list_item(values)
+        return self._select_latest_list_item(values, list_key)
 
-    async def async_get_energy_usage(self, energy_type: str, date: str) -> dict[str, Any]:
-        """Get energy usage comparison for current month."""
-        path = f"{PATH_EMS_USAGE}?energyType={energy_type}&period=MONTH&date={date}"
+    @staticmethod
+    def _energy_path(path: str, energy_type: str, date: str, period: str) -> str:
+        if period not in ENERGY_PERIODS:
+            raise ValueError(f"Unsupported EMS period: {period}")
+        return f"{path}?energyType={energy_type}&period={period}&date={date}"
+
+    async def async_get_energy_usage(
+        self, energy_type: str, date: str, period: str = ENERGY_PERIOD_MONTH
+    ) -> dict[str, Any]:
+        """Get energy usage comparison for the period containing the date."""
+        path = self._energy_path(PATH_EMS_USAGE, energy_type, date, period)
         response = await self._async_request("GET", path)
         return self._extract_first_list_item(response, "usageList")
 
-    async def async_get_energy_fee(self, energy_type: str, date: str) -> dict[str, Any]:
-        """Get energy fee for current month."""
-        path = f"{PATH_EMS_FEE}?energyType={energy_type}&period=MONTH&date={date}"
+    async def async_get_energy_fee(
+        self, energy_type: str, date: str, period: str = ENERGY_PERIOD_MONTH
+    ) -> dict[str, Any]:
+        """Get energy fee for the period containing the date."""
+        path = self._energy_path(PATH_EMS_FEE, energy_type, date, period)
         response = await self._async_request("GET", path)
         return self._extract_first_list_item(response, "feeList")
 
-    async def async_get_energy_goal(self, energy_type: str, date: str) -> dict[str, Any]:
-        """Get energy usage goal for current month."""
-        path = f"{PATH_EMS_USAGE_GOAL}?energyType={energy_type}&period=MONTH&date={date}"
+    async def async_get_energy_goal(
+        self, energy_type: str, date: str, period: str = ENERGY_PERIOD_MONTH
+    ) -> dict[str, Any]:
+        """Get energy usage goal for the period containing the date."""
+        path = self._energy_path(PATH_EMS_USAGE_GOAL, energy_type, date, period)
         response = await self._async_request("GET", path)
         return self._extract_first_list_item(response, "goalList")
 
-    async def async_get_all_energy_data(self, date: str) -> dict[str, dict[str, Any]]:
-        """Fetch usage, fee, and goal for all energy types in parallel."""
-        request_specs = [
-            (energy_type, "usage", self.async_get_energy_usage(energy_type, date))
-            for energy_type in ENERGY_TYPES
-        ]
-        request_specs.extend(
-            (energy_type, "fee", self.async_get_energy_fee(energy_type, date))
-            for energy_type in ENERGY_TYPES
-        )
-        request_specs.extend(
-            (energy_type, "goal", self.async_get_energy_goal(energy_type, date))
-            for energy_type in ENERGY_TYPES
+    async def async_stream_energy_usage_history(
+        self,
+        energy_type: str,
+        date: str,
+        on_item: Callable[[dict[str, Any]], None],
+        period: str = ENERGY_PERIOD_MONTH,
+    ) -> int:
+        """Pass each usage history item to ``on_item`` as the response streams in.
+
+        The body is read in chunks and never held in full, so long histories
+        use bounded memory. Returns the number of items delivered.
+        """
+        path = self._energy_path(PATH_EMS_USAGE_HISTORY, energy_type, date, period)
+
+        async def _consume(resp: aiohttp.ClientResponse) -> int:
+            parser = JsonListItemParser("usageList")
+            count = 0
+            async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    if isinstance(item, dict):
+                        on_item(item)
+                        count += 1
+                if parser.done:
+                    break
+            for item in parser.close():
+                if isinstance(item, dict):
+                    on_item(item)
+                    count += 1
+            return count
+
+        return await self._async_request("GET", path, response_handler=_consume)
+
+    async def async_get_energy_usage_history(
+        self, energy_type: str, date: str, period: str = ENERGY_PERIOD_MONTH
+    ) -> list[dict[str, Any]]:
+        """Get energy usage history per period up to the given date."""
+        items: list[dict[str, Any]] = []
+        await self.async_stream_energy_usage_history(
+            energy_type, date, items.append, period
         )
+        return items
+
+    async def async_run_batch(
+        self,
+        jobs: Mapping[_KeyT, Callable[[], Awaitable[_ResultT]]],
+        *,
+        concurrency: int = BATCH_CONCURRENCY,
+        item_timeout: float | None = BATCH_ITEM_TIMEOUT_SECONDS,
+    ) -> HiotBatchResult[_KeyT, _ResultT]:
+        """Run independent requests with bounded concurrency.
+
+        At most ``concurrency`` jobs run at once and each gets its own
+        ``item_timeout``. A failed, timed-out, or cancelled job (see
+        ``async_close``) is reported in ``errors`` while the others complete.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(job: Callable[[], Awaitable[_ResultT]]) -> _ResultT:
+            async with semaphore:
+                async with asyncio.timeout(item_timeout):
+                    return await job()
+
+        tasks = {key: asyncio.create_task(_run(job)) for key, job in jobs.items()}
+        self._batch_tasks.update(tasks.values())
+        try:
+            outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        finally:
+            self._batch_tasks.difference_update(tasks.values())
+
+        batch: HiotBatchResult[_KeyT, _ResultT] = HiotBatchResult()
+        for key, outcome in zip(tasks, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                error = HiotBatchItemError.from_exception(key, outcome)
+                batch.errors[key] = error
+                self.metrics.record_batch_error(error.as_dict())
+            else:
+                batch.results[key] = outcome
+        return batch
 
-        responses = await asyncio.gather(
-            *(request for _, _, request in request_specs),
-            return_exceptions=True,
+    async def async_get_all_energy_data(
+        self,
+        date: str,
+        items: Iterable[tuple[str, str]] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch usage, fee, goal, and daily usage for all energy types.
+
+        ``items`` limits the fetch to the given (energy_type, item_type) pairs.
+        Each item type is queried for its period in ``ENERGY_ITEM_PERIODS``.
+        Items that were not requested or failed are returned as empty dicts.
+        """
+        fetchers = {
+            "usage": self.async_get_energy_usage,
+            "fee": self.async_get_energy_fee,
+            "goal": self.async_get_energy_goal,
+            "daily_usage": self.async_get_energy_usage,
+        }
+        if items is None:
+            items = [
+                (energy_type, item_type)
+                for item_type in ENERGY_ITEM_TYPES
+                for energy_type in ENERGY_TYPES
+            ]
+
+        batch = await self.async_run_batch(
+            {
+                (energy_type, item_type): partial(
+                    fetchers[item_type], energy_type, date, ENERGY_ITEM_PERIODS[item_type]
+                )
+                for energy_type, item_type in items
+            }
         )
 
         result: dict[str, dict[str, Any]] = {
-            energy_type: {"usage": {}, "fee": {}, "goal": {}}
+            energy_type: {item_type: {} for item_type in ENERGY_ITEM_TYPES}
             for energy_type in ENERGY_TYPES
         }
-
-        for (energy_type, item_type, _), response in zip(request_specs, responses, strict=True):
-            if isinstance(response, Exception):
-                _LOGGER.error(
-                    "Failed to fetch %s data for %s: %s",
-                    item_type,
-                    energy_type,
-                    response,
-                )
-                continue
-            result[energy_type][item_type] = response
+        for (energy_type, item_type), value in batch.results.items():
+            result[energy_type][item_type] = value
+        for (energy_type, item_type), error in batch.errors.items():
+            _LOGGER.error(
+                "Failed to fetch %s data for %s: %s",
+                item_type,
+                energy_type,
+                error.message,
+            )
 
         return result
 
@@ -301,6 +529,23 @@ class HiotApiClient:
         )
         return data if isinstance(data, dict) else {}
 
+    async def async_control_devices(
+        self,
+        controls: Mapping[tuple[str, str], list[dict[str, str]]],
+        *,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> HiotBatchResult[tuple[str, str], dict[str, Any]]:
+        """Control several devices, keyed by (category, device id), in one batch."""
+        return await self.async_run_batch(
+            {
+                (category, device_id): partial(
+                    self.async_control_device, category, device_id, commands
+                )
+                for (category, device_id), commands in controls.items()
+            },
+            concurrency=concurrency,
+        )
+
     def get_category_for_device_type(self, device_type: str) -> str | None:
         """Get API category path for a device type."""
         return DEVICE_CATEGORY_MAP.get(device_type)
@@ -333,22 +578,48 @@ class HiotApiClient:
         method: str,
         path: str,
         require_auth: bool = True,
+        response_handler: Callable[[aiohttp.ClientResponse], Awaitable[Any]] | None = None,
         **kwargs: Any,
     ) -> Any:
-        """Make an API request with error handling."""
+        """Make an API request with error handling.
+
+        ``response_handler`` consumes the body itself (e.g. streaming) instead
+        of the default buffered JSON parse.
+        """
         url = f"{self._base_url}/{path}"
+        endpoint = classify_endpoint(method, path)
+        # Latency covers the HTTP round-trips only, not re-auth logins or backoff
+        round_trips = 0.0
+        attempt_started: float | None = None
         auth_retry_attempt = 0
 
+        def _latency() -> float:
+            if attempt_started is None:
+                return round_trips
+            return round_trips + time.monotonic() - attempt_started
+
         try:
             while True:
+                attempt_started = time.monotonic()
                 async with self._session.request(method, url, **kwargs) as resp:
                     if resp.status != 401:
                         resp.raise_for_status()
-                        return await self._parse_response(resp)
+                        if response_handler is None:
+                            result = await self._parse_response(resp)
+                            # Body is already buffered by _parse_response, read() is free
+                            payload_bytes = len(await resp.read())
+                        else:
+                            result = await response_handler(resp)
+                            payload_bytes = resp.content.total_bytes
+                        self.metrics.record_success(endpoint, _latency(), payload_bytes)
+                        return result
 
                     if not require_auth:
                         raise HiotAuthError("Authentication failed")
 
+                round_trips = _latency()
+                attempt_started = None
+
                 self._authenticated = False
                 auth_retry_attempt += 1
                 if auth_retry_attempt > MAX_AUTH_RETRY_ATTEMPTS:
@@ -356,6 +627,7 @@ class HiotApiClient:
                         f"Authentication failed after {MAX_AUTH_RETRY_ATTEMPTS} retries"
                     )
 
+                self.metrics.record_reauth(endpoint)
                 await self.async_ensure_authenticated()
 
                 retry_delay = min(
@@ -371,13 +643,18 @@ class HiotApiClient:
                 )
                 await asyncio.sleep(retry_delay)
         except aiohttp.ClientError as err:
+            self.metrics.record_error(endpoint, err, _latency())
             raise HiotConnectionError(f"Connection error: {err}") from err
-        except HiotApiError:
+        except HiotApiError as err:
+            self.metrics.record_error(endpoint, err, _latency())
             raise
         except Exception as err:
+            self.metrics.record_error(endpoint, err, _latency())
             raise HiotApiError(f"Unexpected error: {err}") from err
 
     async def async_close(self) -> None:
-        """Close the session."""
+        """Close the session and cancel in-flight batch jobs."""
+        for task in self._batch_tasks:
+            task.cancel()
         # Session is managed externally by HA, don't close it here
         self._authenticated = False
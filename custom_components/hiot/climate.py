@@ -2,6 +2,7 @@
 """Climate platform for HT HomeService."""
 from __future__ import annotations
 
+from statistics import fmean
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -14,18 +15,18 @@ from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CATEGORY_AIRCON, CATEGORY_HEATER, DOMAIN
+from .const import (
+    AIRCON_MAX_TEMP,
+    AIRCON_MIN_TEMP,
+    AIRCON_MODE_MAP,
+    AIRCON_WIND_MAP,
+    CATEGORY_HEATER,
+    DOMAIN,
+    HEATER_MAX_TEMP,
+    HEATER_MIN_TEMP,
+)
 from .coordinator import HiotDataUpdateCoordinator
-from .entity import HiotEntity
-
-# API mode → HA HVACMode mapping
-AIRCON_MODE_MAP: dict[str, HVACMode] = {
-    "cool": HVACMode.COOL,
-    "heat": HVACMode.HEAT,
-    "dry": HVACMode.DRY,
-    "fan": HVACMode.FAN_ONLY,
-    "airwash": HVACMode.FAN_ONLY,  # airwash mapped to fan_only (closest match)
-}
+from .entity import HiotEntity, HiotGroupEntity
 
 # HA HVACMode → API mode mapping (explicit to avoid airwash overwriting fan)
 AIRCON_HA_TO_API: dict[HVACMode, str] = {
@@ -35,16 +36,6 @@ AIRCON_HA_TO_API: dict[HVACMode, str] = {
     HVACMode.FAN_ONLY: "fan",
 }
 
-# API wind → HA fan mode mapping
-AIRCON_WIND_MAP: dict[str, str] = {
-    "light": "low",
-    "low": "low",
-    "mid": "medium",
-    "high": "high",
-    "pow": "turbo",
-    "auto": "auto",
-}
-
 # HA fan mode → API wind mapping
 AIRCON_FAN_TO_API: dict[str, str] = {v: k for k, v in AIRCON_WIND_MAP.items()}
 
@@ -78,9 +69,28 @@ async def async_setup_entry(
         elif device_type == "aircon":
             entities.append(HiotAircon(coordinator, device_id, device_name, device_type))
 
+    heater_ids = [
+        device["deviceId"] for device in coordinator.devices if device.get("deviceType") == "heating"
+    ]
+    if len(heater_ids) > 1:
+        entities.append(
+            HiotHeatingGroup(coordinator, entry.entry_id, "heating_group", heater_ids)
+        )
+
     async_add_entities(entities)
 
 
+def _mean_status(statuses: list[dict[str, Any]], command: str) -> float | None:
+    """Average a numeric status over the devices that report it."""
+    values: list[float] = []
+    for status in statuses:
+        try:
+            values.append(float(status[command]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return round(fmean(values), 1) if values else None
+
+
 class HiotHeater(HiotEntity, ClimateEntity):
     """Representation of a HT HomeService heater (boiler)."""
 
@@ -91,8 +101,8 @@ class HiotHeater(HiotEntity, ClimateEntity):
         | ClimateEntityFeature.TURN_OFF
     )
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_min_temp = 5
-    _attr_max_temp = 40
+    _attr_min_temp = HEATER_MIN_TEMP
+    _attr_max_temp = HEATER_MAX_TEMP
     _attr_target_temperature_step = 1
 
     @property
@@ -124,23 +134,15 @@ class HiotHeater(HiotEntity, ClimateEntity):
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         power_value = "on" if hvac_mode == HVACMode.HEAT else "off"
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_HEATER,
-            self._device_id,
-            [{"command": "power", "value": power_value}],
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands([{"command": "power", "value": power_value}])
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_HEATER,
-            self._device_id,
-            [{"command": "setTemperature", "value": str(int(temperature))}],
+        await self._async_send_commands(
+            [{"command": "setTemperature", "value": str(int(temperature))}]
         )
-        await self.coordinator.async_request_refresh()
 
 
 class HiotAircon(HiotEntity, ClimateEntity):
@@ -160,8 +162,8 @@ class HiotAircon(HiotEntity, ClimateEntity):
     )
     _attr_fan_modes = ["low", "medium", "high", "turbo", "auto"]
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_min_temp = 16
-    _attr_max_temp = 30
+    _attr_min_temp = AIRCON_MIN_TEMP
+    _attr_max_temp = AIRCON_MAX_TEMP
     _attr_target_temperature_step = 1
 
     @property
@@ -208,30 +210,56 @@ class HiotAircon(HiotEntity, ClimateEntity):
                 {"command": "power", "value": "on"},
                 {"command": "mode", "value": api_mode},
             ]
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_AIRCON,
-            self._device_id,
-            commands,
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands(commands)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set fan speed."""
         api_wind = AIRCON_FAN_TO_API.get(fan_mode, fan_mode)
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_AIRCON,
-            self._device_id,
-            [{"command": "wind", "value": api_wind}],
+        await self._async_send_commands([{"command": "wind", "value": api_wind}])
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        temperature = kwargs.get(ATTR_TEMPERATURE)
+        if temperature is None:
+            return
+        await self._async_send_commands(
+            [{"command": "setTemperature", "value": str(int(temperature))}]
         )
-        await self.coordinator.async_request_refresh()
+
+
+class HiotHeatingGroup(HiotGroupEntity, ClimateEntity):
+    """All heating zones of the household, controlled as one."""
+
+    _category = CATEGORY_HEATER
+    _attr_name = "전체 난방"
+    _attr_icon = "mdi:home-thermometer"
+    _attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_min_temp = HEATER_MIN_TEMP
+    _attr_max_temp = HEATER_MAX_TEMP
+    _attr_target_temperature_step = 1
+
+    def _update_aggregates(self) -> None:
+        statuses = self._member_statuses()
+        active = [status for status in statuses if status.get("power") == "on"]
+        self._attr_hvac_mode = HVACMode.HEAT if active else HVACMode.OFF
+        self._attr_current_temperature = _mean_status(statuses, "currTemperature")
+        # The setpoint of zones that are off does not affect the house
+        self._attr_target_temperature = _mean_status(active or statuses, "setTemperature")
+        self._attr_extra_state_attributes = {"active_zones": len(active)}
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        power_value = "on" if hvac_mode == HVACMode.HEAT else "off"
+        await self._async_send_to_members([{"command": "power", "value": power_value}])
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_AIRCON,
-            self._device_id,
-            [{"command": "setTemperature", "value": str(int(temperature))}],
+        await self._async_send_to_members(
+            [{"command": "setTemperature", "value": str(int(temperature))}]
         )
-        await self.coordinator.async_request_refresh()
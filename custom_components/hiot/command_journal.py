@@ -0,0 +1,129 @@
+"""Commands issued while the HT server was unreachable, kept for replay."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import COMMAND_JOURNAL_EXPIRY, DOMAIN
+
+JOURNAL_STORAGE_VERSION = 1
+# Coalesce bursts of queued commands into one storage write
+JOURNAL_SAVE_DELAY = 1
+# Replay outcomes kept for diagnostics
+JOURNAL_RESULTS_KEPT = 20
+
+# (category, device id, command)
+JournalKey = tuple[str, str, str]
+
+
+def _journal_storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.command_journal"
+
+
+async def async_remove_journal_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the command journal of a removed entry."""
+    await Store[dict[str, Any]](
+        hass, JOURNAL_STORAGE_VERSION, _journal_storage_key(entry_id)
+    ).async_remove()
+
+
+@dataclass(frozen=True)
+class JournaledCommand:
+    """One command value for one device, issued at a UTC timestamp."""
+
+    category: str
+    device_id: str
+    command: str
+    value: str
+    issued: float
+
+    @property
+    def key(self) -> JournalKey:
+        """Return the device and command this entry sets."""
+        return (self.category, self.device_id, self.command)
+
+    @property
+    def expires(self) -> float:
+        """Return the UTC timestamp after which the command is dropped."""
+        return self.issued + COMMAND_JOURNAL_EXPIRY.total_seconds()
+
+
+class HiotCommandJournal:
+    """Queue of commands that could not reach the server.
+
+    Entries are keyed by device and command, so only the last value issued
+    for each one survives an outage; issuing it again moves it to the back.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store[dict[str, Any]](
+            hass, JOURNAL_STORAGE_VERSION, _journal_storage_key(entry_id)
+        )
+        self._entries: dict[JournalKey, JournaledCommand] = {}
+        self.replays = 0
+        self.last_replay: list[dict[str, Any]] = []
+
+    @property
+    def pending(self) -> int:
+        """Return the number of commands waiting for replay."""
+        return len(self._entries)
+
+    async def async_load(self) -> None:
+        """Restore commands queued before a restart."""
+        stored = await self._store.async_load() or {}
+        self._entries = {
+            item.key: item
+            for item in (JournaledCommand(**raw) for raw in stored.get("commands", []))
+        }
+
+    @callback
+    def async_queue(self, category: str, device_id: str, commands: list[dict[str, str]]) -> None:
+        """Queue commands for one device, replacing earlier values of the same commands."""
+        issued = dt_util.utcnow().timestamp()
+        for command in commands:
+            item = JournaledCommand(category, device_id, command["command"], command["value"], issued)
+            self._entries.pop(item.key, None)
+            self._entries[item.key] = item
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    @callback
+    def async_discard(self, category: str, device_id: str, commands: list[dict[str, str]]) -> None:
+        """Drop queued values of commands that have since been applied."""
+        removed = [
+            self._entries.pop((category, device_id, command["command"]), None)
+            for command in commands
+        ]
+        if any(removed):
+            self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    @callback
+    def async_restore(self, items: Iterable[JournaledCommand]) -> None:
+        """Put back commands whose replay failed, unless re-issued meanwhile."""
+        restored = {item.key: item for item in items if item.key not in self._entries}
+        # Restored commands were issued first, so they replay first
+        self._entries = {**restored, **self._entries}
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    @callback
+    def async_take(self) -> tuple[list[JournaledCommand], list[JournaledCommand]]:
+        """Empty the journal; return the live and the expired commands in queue order."""
+        now = dt_util.utcnow().timestamp()
+        live = [item for item in self._entries.values() if item.expires > now]
+        expired = [item for item in self._entries.values() if item.expires <= now]
+        self._entries = {}
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+        return live, expired
+
+    @callback
+    def async_record_replay(self, results: list[dict[str, Any]]) -> None:
+        """Keep the outcome of a replay for diagnostics."""
+        self.replays += 1
+        self.last_replay = results[-JOURNAL_RESULTS_KEPT:]
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"commands": [asdict(item) for item in self._entries.values()]}
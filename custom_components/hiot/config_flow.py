@@ -10,23 +10,30 @@ from aiohttp import CookieJar
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import HiotApiClient, HiotAuthError, HiotConnectionError
 from .const import (
+    CONF_COMMAND_JOURNAL,
     CONF_DONG,
     CONF_ENERGY_SCAN_INTERVAL,
+    CONF_FAST_POLL_DEVICES,
     CONF_HO,
     CONF_HOMEPAGE_DOMAIN,
     CONF_DEVICE_SCAN_INTERVAL,
+    CONF_LIGHT_GROUP_LOCATIONS,
+    CONF_REDUCE_RECORDER_WRITES,
     CONF_SITE_ID,
     CONF_SITE_NAME,
+    CONF_SKIP_REDUNDANT_COMMANDS,
     DEFAULT_ENERGY_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     DEVICE_SCAN_INTERVAL_OPTIONS,
     ENERGY_SCAN_INTERVAL_OPTIONS,
 )
+from .entity import light_group_locations, lights_by_location
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -217,6 +224,14 @@ class HiotOptionsFlow(OptionsFlow):
             CONF_ENERGY_SCAN_INTERVAL, int(DEFAULT_ENERGY_SCAN_INTERVAL.total_seconds())
         )
 
+        skip_redundant_commands = self.config_entry.options.get(
+            CONF_SKIP_REDUNDANT_COMMANDS, True
+        )
+        reduce_recorder_writes = self.config_entry.options.get(
+            CONF_REDUCE_RECORDER_WRITES, False
+        )
+        command_journal = self.config_entry.options.get(CONF_COMMAND_JOURNAL, False)
+
         device_interval_options = {
             str(s): _format_interval_label(s) for s in DEVICE_SCAN_INTERVAL_OPTIONS
         }
@@ -224,18 +239,55 @@ class HiotOptionsFlow(OptionsFlow):
             str(s): _format_interval_label(s) for s in ENERGY_SCAN_INTERVAL_OPTIONS
         }
 
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_DEVICE_SCAN_INTERVAL,
-                        default=str(current_device_interval),
-                    ): vol.In(device_interval_options),
-                    vol.Required(
-                        CONF_ENERGY_SCAN_INTERVAL,
-                        default=str(current_energy_interval),
-                    ): vol.In(energy_interval_options),
-                }
-            ),
-        )
+        schema: dict[Any, Any] = {
+            vol.Required(
+                CONF_DEVICE_SCAN_INTERVAL,
+                default=str(current_device_interval),
+            ): vol.In(device_interval_options),
+            vol.Required(
+                CONF_ENERGY_SCAN_INTERVAL,
+                default=str(current_energy_interval),
+            ): vol.In(energy_interval_options),
+            vol.Required(
+                CONF_SKIP_REDUNDANT_COMMANDS,
+                default=skip_redundant_commands,
+            ): bool,
+            vol.Required(
+                CONF_REDUCE_RECORDER_WRITES,
+                default=reduce_recorder_writes,
+            ): bool,
+            vol.Required(
+                CONF_COMMAND_JOURNAL,
+                default=command_journal,
+            ): bool,
+        }
+
+        # Light groups and fast polling can only be offered once the device list is known
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if entry_data is not None:
+            locations = list(lights_by_location(entry_data["coordinator"].devices))
+            if locations:
+                schema[
+                    vol.Optional(
+                        CONF_LIGHT_GROUP_LOCATIONS,
+                        default=light_group_locations(
+                            self.config_entry, entry_data["coordinator"].devices
+                        ),
+                    )
+                ] = cv.multi_select(locations)
+            gas_valves = {
+                device["deviceId"]: device.get("deviceName", device["deviceId"])
+                for device in entry_data["coordinator"].devices
+                if device.get("deviceType") == "gas"
+            }
+            if gas_valves:
+                schema[
+                    vol.Optional(
+                        CONF_FAST_POLL_DEVICES,
+                        default=self.config_entry.options.get(
+                            CONF_FAST_POLL_DEVICES, list(gas_valves)
+                        ),
+                    )
+                ] = cv.multi_select(gas_valves)
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
@@ -2,6 +2,8 @@
 
 from datetime import timedelta
 
+from homeassistant.components.climate.const import HVACMode
+
 DOMAIN = "hiot"
 API_BASE_URL = "https://www2.hthomeservice.com"
 AES_PASSPHRASE = "hTsEcret"
@@ -26,6 +28,38 @@ CATEGORY_GAS = "gases"
 CATEGORY_AIRCON = "aircons"
 CATEGORY_WALLSOCKET = "wall-sockets"
 
+# Commands for these categories are sent even when the last poll already shows
+# the requested state, so a gas valve shut-off is never left out
+ALWAYS_SENT_CATEGORIES = frozenset({CATEGORY_GAS})
+
+# Temperature limits of the climate entities, also enforced for scheduled commands
+HEATER_MIN_TEMP = 5
+HEATER_MAX_TEMP = 40
+AIRCON_MIN_TEMP = 16
+AIRCON_MAX_TEMP = 30
+
+# API mode → HA HVACMode mapping
+AIRCON_MODE_MAP: dict[str, HVACMode] = {
+    "cool": HVACMode.COOL,
+    "heat": HVACMode.HEAT,
+    "dry": HVACMode.DRY,
+    "fan": HVACMode.FAN_ONLY,
+    "airwash": HVACMode.FAN_ONLY,  # airwash mapped to fan_only (closest match)
+}
+
+# API wind → HA fan mode mapping
+AIRCON_WIND_MAP: dict[str, str] = {
+    "light": "low",
+    "low": "low",
+    "mid": "medium",
+    "high": "high",
+    "pow": "turbo",
+    "auto": "auto",
+}
+
+# Fan wind values from slowest to fastest
+ORDERED_NAMED_FAN_SPEEDS = ["light", "mid", "pow"]
+
 DEVICE_CATEGORY_MAP = {
     "light": CATEGORY_LIGHT,
     "heating": CATEGORY_HEATER,
@@ -50,15 +84,87 @@ PLATFORMS = [
     "sensor",
 ]
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=20)
+# Per-device polling of safety-critical devices (gas valves) between bulk polls
+FAST_POLL_INTERVAL = timedelta(seconds=5)
 DEFAULT_ENERGY_SCAN_INTERVAL = timedelta(minutes=30)
+POLL_HISTORY_SIZE = 20
+
+# Fired after a device poll with the status diffs against the previous poll
+EVENT_DEVICES_CHANGED = f"{DOMAIN}_devices_changed"
+# Fired with the outcome of each command queued during an outage once it is replayed
+EVENT_COMMANDS_REPLAYED = f"{DOMAIN}_commands_replayed"
 ENERGY_TYPES = ["ELEC", "WATER", "GAS"]
+ENERGY_ITEM_TYPES = ("usage", "fee", "goal", "daily_usage")
+
+# EMS aggregation periods
+ENERGY_PERIOD_DAY = "DAY"
+ENERGY_PERIOD_MONTH = "MONTH"
+ENERGY_PERIOD_YEAR = "YEAR"
+ENERGY_PERIODS = (ENERGY_PERIOD_DAY, ENERGY_PERIOD_MONTH, ENERGY_PERIOD_YEAR)
+
+# Period each EMS item is queried for
+ENERGY_ITEM_PERIODS = {
+    "usage": ENERGY_PERIOD_MONTH,
+    "fee": ENERGY_PERIOD_MONTH,
+    "goal": ENERGY_PERIOD_MONTH,
+    "daily_usage": ENERGY_PERIOD_DAY,
+}
+
+# How long each fetched EMS item stays fresh before the next cycle refetches it;
+# usage items are also refetched on every poll when the interval is shorter
+ENERGY_CACHE_TTLS = {
+    "usage": timedelta(minutes=15),
+    "fee": timedelta(hours=6),
+    "goal": timedelta(hours=24),
+    "daily_usage": timedelta(minutes=15),
+}
+
+# Some complex servers answer period=DAY with 500/604; back off before retrying
+DAILY_USAGE_RETRY_INTERVAL = timedelta(hours=6)
+
+ENERGY_LABELS = {
+    "ELEC": "전기",
+    "WATER": "수도",
+    "GAS": "가스",
+}
+
+ENERGY_UNITS = {
+    "ELEC": "kWh",
+    "WATER": "m³",
+    "GAS": "m³",
+}
+
+# API reports Wh / L; divide to get kWh / m³
+ENERGY_CONVERSION_DIVISORS = {
+    "ELEC": 1000.0,
+    "WATER": 1000.0,
+    "GAS": 1000.0,
+}
+
+# EMS periods are reported in Korean local time
+SERVICE_TIMEZONE = "Asia/Seoul"
+
+# Keep reporting the closing day/month this long after midnight so late meter
+# readings land in its final total before sensors switch to the new period
+PERIOD_CLOSE_DELAY = timedelta(hours=1)
+# Number of finalised months kept in storage
+CLOSED_MONTHS_KEPT = 13
 
 CONF_DEVICE_SCAN_INTERVAL = "device_scan_interval"
 CONF_ENERGY_SCAN_INTERVAL = "energy_scan_interval"
+CONF_SKIP_REDUNDANT_COMMANDS = "skip_redundant_commands"
+CONF_REDUCE_RECORDER_WRITES = "reduce_recorder_writes"
+CONF_LIGHT_GROUP_LOCATIONS = "light_group_locations"
+CONF_COMMAND_JOURNAL = "command_journal"
+CONF_FAST_POLL_DEVICES = "fast_poll_devices"
 
 # Options for scan interval selector (seconds)
 DEVICE_SCAN_INTERVAL_OPTIONS = [5, 10, 15, 20, 30, 40, 50, 60, 180, 300, 600]
 ENERGY_SCAN_INTERVAL_OPTIONS = [300, 600, 900, 1800, 3600, 7200, 21600, 43200, 86400]
 
+# Commands matching a device state polled within this window are not resent
+COMMAND_STATE_MAX_AGE = timedelta(seconds=60)
+# Commands queued while the server is unreachable are dropped after this long
+COMMAND_JOURNAL_EXPIRY = timedelta(minutes=10)
 
 MANUFACTURER = "Hyundai HT"
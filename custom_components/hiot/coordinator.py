@@ -2,19 +2,125 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import partial
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import HiotApiClient, HiotApiError, HiotAuthError
-from .const import DEFAULT_ENERGY_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .api import (
+    HiotApiClient,
+    HiotApiError,
+    HiotAuthError,
+    HiotBatchResult,
+    SERVER_UNREACHABLE_ERRORS,
+)
+from .command_journal import HiotCommandJournal, JournaledCommand
+from .const import (
+    ALWAYS_SENT_CATEGORIES,
+    CATEGORY_GAS,
+    CLOSED_MONTHS_KEPT,
+    COMMAND_STATE_MAX_AGE,
+    CONF_COMMAND_JOURNAL,
+    CONF_FAST_POLL_DEVICES,
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    DAILY_USAGE_RETRY_INTERVAL,
+    DEFAULT_ENERGY_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    ENERGY_CACHE_TTLS,
+    ENERGY_ITEM_PERIODS,
+    ENERGY_ITEM_TYPES,
+    ENERGY_PERIOD_DAY,
+    ENERGY_PERIOD_MONTH,
+    ENERGY_TYPES,
+    EVENT_COMMANDS_REPLAYED,
+    EVENT_DEVICES_CHANGED,
+    FAST_POLL_INTERVAL,
+    PERIOD_CLOSE_DELAY,
+    POLL_HISTORY_SIZE,
+    SERVICE_TIMEZONE,
+)
+from .device_diff import (
+    DeviceChange,
+    StatusMaps,
+    device_status_maps,
+    diff_status_maps,
+    status_value_matches,
+)
+from .energy_projection import EnergyProjection
+from .energy_schedule import ALIGNED_REFRESH_TOLERANCE, PublishScheduleEstimator
+from .energy_view import EnergyView
+from .household import HouseholdAggregates
 
 _LOGGER = logging.getLogger(__name__)
 
+CLOSED_MONTHS_STORAGE_VERSION = 1
+# Items whose month total is final once the month is over
+CLOSING_ITEM_TYPES = ("usage", "fee")
+# Items that change during the day and follow the configured polling interval
+USAGE_ITEM_TYPES = ("usage", "daily_usage")
+
+
+def _closed_months_storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.energy_closed_months"
+
+
+def _month_query_date(month: str) -> str:
+    """Return the last day of a ``YYYY-MM`` month as an EMS query date."""
+    year, month_number = (int(part) for part in month.split("-"))
+    next_month = date(year + month_number // 12, month_number % 12 + 1, 1)
+    return (next_month - timedelta(days=1)).isoformat()
+
+
+async def async_remove_closed_months_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted closed-month totals for a deleted entry."""
+    await Store(
+        hass, CLOSED_MONTHS_STORAGE_VERSION, _closed_months_storage_key(entry_id)
+    ).async_remove()
+
+
+def _record_poll(history: deque[dict[str, Any]], started: float, success: bool) -> None:
+    """Append one poll duration to a coordinator's history."""
+    history.append(
+        {
+            "duration": round(time.monotonic() - started, 4),
+            "success": success,
+        }
+    )
+
+
+def _replay_result(
+    item: JournaledCommand, result: str, error: str | None = None
+) -> dict[str, Any]:
+    """Describe the replay outcome of one queued command."""
+    return {
+        "category": item.category,
+        "device_id": item.device_id,
+        "command": item.command,
+        "value": item.value,
+        "issued": dt_util.utc_from_timestamp(item.issued).isoformat(),
+        "result": result,
+        "error": error,
+    }
+
+
+@dataclass
+class _CachedEnergyItem:
+    """One EMS item with the period it belongs to and when it was fetched."""
+
+    value: dict[str, Any]
+    period: str
+    fetched_at: datetime
+
 
 class HiotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage fetching data from HT HomeService API."""
@@ -37,6 +143,24 @@ class HiotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.api_client = api_client
         self._devices: list[dict[str, Any]] = []
+        self.poll_history: deque[dict[str, Any]] = deque(maxlen=POLL_HISTORY_SIZE)
+        # Monotonic time of the last successful poll; None until the first one
+        self.data_updated_at: float | None = None
+        self.skipped_commands = 0
+        # Monotonic time devices were last commanded, until a poll started after it lands
+        self._unconfirmed: dict[tuple[str, str], float] = {}
+        # Entity state writes skipped because nothing changed
+        self.suppressed_writes = 0
+        # Status of every device in the last successful poll, and what it changed
+        self.status_maps: StatusMaps = {}
+        self.last_changes: list[DeviceChange] = []
+        self.household = HouseholdAggregates()
+        self.command_journal = HiotCommandJournal(hass, config_entry.entry_id)
+        # Fast lane readings by device, with the monotonic time they were requested
+        self._fast_poll_readings: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        self._fast_polling = False
+        self.fast_polls = 0
+        self.fast_poll_changes = 0
 
     @property
     def devices(self) -> list[dict[str, Any]]:
@@ -45,6 +169,7 @@ class HiotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_setup(self) -> None:
         """Set up the coordinator - fetch initial device list."""
+        await self.command_journal.async_load()
         try:
             self._devices = await self.api_client.async_get_devices()
             _LOGGER.debug("Found %d devices", len(self._devices))
@@ -55,12 +180,255 @@ class HiotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch latest state for all devices via single bulk API call."""
+        started = time.monotonic()
         try:
-            return await self.api_client.async_get_all_device_states()
+            data = await self.api_client.async_get_all_device_states()
         except HiotAuthError as err:
+            _record_poll(self.poll_history, started, success=False)
             raise ConfigEntryAuthFailed(err) from err
         except HiotApiError as err:
+            _record_poll(self.poll_history, started, success=False)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        _record_poll(self.poll_history, started, success=True)
+        self.data_updated_at = time.monotonic()
+        self._unconfirmed = {key: sent for key, sent in self._unconfirmed.items() if sent > started}
+        data = self._apply_fast_poll_readings(data, started)
+        self._track_changes(data)
+        if self.command_journal.pending:
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_replay_journal(), f"{DOMAIN} command journal replay"
+            )
+        return data
+
+    def commands_applied(
+        self, category: str, device_id: str, commands: list[dict[str, str]]
+    ) -> bool:
+        """Return True if a recent poll shows every command already applied."""
+        if category in ALWAYS_SENT_CATEGORIES or (category, device_id) in self._unconfirmed:
+            return False
+        if not self.config_entry.options.get(CONF_SKIP_REDUNDANT_COMMANDS, True):
+            return False
+        if not self.last_update_success or self.data_updated_at is None:
+            return False
+        if time.monotonic() - self.data_updated_at > COMMAND_STATE_MAX_AGE.total_seconds():
+            return False
+        statuses = self.status_maps.get((category, device_id), {})
+        return all(
+            status_value_matches(statuses.get(command["command"]), command["value"])
+            for command in commands
+        )
+
+    def mark_commands_sent(self, category: str, device_id: str) -> None:
+        """Stop trusting the polled status of a device until a newer poll lands.
+
+        Refreshes after a command are debounced, so without this a second
+        command would be checked against the status from before the first.
+        """
+        self._unconfirmed[(category, device_id)] = time.monotonic()
+
+    async def async_send_commands(
+        self, controls: dict[tuple[str, str], list[dict[str, str]]]
+    ) -> HiotBatchResult[tuple[str, str], dict[str, Any]]:
+        """Send commands to several devices in one batch, then refresh once.
+
+        Devices already in the requested state are left out of the batch.
+        Commands that could not reach the server are journaled when enabled
+        and listed in ``queued`` instead of ``errors``.
+        """
+        pending: dict[tuple[str, str], list[dict[str, str]]] = {}
+        for key, commands in controls.items():
+            if self.commands_applied(*key, commands):
+                self.skipped_commands += 1
+                self.command_journal.async_discard(*key, commands)
+            else:
+                pending[key] = commands
+        if not pending:
+            return HiotBatchResult()
+        result = await self.api_client.async_control_devices(pending)
+        for key in result.results:
+            self.mark_commands_sent(*key)
+            self.command_journal.async_discard(*key, pending[key])
+        for key, error in list(result.errors.items()):
+            if isinstance(error.exception, SERVER_UNREACHABLE_ERRORS) and self.journal_commands(
+                *key, pending[key]
+            ):
+                del result.errors[key]
+                result.queued.append(key)
+        await self.async_request_refresh()
+        return result
+
+    def journal_commands(
+        self, category: str, device_id: str, commands: list[dict[str, str]]
+    ) -> bool:
+        """Queue commands that could not reach the server, if the journal is enabled."""
+        if not self.config_entry.options.get(CONF_COMMAND_JOURNAL, False):
+            return False
+        self.command_journal.async_queue(category, device_id, commands)
+        _LOGGER.warning(
+            "Server unreachable; queued %s commands for %s until it is back",
+            category,
+            device_id,
+        )
+        return True
+
+    async def _async_replay_journal(self) -> None:
+        """Send the commands queued during an outage in one batch and report each outcome.
+
+        Expired commands are dropped; commands that still cannot reach the
+        server go back into the journal for the next successful poll.
+        """
+        live, expired = self.command_journal.async_take()
+        if not live and not expired:
+            return
+        results = [_replay_result(item, "expired") for item in expired]
+        controls: dict[tuple[str, str], list[JournaledCommand]] = {}
+        for item in live:
+            controls.setdefault((item.category, item.device_id), []).append(item)
+        if controls:
+            batch = await self.api_client.async_control_devices(
+                {
+                    key: [{"command": item.command, "value": item.value} for item in items]
+                    for key, items in controls.items()
+                }
+            )
+            for key, items in controls.items():
+                error = batch.errors.get(key)
+                if error is None:
+                    outcome = "sent"
+                    self.mark_commands_sent(*key)
+                elif isinstance(error.exception, SERVER_UNREACHABLE_ERRORS):
+                    outcome = "queued"
+                    self.command_journal.async_restore(items)
+                else:
+                    outcome = "failed"
+                results.extend(
+                    _replay_result(item, outcome, error.message if error else None)
+                    for item in items
+                )
+        for result in results:
+            if result["result"] in ("expired", "failed"):
+                _LOGGER.warning(
+                    "Queued command %s=%s for %s was %s",
+                    result["command"],
+                    result["value"],
+                    result["device_id"],
+                    result["result"],
+                )
+        self.command_journal.async_record_replay(results)
+        self.hass.bus.async_fire(
+            EVENT_COMMANDS_REPLAYED,
+            {"entry_id": self.config_entry.entry_id, "results": results},
+        )
+        if controls:
+            await self.async_request_refresh()
+
+    @property
+    def fast_poll_devices(self) -> list[tuple[str, str]]:
+        """Return the (category, device id) of the devices on the fast poll lane.
+
+        Every gas valve is on the lane unless the options select a subset.
+        """
+        gas_valves = [
+            device["deviceId"] for device in self._devices if device.get("deviceType") == "gas"
+        ]
+        selected = self.config_entry.options.get(CONF_FAST_POLL_DEVICES, gas_valves)
+        return [(CATEGORY_GAS, device_id) for device_id in gas_valves if device_id in selected]
+
+    async def async_fast_poll(self, now: datetime | None = None) -> None:
+        """Poll the fast lane devices one by one and publish what changed at once.
+
+        The lane runs on its own timer, outside the bulk poll's debouncer and
+        schedule, so a closed gas valve shows within seconds without speeding
+        up the whole-house poll. Its readings also take precedence over a bulk
+        poll requested before them (see ``_apply_fast_poll_readings``).
+        """
+        devices = self.fast_poll_devices
+        if (
+            self._fast_polling
+            or not devices
+            # Entities are unavailable after a failed bulk poll anyway
+            or not self.last_update_success
+            or (self.update_interval is not None and self.update_interval <= FAST_POLL_INTERVAL)
+        ):
+            return
+        self._fast_polling = True
+        requested = time.monotonic()
+        try:
+            batch = await self.api_client.async_run_batch(
+                {key: partial(self.api_client.async_get_device_state, *key) for key in devices}
+            )
+        finally:
+            self._fast_polling = False
+        self.fast_polls += 1
+        for key, error in batch.errors.items():
+            _LOGGER.debug("Fast poll of %s failed: %s", key, error.message)
+
+        data = dict(self.data or {})
+        changes: list[DeviceChange] = []
+        for (category, device_id), device in batch.results.items():
+            key = (category, device_id)
+            status_list = device.get("statusList") if isinstance(device, dict) else None
+            if not status_list:
+                # An empty reading would blank the device until the next bulk poll
+                _LOGGER.debug("Fast poll of %s returned no status", key)
+                continue
+            reading = {"statusList": status_list}
+            self._fast_poll_readings[key] = (requested, reading)
+            if self._unconfirmed.get(key, requested) < requested:
+                del self._unconfirmed[key]
+            previous = self.status_maps.get(key)
+            statuses = device_status_maps({category: {device_id: reading}})[key]
+            # Devices the bulk poll does not report are left to it
+            if previous is None or statuses == previous:
+                continue
+            changes.extend(diff_status_maps({key: previous}, {key: statuses}))
+            self.status_maps[key] = statuses
+            data[category] = {**data.get(category, {}), device_id: reading}
+        if not changes:
+            return
+        self.fast_poll_changes += len(changes)
+        self._announce_changes(changes)
+        # Not async_set_updated_data, which would push back the bulk poll
+        self.data = data
+        self.async_update_listeners()
+
+    def _apply_fast_poll_readings(
+        self, data: dict[str, Any], requested: float
+    ) -> dict[str, Any]:
+        """Return bulk poll data with the fast lane readings requested after it."""
+        for key, (reading_requested, reading) in list(self._fast_poll_readings.items()):
+            category, device_id = key
+            if reading_requested <= requested:
+                del self._fast_poll_readings[key]
+            elif device_id in data.get(category, {}):
+                data = {**data, category: {**data[category], device_id: reading}}
+        return data
+
+    def _track_changes(self, data: dict[str, Any]) -> None:
+        """Diff a poll against the previous one and announce the changes.
+
+        The first poll counts every device as changed but fires no event,
+        since there is nothing to compare it with.
+        """
+        status_maps = device_status_maps(data)
+        first_poll = not self.status_maps
+        changes = diff_status_maps(self.status_maps, status_maps)
+        self.status_maps = status_maps
+        self._announce_changes(changes, fire_event=not first_poll)
+
+    def _announce_changes(self, changes: list[DeviceChange], *, fire_event: bool = True) -> None:
+        """Publish device changes to the household counts and the event bus."""
+        self.last_changes = changes
+        self.household.apply(changes)
+        if not fire_event or not changes:
+            return
+        self.hass.bus.async_fire(
+            EVENT_DEVICES_CHANGED,
+            {
+                "entry_id": self.config_entry.entry_id,
+                "changes": [change.as_dict() for change in self.last_changes],
+            },
+        )
 
 
 class HiotEnergyCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
@@ -83,13 +451,275 @@ class HiotEnergyCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
             update_interval=scan_interval,
         )
         self.api_client = api_client
+        self.poll_history: deque[dict[str, Any]] = deque(maxlen=POLL_HISTORY_SIZE)
+        self._cache: dict[tuple[str, str], _CachedEnergyItem] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.suppressed_writes = 0
+        self._scan_interval = scan_interval
+        self.publish_schedule = PublishScheduleEstimator()
+        # When the next refresh aligned with the publish time is due, if scheduled
+        self._publish_refresh_at: datetime | None = None
+        self.data_month: str | None = None
+        self.data_day: str | None = None
+        self._daily_retry_at: datetime | None = None
+        self._view: EnergyView | None = None
+        self.projections = {energy_type: EnergyProjection() for energy_type in ENERGY_TYPES}
+        self._view_source: tuple[Any, str | None, str | None] | None = None
+        self._closed_months: dict[str, dict[str, dict[str, Any]]] = {}
+        self._closed_months_store: Store[dict[str, dict[str, dict[str, Any]]]] = Store(
+            hass,
+            CLOSED_MONTHS_STORAGE_VERSION,
+            _closed_months_storage_key(config_entry.entry_id),
+        )
 
-    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
-        """Fetch latest monthly energy usage, fee, and goal data."""
+    async def _async_setup(self) -> None:
+        """Load finalised month totals."""
+        self._closed_months = await self._closed_months_store.async_load() or {}
+
+    @property
+    def energy_view(self) -> EnergyView:
+        """Return the normalised view of the current data, built once per update."""
+        source = (self.data, self.data_month, self.data_day)
+        if (
+            self._view is None
+            or self._view_source is None
+            or self._view_source[0] is not source[0]
+            or self._view_source[1:] != source[1:]
+        ):
+            self._view = EnergyView.from_data(*source)
+            self._view_source = source
+        return self._view
+
+    @property
+    def closed_months(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return finalised month totals keyed by ``YYYY-MM``."""
+        return self._closed_months
+
+    @property
+    def scan_interval(self) -> timedelta:
+        """Return the configured polling interval."""
+        return self._scan_interval
+
+    @scan_interval.setter
+    def scan_interval(self, value: timedelta) -> None:
+        """Set the configured polling interval and drop any aligned schedule."""
+        self._scan_interval = value
+        self.update_interval = value
+        self._publish_refresh_at = None
+
+    def _expired_items(
+        self, periods: dict[str, str], now: datetime
+    ) -> list[tuple[str, str]]:
+        """Return (energy_type, item_type) pairs whose cached value is stale.
+
+        ``periods`` maps each EMS period to the key (``YYYY-MM`` or
+        ``YYYY-MM-DD``) currently being reported.
+        """
+        # An aligned refresh is placed just after a publish time, so usage must be read
+        force_usage = (
+            self._publish_refresh_at is not None
+            and now >= self._publish_refresh_at - ALIGNED_REFRESH_TOLERANCE
+        )
+        if force_usage:
+            self._publish_refresh_at = None
+        daily_paused = self._daily_retry_at is not None and now < self._daily_retry_at
+        expired = []
+        for item_type in ENERGY_ITEM_TYPES:
+            if item_type == "daily_usage" and daily_paused:
+                continue
+            ttl = ENERGY_CACHE_TTLS[item_type]
+            if item_type in USAGE_ITEM_TYPES:
+                # A polling interval shorter than the cache lifetime is honoured
+                ttl = min(ttl, self.scan_interval)
+            period = periods[ENERGY_ITEM_PERIODS[item_type]]
+            for energy_type in ENERGY_TYPES:
+                cached = self._cache.get((energy_type, item_type))
+                if (
+                    cached is None
+                    or cached.period != period
+                    or now - cached.fetched_at >= ttl
+                    or (force_usage and item_type in USAGE_ITEM_TYPES)
+                ):
+                    expired.append((energy_type, item_type))
+        return expired
+
+    def _check_daily_usage(
+        self,
+        now: datetime,
+        expired: list[tuple[str, str]],
+        data: dict[str, dict[str, Any]],
+    ) -> None:
+        """Pause period=DAY requests for a while if the server rejects all of them.
+
+        Only a cycle whose period=MONTH requests succeeded counts as a rejection;
+        otherwise the empty daily items are taken for a connection problem.
+        """
+        requested = [
+            energy_type for energy_type, item_type in expired if item_type == "daily_usage"
+        ]
+        if not requested or any(
+            data.get(energy_type, {}).get("daily_usage") for energy_type in requested
+        ):
+            return
+        monthly = [
+            (energy_type, item_type)
+            for energy_type, item_type in expired
+            if ENERGY_ITEM_PERIODS[item_type] == ENERGY_PERIOD_MONTH
+        ]
+        if not monthly or not all(
+            data.get(energy_type, {}).get(item_type) for energy_type, item_type in monthly
+        ):
+            return
+        self._daily_retry_at = now + DAILY_USAGE_RETRY_INTERVAL
+        _LOGGER.warning(
+            "Daily energy usage is unavailable from this server; retrying after %s",
+            DAILY_USAGE_RETRY_INTERVAL,
+        )
+
+    def _observe_usage(
+        self,
+        started: datetime,
+        expired: list[tuple[str, str]],
+        data: dict[str, dict[str, Any]],
+    ) -> None:
+        """Feed freshly fetched usage values to the publish schedule."""
+        if any((energy_type, "usage") not in expired for energy_type in ENERGY_TYPES):
+            return
+        values = tuple(
+            data.get(energy_type, {}).get("usage", {}).get("usage")
+            for energy_type in ENERGY_TYPES
+        )
+        if None in values:
+            return
+        self.publish_schedule.observe(started, dt_util.utcnow(), values)
+
+    def _schedule_next_update(self) -> None:
+        """Align the next refresh with the learned publish time, if any."""
+        now = dt_util.utcnow()
+        next_refresh = self.publish_schedule.next_refresh(now, self._scan_interval)
+        self._publish_refresh_at = next_refresh if self.publish_schedule.aligned else None
+        self.update_interval = (
+            self._scan_interval if next_refresh is None else next_refresh - now
+        )
+
+    def _cached_data(self, periods: dict[str, str]) -> dict[str, dict[str, Any]]:
+        result: dict[str, dict[str, Any]] = {}
+        for energy_type in ENERGY_TYPES:
+            result[energy_type] = {}
+            for item_type in ENERGY_ITEM_TYPES:
+                cached = self._cache.get((energy_type, item_type))
+                period = periods.get(ENERGY_ITEM_PERIODS[item_type])
+                result[energy_type][item_type] = (
+                    cached.value if cached is not None and cached.period == period else {}
+                )
+        return result
+
+    def _update_projections(
+        self, local_now: datetime, month: str, view: EnergyView
+    ) -> None:
+        """Feed the month totals of this update to the month-end projections."""
+        month_start = datetime.strptime(month, "%Y-%m").replace(tzinfo=local_now.tzinfo)
+        next_month = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        days = (next_month - month_start).days
+        elapsed = min((local_now - month_start) / timedelta(days=1), days)
+        for energy_type, projection in self.projections.items():
+            projection.update(
+                month,
+                days,
+                elapsed,
+                view.value(energy_type, "usage"),
+                view.value(energy_type, "fee"),
+                view.value(energy_type, "goal"),
+            )
+
+    async def _async_close_month(self, month: str) -> None:
+        """Fetch the final totals of a finished month once and publish them.
+
+        Listeners see the closing month's final values before the first values
+        of the new month, so month-total sensors end each cycle on its real
+        total. The result is stored and the month is never requested again.
+        """
+        if month in self._closed_months:
+            # A clock stepped back across the month boundary reports it again
+            return
+        closing_items = [
+            (energy_type, item_type)
+            for item_type in CLOSING_ITEM_TYPES
+            for energy_type in ENERGY_TYPES
+        ]
+        closed = self._cached_data({ENERGY_PERIOD_MONTH: month})
         try:
-            today = datetime.now().strftime("%Y-%m-%d")
-            return await self.api_client.async_get_all_energy_data(today)
-        except HiotAuthError as err:
-            raise ConfigEntryAuthFailed(err) from err
+            data = await self.api_client.async_get_all_energy_data(
+                _month_query_date(month), closing_items
+            )
         except HiotApiError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+            # Keep the last values seen during the month rather than blocking rollover
+            _LOGGER.warning("Failed to fetch final energy totals for %s: %s", month, err)
+        else:
+            for energy_type, item_type in closing_items:
+                value = data.get(energy_type, {}).get(item_type)
+                if value:
+                    closed[energy_type][item_type] = value
+
+        self._closed_months[month] = closed
+        for stale_month in sorted(self._closed_months)[:-CLOSED_MONTHS_KEPT]:
+            del self._closed_months[stale_month]
+        await self._closed_months_store.async_save(self._closed_months)
+
+        self.data = closed
+        self.async_update_listeners()
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch monthly and daily energy items whose cache expired."""
+        started = time.monotonic()
+        now = dt_util.utcnow()
+        local_now = now.astimezone(dt_util.get_time_zone(SERVICE_TIMEZONE))
+        # The closing day/month keeps being reported for a while after midnight
+        reported = local_now - PERIOD_CLOSE_DELAY
+        month = reported.strftime("%Y-%m")
+        day = reported.strftime("%Y-%m-%d")
+        if self.data_month is not None and self.data_month < month:
+            try:
+                await self._async_close_month(self.data_month)
+            except HiotAuthError as err:
+                _record_poll(self.poll_history, started, success=False)
+                raise ConfigEntryAuthFailed(err) from err
+
+        periods = {ENERGY_PERIOD_MONTH: month, ENERGY_PERIOD_DAY: day}
+        expired = self._expired_items(periods, now)
+        self.cache_hits += len(ENERGY_TYPES) * len(ENERGY_ITEM_TYPES) - len(expired)
+        self.cache_misses += len(expired)
+
+        if expired:
+            try:
+                data = await self.api_client.async_get_all_energy_data(day, expired)
+            except HiotAuthError as err:
+                _record_poll(self.poll_history, started, success=False)
+                raise ConfigEntryAuthFailed(err) from err
+            except HiotApiError as err:
+                _record_poll(self.poll_history, started, success=False)
+                self.update_interval = self._scan_interval
+                self._publish_refresh_at = None
+                raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+            for energy_type, item_type in expired:
+                value = data.get(energy_type, {}).get(item_type)
+                # Failed items come back empty; keep the previous value until retried
+                if value:
+                    self._cache[(energy_type, item_type)] = _CachedEnergyItem(
+                        value, periods[ENERGY_ITEM_PERIODS[item_type]], now
+                    )
+            self._observe_usage(now, expired, data)
+            self._check_daily_usage(now, expired, data)
+
+        self.data_month = month
+        self.data_day = day
+        data = self._cached_data(periods)
+        # Build the view for this update now; energy_view reuses it for the sensors
+        self._view = EnergyView.from_data(data, month, day)
+        self._view_source = (data, month, day)
+        self._update_projections(local_now, month, self._view)
+        self._schedule_next_update()
+        _record_poll(self.poll_history, started, success=True)
+        return data
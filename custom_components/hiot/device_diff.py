@@ -0,0 +1,94 @@
+"""Per-device status differences between consecutive device snapshots."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# (category, device id) -> {command: value}
+StatusMaps = dict[tuple[str, str], dict[str, Any]]
+
+
+def device_status_maps(data: dict[str, Any] | None) -> StatusMaps:
+    """Index the status list of every device in a bulk snapshot by command."""
+    maps: StatusMaps = {}
+    for category, devices in (data or {}).items():
+        if not isinstance(devices, dict):
+            continue
+        for device_id, device in devices.items():
+            if not isinstance(device, dict):
+                continue
+            maps[(category, device_id)] = {
+                status["command"]: status.get("value")
+                for status in device.get("statusList", [])
+                if isinstance(status, dict) and status.get("command") is not None
+            }
+    return maps
+
+
+def status_value_matches(current: Any, requested: str) -> bool:
+    """Compare a reported status value with a command value."""
+    if current is None:
+        return False
+    if str(current) == requested:
+        return True
+    try:
+        return float(current) == float(requested)
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass(frozen=True)
+class DeviceChange:
+    """Commands of one device whose value differs from the previous snapshot.
+
+    A command missing from the new snapshot is reported with a ``None`` value;
+    so is every command of a device that disappeared.
+    """
+
+    category: str
+    device_id: str
+    status: dict[str, Any]
+    previous: dict[str, Any]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the change as event/websocket payload."""
+        return {
+            "category": self.category,
+            "device_id": self.device_id,
+            "status": self.status,
+            "previous": self.previous,
+        }
+
+
+def diff_status_maps(previous: StatusMaps, current: StatusMaps) -> list[DeviceChange]:
+    """Return the devices whose status changed, in snapshot order."""
+    changes: list[DeviceChange] = []
+    for key, statuses in current.items():
+        before = previous.get(key, {})
+        if statuses == before:
+            continue
+        status = {
+            command: value
+            for command, value in statuses.items()
+            if command not in before or before[command] != value
+        }
+        status.update({command: None for command in before if command not in statuses})
+        changes.append(
+            DeviceChange(
+                category=key[0],
+                device_id=key[1],
+                status=status,
+                previous={command: before.get(command) for command in status},
+            )
+        )
+    for key, before in previous.items():
+        if key not in current:
+            changes.append(
+                DeviceChange(
+                    category=key[0],
+                    device_id=key[1],
+                    status=dict.fromkeys(before),
+                    previous=dict(before),
+                )
+            )
+    return changes
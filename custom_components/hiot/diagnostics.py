@@ -0,0 +1,115 @@
+"""Diagnostics support for HT HomeService."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_DONG, CONF_HO, DOMAIN, ENERGY_TYPES
+from .coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
+from .energy_store import HiotEnergyStore
+from .scheduler import HiotCommandScheduler
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_DONG, CONF_HO, "title", "unique_id"}
+
+
+def _coordinator_snapshot(
+    coordinator: HiotDataUpdateCoordinator | HiotEnergyCoordinator,
+) -> dict[str, Any]:
+    """Return polling state shared by both coordinators."""
+    interval = coordinator.update_interval
+    return {
+        "update_interval": interval.total_seconds() if interval else None,
+        "last_update_success": coordinator.last_update_success,
+        "poll_history": list(coordinator.poll_history),
+    }
+
+
+def _device_counts(coordinator: HiotDataUpdateCoordinator) -> dict[str, dict[str, int]]:
+    """Count devices and status entries per category in the latest snapshot."""
+    counts: dict[str, dict[str, int]] = {}
+    for category, devices in (coordinator.data or {}).items():
+        if not isinstance(devices, dict):
+            continue
+        counts[category] = {
+            "devices": len(devices),
+            "statuses": sum(
+                len(device.get("statusList", []))
+                for device in devices.values()
+                if isinstance(device, dict)
+            ),
+        }
+    return counts
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: HiotDataUpdateCoordinator = entry_data["coordinator"]
+    energy_coordinator: HiotEnergyCoordinator = entry_data["energy_coordinator"]
+    energy_store: HiotEnergyStore | None = entry_data.get("energy_store")
+    scheduler: HiotCommandScheduler | None = entry_data.get("scheduler")
+    metrics = coordinator.api_client.metrics
+
+    store_snapshot: dict[str, Any] | None = None
+    if energy_store is not None:
+        store_snapshot = {
+            "records": energy_store.record_counts(),
+            "comparisons": {
+                energy_type: await energy_store.async_comparisons(energy_type)
+                for energy_type in ENERGY_TYPES
+            },
+        }
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "performance": {
+            "device_coordinator": {
+                **_coordinator_snapshot(coordinator),
+                "device_list_size": len(coordinator.devices),
+                "categories": _device_counts(coordinator),
+                "skipped_commands": coordinator.skipped_commands,
+                "suppressed_writes": coordinator.suppressed_writes,
+                "fast_poll": {
+                    "devices": [device_id for _, device_id in coordinator.fast_poll_devices],
+                    "polls": coordinator.fast_polls,
+                    "changes": coordinator.fast_poll_changes,
+                },
+                "command_journal": {
+                    "pending": coordinator.command_journal.pending,
+                    "replays": coordinator.command_journal.replays,
+                    "last_replay": coordinator.command_journal.last_replay,
+                },
+            },
+            "energy_coordinator": {
+                **_coordinator_snapshot(energy_coordinator),
+                "cache_hits": energy_coordinator.cache_hits,
+                "cache_misses": energy_coordinator.cache_misses,
+                "suppressed_writes": energy_coordinator.suppressed_writes,
+                "scan_interval": energy_coordinator.scan_interval.total_seconds(),
+                "publish_minute_candidates": energy_coordinator.publish_schedule.candidates,
+                "publish_schedule_abandoned": energy_coordinator.publish_schedule.abandoned,
+                "data_month": energy_coordinator.data_month,
+                "data_day": energy_coordinator.data_day,
+                "closed_months": sorted(energy_coordinator.closed_months),
+            },
+            "endpoints": metrics.as_dict(),
+            "reauth_history": list(metrics.reauth_history),
+            "batch_errors": list(metrics.batch_errors),
+        },
+        "energy_store": store_snapshot,
+        "scheduler": (
+            {
+                "pending": scheduler.pending,
+                "next_due": scheduler.next_due.isoformat() if scheduler.next_due else None,
+                "runs": scheduler.runs,
+            }
+            if scheduler is not None
+            else None
+        ),
+    }
@@ -0,0 +1,211 @@
+"""Import EMS usage history into the recorder as external statistics."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import HiotApiClient, HiotApiError
+from .const import (
+    DOMAIN,
+    ENERGY_CONVERSION_DIVISORS,
+    ENERGY_LABELS,
+    ENERGY_TYPES,
+    ENERGY_UNITS,
+    SERVICE_TIMEZONE,
+)
+from .coordinator import HiotEnergyCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def _storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.energy_history"
+
+
+def _shift_month(month: date, months: int) -> date:
+    month_index = month.year * 12 + month.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def statistic_id_for(entry_id: str, energy_type: str) -> str:
+    """Return the external statistic id for an energy type."""
+    return f"{DOMAIN}:{entry_id.lower()}_{energy_type.lower()}_usage"
+
+
+def _item_month(item: dict[str, Any]) -> date | None:
+    for key in ("date", "usageDate", "yearMonth", "ym", "month"):
+        parsed = HiotApiClient._parse_sortable_date(item.get(key))
+        if parsed is not None:
+            return parsed.date().replace(day=1)
+    return None
+
+
+def _converted_usage(energy_type: str, raw_value: Any) -> float | None:
+    try:
+        return float(raw_value) / ENERGY_CONVERSION_DIVISORS[energy_type]
+    except (TypeError, ValueError):
+        return None
+
+
+async def async_remove_history_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted import cursor for a deleted entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
+
+
+class HiotEnergyHistoryImporter:
+    """Incrementally write monthly EMS usage into long-term statistics.
+
+    The cursor stores the last finalised month and the cumulative sum up to
+    it, so the history endpoint is only queried while finalised months are
+    missing. The in-progress month is taken from the energy coordinator.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: HiotEnergyCoordinator,
+    ) -> None:
+        self.hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, _storage_key(entry.entry_id)
+        )
+        self._cursors: dict[str, dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def cursors(self) -> dict[str, dict[str, Any]]:
+        """Return the persisted per-energy-type cursors."""
+        return self._cursors
+
+    async def async_load(self) -> None:
+        """Load persisted cursors."""
+        self._cursors = await self._store.async_load() or {}
+
+    @callback
+    def async_schedule_import(self) -> None:
+        """Schedule an import run after a coordinator update."""
+        if self._lock.locked():
+            return
+        self._entry.async_create_background_task(
+            self.hass, self.async_import(), f"{DOMAIN} energy history import"
+        )
+
+    async def async_import(self) -> None:
+        """Write any new periods for all energy types."""
+        if "recorder" not in self.hass.config.components:
+            return
+
+        async with self._lock:
+            now = dt_util.now(dt_util.get_time_zone(SERVICE_TIMEZONE))
+            changed = False
+            for energy_type in ENERGY_TYPES:
+                try:
+                    changed |= await self._async_import_energy_type(energy_type, now)
+                except HiotApiError as err:
+                    _LOGGER.warning(
+                        "Failed to import %s usage history: %s", energy_type, err
+                    )
+            if changed:
+                await self._store.async_save(self._cursors)
+
+    async def _async_import_energy_type(self, energy_type: str, now: datetime) -> bool:
+        # Follow the coordinator, which keeps reporting a closing month for a while
+        data_month = self._coordinator.data_month
+        current_month = (
+            date.fromisoformat(f"{data_month}-01")
+            if data_month is not None
+            else now.date().replace(day=1)
+        )
+        cursor = self._cursors.get(energy_type, {})
+        last_final = date.fromisoformat(cursor["last_period"]) if cursor else None
+        total = float(cursor.get("sum", 0.0))
+
+        previous_month = _shift_month(current_month, -1)
+        periods: dict[date, float] = {}
+        fetched_history = False
+        if last_final is None or last_final < previous_month:
+            fetched_history = True
+
+            def _collect(item: dict[str, Any]) -> None:
+                # Keep one float per new month instead of the raw response
+                month = _item_month(item)
+                value = _converted_usage(energy_type, item.get("usage"))
+                if month is None or value is None:
+                    return
+                if last_final is None or month > last_final:
+                    periods[month] = value
+
+            await self._coordinator.api_client.async_stream_energy_usage_history(
+                energy_type, now.strftime("%Y-%m-%d"), _collect
+            )
+            if previous_month not in periods:
+                # History can lag behind the totals fetched when the month closed
+                closed = self._coordinator.closed_months.get(previous_month.strftime("%Y-%m"), {})
+                closed_value = _converted_usage(
+                    energy_type, closed.get(energy_type, {}).get("usage", {}).get("usage")
+                )
+                if closed_value is not None:
+                    periods[previous_month] = closed_value
+
+        usage_data = (self._coordinator.data or {}).get(energy_type, {}).get("usage", {})
+        current_value = _converted_usage(energy_type, usage_data.get("usage"))
+        if current_value is not None:
+            periods[current_month] = current_value
+
+        statistics: list[StatisticData] = []
+        for month in sorted(periods):
+            if month > current_month:
+                continue
+            value = periods[month]
+            running_total = total + value
+            statistics.append(
+                StatisticData(
+                    start=datetime(month.year, month.month, 1, tzinfo=now.tzinfo),
+                    state=value,
+                    sum=running_total,
+                )
+            )
+            if month < current_month:
+                total = running_total
+
+        new_final = last_final
+        if fetched_history:
+            reported = [month for month in periods if month < current_month]
+            # Months history skipped are treated as empty, but a history that
+            # lacks the just-closed month is read again until it reports it
+            new_final = (
+                previous_month
+                if previous_month in periods or not reported
+                else max(reported)
+            )
+
+        if statistics:
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{ENERGY_LABELS[energy_type]} 사용량",
+                source=DOMAIN,
+                statistic_id=statistic_id_for(self._entry.entry_id, energy_type),
+                unit_of_measurement=ENERGY_UNITS[energy_type],
+            )
+            async_add_external_statistics(self.hass, metadata, statistics)
+
+        if new_final is None or new_final == last_final:
+            return False
+
+        self._cursors[energy_type] = {"last_period": new_final.isoformat(), "sum": total}
+        return True
@@ -0,0 +1,81 @@
+"""Month-end projections derived from month-to-date energy totals."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+PROJECTION_METRICS = (
+    "average_daily_usage",
+    "projected_usage",
+    "projected_fee",
+    "projected_goal_percent",
+)
+
+# Do not extrapolate from less than this much of a month
+MIN_ELAPSED_DAYS = 1.0
+
+
+@dataclass
+class EnergyProjection:
+    """Running month-to-date state of one energy type.
+
+    The EMS month total is already a running sum, so each fetch only replaces
+    the totals and recomputes the derived values in constant time; nothing is
+    re-read from history. A new month starts the state over.
+    """
+
+    month: str | None = None
+    days_in_month: int = 30
+    elapsed_days: float = MIN_ELAPSED_DAYS
+    usage: float = 0.0
+    fee: float | None = None
+    goal: float | None = None
+    average_daily_usage: float | None = None
+    projected_usage: float | None = None
+    projected_fee: int | None = None
+    projected_goal_percent: float | None = None
+
+    def update(
+        self,
+        month: str,
+        days_in_month: int,
+        elapsed_days: float,
+        usage: float | None,
+        fee: float | None,
+        goal: float | None,
+    ) -> None:
+        """Apply a fetch; ``None`` values keep the previous state."""
+        if month != self.month:
+            self.month = month
+            self.usage = 0.0
+            self.fee = None
+            self.average_daily_usage = None
+            self.projected_usage = None
+            self.projected_fee = None
+            self.projected_goal_percent = None
+        self.days_in_month = days_in_month
+        self.elapsed_days = max(elapsed_days, MIN_ELAPSED_DAYS)
+        if usage is not None:
+            self.usage = usage
+        if fee is not None:
+            self.fee = fee
+        if goal is not None:
+            self.goal = goal
+        if usage is None and self.average_daily_usage is None:
+            return
+
+        self.average_daily_usage = round(self.usage / self.elapsed_days, 3)
+        self.projected_usage = round(self.average_daily_usage * self.days_in_month, 3)
+        # Fee per unit so far, applied to the projected usage
+        self.projected_fee = (
+            int(self.fee / self.usage * self.projected_usage)
+            if self.fee is not None and self.usage > 0
+            else None
+        )
+        self.projected_goal_percent = (
+            round(self.projected_usage / self.goal * 100, 1) if self.goal else None
+        )
+
+    def value(self, metric: str) -> float | int | None:
+        """Return one derived value by metric name."""
+        value: float | int | None = getattr(self, metric)
+        return value
@@ -0,0 +1,167 @@
+"""Learn when the metering backend publishes new EMS values."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+MINUTES_PER_HOUR = 60
+
+# Once the publish minute is narrowed to this many minutes, refreshes are aligned
+ALIGN_WINDOW_MINUTES = 3
+# Delay after the learned publish minute before fetching
+ALIGN_MARGIN = timedelta(minutes=1)
+MIN_REFRESH_DELAY = timedelta(minutes=1)
+# A refresh this close to its aligned time still counts as the aligned refresh
+ALIGNED_REFRESH_TOLERANCE = timedelta(seconds=10)
+# Backends that do not publish hourly keep contradicting the estimate; give up
+# after this many resets and stay on the fixed interval
+MAX_RESETS = 3
+
+
+def _window_minutes(start: datetime, end: datetime, *, inclusive: bool) -> set[int]:
+    """Return minute-of-hour buckets touched by (or fully inside) a time window.
+
+    With ``inclusive`` every bucket overlapping the window is returned, otherwise
+    only buckets lying entirely inside it.
+    """
+    if end - start >= timedelta(hours=1):
+        return set(range(MINUTES_PER_HOUR))
+
+    minutes: set[int] = set()
+    bucket = start.replace(second=0, microsecond=0)
+    while bucket < end:
+        bucket_end = bucket + timedelta(minutes=1)
+        if inclusive or (bucket >= start and bucket_end <= end):
+            minutes.add(bucket.minute)
+        bucket = bucket_end
+    return minutes
+
+
+def _runs(minutes: set[int]) -> list[tuple[int, int]]:
+    """Return circular runs of consecutive minutes as (start, length)."""
+    if len(minutes) == MINUTES_PER_HOUR:
+        return [(0, MINUTES_PER_HOUR)]
+
+    runs = []
+    for minute in sorted(minutes):
+        if (minute - 1) % MINUTES_PER_HOUR in minutes:
+            continue
+        length = 1
+        while (minute + length) % MINUTES_PER_HOUR in minutes:
+            length += 1
+        runs.append((minute, length))
+    return runs
+
+
+class PublishScheduleEstimator:
+    """Estimate the minute of the hour at which new usage values appear.
+
+    Every pair of consecutive fetches less than an hour apart narrows the set
+    of candidate minutes: a changed value keeps only minutes inside the gap,
+    an unchanged value removes them. While the candidate set is wide, the next
+    refresh probes its midpoint; once a single narrow window is left, refreshes
+    are placed just after it. Contradicting observations, including several
+    narrow windows left at once, reset the estimate so a moved publish time
+    is relearned, up to ``MAX_RESETS`` times. Refreshes are never placed
+    sooner than the configured interval.
+    """
+
+    def __init__(self) -> None:
+        self._candidates: set[int] = set(range(MINUTES_PER_HOUR))
+        self.resets = 0
+        self._last_values: Any = None
+        self._last_started: datetime | None = None
+        self._last_finished: datetime | None = None
+
+    @property
+    def abandoned(self) -> bool:
+        """Return True if the backend showed no hourly publish time."""
+        return self.resets >= MAX_RESETS
+
+    @property
+    def learned(self) -> bool:
+        """Return True if any minute has been ruled out."""
+        return not self.abandoned and 0 < len(self._candidates) < MINUTES_PER_HOUR
+
+    @property
+    def aligned(self) -> bool:
+        """Return True if the publish minute is known closely enough to align."""
+        if not self.learned:
+            return False
+        runs = _runs(self._candidates)
+        return len(runs) == 1 and runs[0][1] <= ALIGN_WINDOW_MINUTES
+
+    @property
+    def candidates(self) -> list[int]:
+        """Return the remaining candidate publish minutes."""
+        return sorted(self._candidates)
+
+    def reset(self) -> None:
+        """Forget everything learned."""
+        self._candidates = set(range(MINUTES_PER_HOUR))
+        self.resets += 1
+
+    def observe(self, started: datetime, finished: datetime, values: Any) -> None:
+        """Record the values returned by a fetch spanning ``started``..``finished``."""
+        previous_values = self._last_values
+        previous_started = self._last_started
+        previous_finished = self._last_finished
+        self._last_values = values
+        self._last_started = started
+        self._last_finished = finished
+
+        if (
+            self.abandoned
+            or previous_values is None
+            or previous_started is None
+            or previous_finished is None
+        ):
+            return
+
+        if values != previous_values:
+            window = _window_minutes(previous_started, finished, inclusive=True)
+            narrowed = self._candidates & window
+            if not narrowed:
+                self.reset()
+            self._candidates = narrowed or window
+        else:
+            ruled_out = _window_minutes(previous_finished, started, inclusive=False)
+            remaining = self._candidates - ruled_out
+            if remaining:
+                self._candidates = remaining
+            else:
+                self.reset()
+
+        runs = _runs(self._candidates)
+        if len(runs) > 1 and all(length <= ALIGN_WINDOW_MINUTES for _, length in runs):
+            # Only narrow windows are left, far apart: values appear more than hourly
+            self.reset()
+
+    def next_refresh(self, now: datetime, interval: timedelta) -> datetime | None:
+        """Return when to refresh next, or None to keep the fixed interval."""
+        if not self.learned:
+            return None
+
+        start, length = max(_runs(self._candidates), key=lambda run: run[1])
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        earliest = now + max(interval, MIN_REFRESH_DELAY)
+
+        if self.aligned:
+            offset = timedelta(minutes=start + length) + ALIGN_MARGIN
+        elif length <= ALIGN_WINDOW_MINUTES:
+            # Scattered narrow windows name no single publish minute
+            return None
+        elif interval < timedelta(hours=1):
+            # Probe the middle of the candidate window to halve it
+            offset = timedelta(minutes=start + length // 2)
+        else:
+            # Probing needs fetches less than an hour apart; keep the fixed interval
+            return None
+
+        candidate = hour + offset
+        while candidate < earliest:
+            candidate += timedelta(hours=1)
+        if not self.aligned and candidate - now >= timedelta(hours=1):
+            # The midpoint is too close to reach; a probe an hour away teaches nothing
+            return earliest
+        return candidate
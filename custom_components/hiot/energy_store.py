@@ -0,0 +1,331 @@
+"""Compact append-only store of EMS readings per energy type."""
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ENERGY_TYPES, SERVICE_TIMEZONE
+from .coordinator import HiotEnergyCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"HIOT"
+FORMAT_VERSION = 1
+# magic, format version, record size, record count, padding
+HEADER = struct.Struct("<4sHHI4x")
+# fetched at (unix seconds), day ordinal, month-to-date usage, daily usage (NaN if unknown)
+RECORD = struct.Struct("<Iidd")
+# Records added to the file each time it has to grow
+GROWTH_RECORDS = 1024
+
+
+def series_path(hass: HomeAssistant, entry_id: str, energy_type: str) -> str:
+    """Return the path of the series file for one energy type."""
+    return hass.config.path(
+        ".storage", f"{DOMAIN}.{entry_id}.energy_{energy_type.lower()}.bin"
+    )
+
+
+class EnergySeriesFile:
+    """Fixed-width records in a memory-mapped file with a per-day index.
+
+    Each record is one reading of a single energy type. The index maps a day
+    ordinal to its last record, so lookups never scan the file. All methods
+    do blocking I/O and must run in the executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._map: mmap.mmap | None = None
+        self._count = 0
+        self._capacity = 0
+        self._day_index: dict[int, int] = {}
+
+    @property
+    def count(self) -> int:
+        """Return the number of stored records."""
+        return self._count
+
+    def open(self) -> None:
+        """Open or create the file and rebuild the day index."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            exists = os.path.exists(self._path)
+            self._file = open(self._path, "r+b" if exists else "w+b")
+            size = os.fstat(self._file.fileno()).st_size
+            if size < HEADER.size or not self._header_valid():
+                if size:
+                    _LOGGER.warning("Discarding unreadable energy series %s", self._path)
+                self._file.truncate(0)
+                self._resize(GROWTH_RECORDS)
+                self._write_count(0)
+                return
+
+            self._map_file(size)
+            assert self._map is not None
+            _, _, _, count = HEADER.unpack_from(self._map, 0)
+            self._count = min(count, self._capacity)
+            for index in range(self._count):
+                _, day, _, _ = RECORD.unpack_from(self._map, self._offset(index))
+                self._day_index[day] = index
+
+    def close(self) -> None:
+        """Flush and release the mapping."""
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def append(
+        self, day: date, month_usage: float, daily_usage: float | None
+    ) -> bool:
+        """Append a reading unless it repeats the last one of the same day."""
+        with self._lock:
+            if self._map is None:
+                return False
+            ordinal = day.toordinal()
+            daily = math.nan if daily_usage is None else daily_usage
+            last = self._record(self._day_index[ordinal]) if ordinal in self._day_index else None
+            if last is not None and last[2] == month_usage and (
+                last[3] == daily or (math.isnan(last[3]) and math.isnan(daily))
+            ):
+                return False
+
+            if self._count == self._capacity:
+                self._resize(self._capacity + GROWTH_RECORDS)
+            RECORD.pack_into(
+                self._map,
+                self._offset(self._count),
+                int(time.time()),
+                ordinal,
+                month_usage,
+                daily,
+            )
+            self._day_index[ordinal] = self._count
+            self._write_count(self._count + 1)
+            self._map.flush()
+            return True
+
+    def last_reading(self, day: date) -> tuple[float, float | None] | None:
+        """Return (month_usage, daily_usage) of the last reading on a day."""
+        with self._lock:
+            index = self._day_index.get(day.toordinal())
+            if index is None or self._map is None:
+                return None
+            _, _, month_usage, daily = self._record(index)
+            return month_usage, None if math.isnan(daily) else daily
+
+    def _header_valid(self) -> bool:
+        self._file.seek(0)
+        magic, version, record_size, _ = HEADER.unpack(self._file.read(HEADER.size))
+        return magic == MAGIC and version == FORMAT_VERSION and record_size == RECORD.size
+
+    def _offset(self, index: int) -> int:
+        return HEADER.size + index * RECORD.size
+
+    def _record(self, index: int) -> tuple[int, int, float, float]:
+        assert self._map is not None
+        return RECORD.unpack_from(self._map, self._offset(index))
+
+    def _map_file(self, size: int) -> None:
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._capacity = (size - HEADER.size) // RECORD.size
+
+    def _resize(self, capacity: int) -> None:
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        size = self._offset(capacity)
+        self._file.truncate(size)
+        self._map_file(size)
+
+    def _write_count(self, count: int) -> None:
+        assert self._map is not None
+        HEADER.pack_into(self._map, 0, MAGIC, FORMAT_VERSION, RECORD.size, count)
+        self._count = count
+
+
+def _month_to_date(series: EnergySeriesFile, day: date) -> float | None:
+    """Return the latest month-to-date usage on or before ``day`` in its month."""
+    current = day
+    while current.month == day.month:
+        reading = series.last_reading(current)
+        if reading is not None:
+            return reading[0]
+        current -= timedelta(days=1)
+    return None
+
+
+def _daily_usage(series: EnergySeriesFile, day: date) -> float | None:
+    """Return a day's usage, derived from month-to-date totals if not reported."""
+    reading = series.last_reading(day)
+    if reading is None:
+        return None
+    month_usage, daily_usage = reading
+    if daily_usage is not None:
+        return daily_usage
+    if day.day == 1:
+        return month_usage
+    previous = _month_to_date(series, day - timedelta(days=1))
+    return None if previous is None else round(month_usage - previous, 3)
+
+
+def _same_day_last_year(day: date) -> date:
+    try:
+        return day.replace(year=day.year - 1)
+    except ValueError:
+        # 29 February
+        return day.replace(year=day.year - 1, day=28)
+
+
+def _difference(current: float | None, previous: float | None) -> float | None:
+    if current is None or previous is None:
+        return None
+    return round(current - previous, 3)
+
+
+class HiotEnergyStore:
+    """Record coordinator readings and answer period comparisons locally."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: HiotEnergyCoordinator,
+    ) -> None:
+        self.hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._series = {
+            energy_type: EnergySeriesFile(series_path(hass, entry.entry_id, energy_type))
+            for energy_type in ENERGY_TYPES
+        }
+        # Comparisons for the day of the last recorded readings, per energy type
+        self.comparisons: dict[str, dict[str, float | None]] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call ``update_callback`` whenever the comparisons are recomputed."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove_listener
+
+    async def async_open(self) -> None:
+        """Open all series files."""
+        for series in self._series.values():
+            await self.hass.async_add_executor_job(series.open)
+
+    async def async_close(self) -> None:
+        """Close all series files."""
+        for series in self._series.values():
+            await self.hass.async_add_executor_job(series.close)
+
+    @callback
+    def async_schedule_append(self) -> None:
+        """Schedule recording the latest coordinator values."""
+        if not self._coordinator.last_update_success or self._coordinator.data_day is None:
+            return
+        day = date.fromisoformat(self._coordinator.data_day)
+        view = self._coordinator.energy_view
+        readings = {
+            energy_type: (
+                view.value(energy_type, "usage"),
+                view.value(energy_type, "daily_usage"),
+            )
+            for energy_type in ENERGY_TYPES
+        }
+        self._entry.async_create_background_task(
+            self.hass, self._async_append(day, readings), f"{DOMAIN} energy store append"
+        )
+
+    async def _async_append(
+        self, day: date, readings: dict[str, tuple[float | None, float | None]]
+    ) -> None:
+        """Record readings, then refresh the comparisons for their day."""
+        self.comparisons = await self.hass.async_add_executor_job(
+            self._append_and_compare, day, readings
+        )
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _append_and_compare(
+        self, day: date, readings: dict[str, tuple[float | None, float | None]]
+    ) -> dict[str, dict[str, float | None]]:
+        self._append(day, readings)
+        return {energy_type: self._comparisons(energy_type, day) for energy_type in ENERGY_TYPES}
+
+    def _append(
+        self, day: date, readings: dict[str, tuple[float | None, float | None]]
+    ) -> None:
+        for energy_type, (month_usage, daily_usage) in readings.items():
+            if month_usage is not None:
+                self._series[energy_type].append(day, float(month_usage), daily_usage)
+
+    def _comparisons(self, energy_type: str, day: date) -> dict[str, float | None]:
+        series = self._series[energy_type]
+        month_to_date = _month_to_date(series, day)
+        last_year = _month_to_date(series, _same_day_last_year(day))
+        today = _daily_usage(series, day)
+        yesterday = _daily_usage(series, day - timedelta(days=1))
+        return {
+            "month_to_date": month_to_date,
+            "same_period_last_year": last_year,
+            "year_over_year_change": _difference(month_to_date, last_year),
+            "today": today,
+            "yesterday": yesterday,
+            "day_over_day_change": _difference(today, yesterday),
+        }
+
+    async def async_comparisons(
+        self, energy_type: str, day: date | None = None
+    ) -> dict[str, float | None]:
+        """Return month-to-date, day-over-day and year-over-year figures."""
+        if day is None:
+            day = (
+                date.fromisoformat(self._coordinator.data_day)
+                if self._coordinator.data_day is not None
+                else dt_util.now(dt_util.get_time_zone(SERVICE_TIMEZONE)).date()
+            )
+        return await self.hass.async_add_executor_job(self._comparisons, energy_type, day)
+
+    def record_counts(self) -> dict[str, int]:
+        """Return the number of stored readings per energy type."""
+        return {energy_type: series.count for energy_type, series in self._series.items()}
+
+
+def _remove_files(paths: list[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            continue
+
+
+async def async_remove_energy_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the series files of a removed entry."""
+    await hass.async_add_executor_job(
+        _remove_files,
+        [series_path(hass, entry_id, energy_type) for energy_type in ENERGY_TYPES],
+    )
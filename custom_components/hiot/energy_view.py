@@ -0,0 +1,88 @@
+"""Normalised energy values shared by all energy sensors."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import ENERGY_CONVERSION_DIVISORS, ENERGY_TYPES, SERVICE_TIMEZONE
+
+# Sensor metric -> (EMS item type, response field)
+METRIC_SOURCES = {
+    "usage": ("usage", "usage"),
+    "fee": ("fee", "fee"),
+    "goal": ("goal", "goal"),
+    "same_area_usage": ("usage", "sameAreaTypeUsage"),
+    "daily_usage": ("daily_usage", "usage"),
+}
+
+
+def normalize_energy_value(energy_type: str, metric: str, raw_value: Any) -> float | int | None:
+    """Convert a raw EMS value to sensor native units (kWh / m³ / KRW)."""
+    if raw_value is None:
+        return None
+
+    try:
+        numeric_value = float(raw_value)
+    except (TypeError, ValueError):
+        return None
+
+    if metric == "fee":
+        return int(numeric_value)
+
+    converted_value = numeric_value / ENERGY_CONVERSION_DIVISORS[energy_type]
+    if converted_value.is_integer():
+        return int(converted_value)
+
+    return round(converted_value, 3)
+
+
+def _period_start(period: str | None) -> datetime | None:
+    if period is None:
+        return None
+    return datetime.combine(
+        date.fromisoformat(period),
+        time.min,
+        tzinfo=dt_util.get_time_zone(SERVICE_TIMEZONE),
+    )
+
+
+@dataclass(frozen=True)
+class EnergyView:
+    """Typed, unit-converted snapshot of one energy coordinator update."""
+
+    values: dict[tuple[str, str], float | int | None] = field(default_factory=dict)
+    month_start: datetime | None = None
+    day_start: datetime | None = None
+
+    @classmethod
+    def from_data(
+        cls,
+        data: dict[str, dict[str, Any]] | None,
+        month: str | None = None,
+        day: str | None = None,
+    ) -> EnergyView:
+        """Normalise every (energy_type, metric) value of coordinator data once."""
+        values: dict[tuple[str, str], float | int | None] = {}
+        for energy_type in ENERGY_TYPES:
+            type_data = (data or {}).get(energy_type)
+            if not isinstance(type_data, dict):
+                type_data = {}
+            for metric, (item_type, data_field) in METRIC_SOURCES.items():
+                item = type_data.get(item_type)
+                raw_value = item.get(data_field) if isinstance(item, dict) else None
+                values[(energy_type, metric)] = normalize_energy_value(
+                    energy_type, metric, raw_value
+                )
+
+        return cls(
+            values=values,
+            month_start=_period_start(f"{month}-01" if month is not None else None),
+            day_start=_period_start(day),
+        )
+
+    def value(self, energy_type: str, metric: str) -> float | int | None:
+        """Return the normalised value of one metric."""
+        return self.values.get((energy_type, metric))
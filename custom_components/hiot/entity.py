@@ -1,16 +1,49 @@
 """Base entity for HT HomeService integration."""
 from __future__ import annotations
 
+import logging
+from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
-from .const import DEVICE_CATEGORY_MAP, DOMAIN, MANUFACTURER
+from .api import SERVER_UNREACHABLE_ERRORS
+from .const import (
+    CONF_LIGHT_GROUP_LOCATIONS,
+    CONF_REDUCE_RECORDER_WRITES,
+    DEVICE_CATEGORY_MAP,
+    DOMAIN,
+    MANUFACTURER,
+)
 
 if TYPE_CHECKING:
     from .coordinator import HiotDataUpdateCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
+
+def lights_by_location(devices: list[dict[str, Any]]) -> dict[str, list[str]]:
+    """Return the ids of lights per deviceLocation, for locations with several."""
+    locations: dict[str, list[str]] = {}
+    for device in devices:
+        location = device.get("deviceLocation")
+        if device.get("deviceType") == "light" and location:
+            locations.setdefault(location, []).append(device["deviceId"])
+    return {location: ids for location, ids in locations.items() if len(ids) > 1}
+
+
+def light_group_locations(entry: ConfigEntry, devices: list[dict[str, Any]]) -> list[str]:
+    """Return the locations with a light group enabled; all of them until chosen."""
+    return list(entry.options.get(CONF_LIGHT_GROUP_LOCATIONS, lights_by_location(devices)))
+
+
+def recorder_writes_reduced(coordinator: DataUpdateCoordinator[Any]) -> bool:
+    """Return True if entities of the coordinator's entry skip unchanged state writes."""
+    return bool(coordinator.config_entry.options.get(CONF_REDUCE_RECORDER_WRITES, False))
+
 
 class HiotEntity(CoordinatorEntity["HiotDataUpdateCoordinator"]):
     """Base class for HT HomeService entities."""
@@ -30,6 +63,8 @@ class HiotEntity(CoordinatorEntity["HiotDataUpdateCoordinator"]):
         self._device_name = device_name
         self._device_type = device_type
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{device_type}_{device_id}"
+        # Availability and device data behind the last written state
+        self._written_state: tuple[bool, dict[str, Any] | None] | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -41,6 +76,15 @@ class HiotEntity(CoordinatorEntity["HiotDataUpdateCoordinator"]):
             model=self._device_type,
         )
 
+    def _handle_coordinator_update(self) -> None:
+        """Write state, skipping polls that left this device unchanged if enabled."""
+        state = (self.available, self._get_device_data())
+        if recorder_writes_reduced(self.coordinator) and state == self._written_state:
+            self.coordinator.suppressed_writes += 1
+            return
+        self._written_state = state
+        super()._handle_coordinator_update()
+
     def _get_device_data(self) -> dict[str, Any] | None:
         """Get device data from coordinator."""
         category = DEVICE_CATEGORY_MAP.get(self._device_type)
@@ -61,3 +105,108 @@ class HiotEntity(CoordinatorEntity["HiotDataUpdateCoordinator"]):
                 value = status.get("value")
                 return str(value) if value is not None else None
         return None
+
+    def _commands_redundant(self, commands: list[dict[str, str]]) -> bool:
+        """Return True if a recent poll shows every command already applied."""
+        return self.coordinator.commands_applied(
+            DEVICE_CATEGORY_MAP[self._device_type], self._device_id, commands
+        )
+
+    async def _async_send_commands(self, commands: list[dict[str, str]]) -> None:
+        """Send control commands and refresh, unless nothing would change.
+
+        If the server is unreachable and the command journal is enabled, the
+        commands are queued for replay and the caller is told so.
+        """
+        category = DEVICE_CATEGORY_MAP[self._device_type]
+        if self._commands_redundant(commands):
+            self.coordinator.skipped_commands += 1
+            self.coordinator.command_journal.async_discard(category, self._device_id, commands)
+            _LOGGER.debug(
+                "Skipping %s commands for %s: state already matches",
+                self._device_type,
+                self._device_id,
+            )
+            return
+        try:
+            await self.coordinator.api_client.async_control_device(
+                category, self._device_id, commands
+            )
+        except SERVER_UNREACHABLE_ERRORS as err:
+            # Replayed once a poll succeeds again
+            if not self.coordinator.journal_commands(category, self._device_id, commands):
+                raise
+            raise HomeAssistantError(
+                "Server unreachable; the command was queued and will be sent when it is back"
+            ) from err
+        self.coordinator.mark_commands_sent(category, self._device_id)
+        self.coordinator.command_journal.async_discard(category, self._device_id, commands)
+        await self.coordinator.async_request_refresh()
+
+
+class HiotGroupEntity(CoordinatorEntity["HiotDataUpdateCoordinator"]):
+    """Base class for entities that control several devices of one category.
+
+    Group state is derived once per poll in ``_update_aggregates``; commands
+    go to all members in one batch followed by a single refresh.
+    """
+
+    _attr_has_entity_name = True
+    _category: str
+
+    def __init__(
+        self,
+        coordinator: HiotDataUpdateCoordinator,
+        entry_id: str,
+        group_key: str,
+        member_ids: list[str],
+    ) -> None:
+        """Initialize the group."""
+        super().__init__(coordinator)
+        self._member_ids = member_ids
+        self._attr_unique_id = f"{entry_id}_{group_key}"
+        # Availability and member statuses behind the last written state
+        self._written_state: tuple[bool, list[dict[str, Any]]] | None = None
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_household")},
+            name="우리집",
+            manufacturer=MANUFACTURER,
+            model="Household",
+        )
+        self._update_aggregates()
+
+    def _member_statuses(self) -> list[dict[str, Any]]:
+        """Return the {command: value} status of each member in the last poll."""
+        return [
+            self.coordinator.status_maps.get((self._category, member_id), {})
+            for member_id in self._member_ids
+        ]
+
+    @abstractmethod
+    def _update_aggregates(self) -> None:
+        """Derive the group state from the members' statuses."""
+
+    def _handle_coordinator_update(self) -> None:
+        """Write state, skipping polls that left every member unchanged if enabled."""
+        state = (self.available, self._member_statuses())
+        if recorder_writes_reduced(self.coordinator) and state == self._written_state:
+            self.coordinator.suppressed_writes += 1
+            return
+        self._written_state = state
+        self._update_aggregates()
+        super()._handle_coordinator_update()
+
+    async def _async_send_to_members(self, commands: list[dict[str, str]]) -> None:
+        """Send the same commands to every member in one batch."""
+        result = await self.coordinator.async_send_commands(
+            {(self._category, member_id): commands for member_id in self._member_ids}
+        )
+        if result.errors:
+            raise HomeAssistantError(
+                f"Failed to control {len(result.errors)} of {len(self._member_ids)} devices"
+            )
+        if result.queued:
+            raise HomeAssistantError(
+                f"Server unreachable; commands for {len(result.queued)} of "
+                f"{len(self._member_ids)} devices were queued and will be sent when it is back"
+            )
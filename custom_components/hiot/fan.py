@@ -14,7 +14,7 @@ from homeassistant.util.percentage import (
     percentage_to_ordered_list_item,
 )
 
-from .const import CATEGORY_FAN, DOMAIN
+from .const import DOMAIN, ORDERED_NAMED_FAN_SPEEDS
 from .coordinator import HiotDataUpdateCoordinator
 from .entity import HiotEntity
 
@@ -26,7 +26,6 @@ def _build_device_name(device: dict, fallback_prefix: str) -> str:
     if location:
         return f"{name} {location}"
     return name
-ORDERED_NAMED_FAN_SPEEDS = ["light", "mid", "pow"]
 
 
 async def async_setup_entry(
@@ -86,20 +85,10 @@ class HiotFan(HiotEntity, FanEntity):
         if percentage is not None and percentage > 0:
             wind = percentage_to_ordered_list_item(ORDERED_NAMED_FAN_SPEEDS, percentage)
             commands.append({"command": "wind", "value": wind})
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_FAN,
-            self._device_id,
-            commands,
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands(commands)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_FAN,
-            self._device_id,
-            [{"command": "power", "value": "off"}],
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands([{"command": "power", "value": "off"}])
 
     async def async_set_percentage(self, percentage: int) -> None:
         if percentage == 0:
@@ -110,9 +99,4 @@ class HiotFan(HiotEntity, FanEntity):
             {"command": "power", "value": "on"},
             {"command": "wind", "value": wind},
         ]
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_FAN,
-            self._device_id,
-            commands,
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands(commands)
@@ -0,0 +1,56 @@
+"""Household-wide counts of powered devices, kept up to date from poll diffs."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .const import (
+    CATEGORY_AIRCON,
+    CATEGORY_GAS,
+    CATEGORY_HEATER,
+    CATEGORY_LIGHT,
+    CATEGORY_WALLSOCKET,
+)
+from .device_diff import DeviceChange
+
+# Aggregate -> device category whose "power" status it follows
+HOUSEHOLD_AGGREGATES = {
+    "lights_on": CATEGORY_LIGHT,
+    "active_heating_zones": CATEGORY_HEATER,
+    "running_aircons": CATEGORY_AIRCON,
+    "open_gas_valves": CATEGORY_GAS,
+    "energised_wall_sockets": CATEGORY_WALLSOCKET,
+}
+
+_AGGREGATE_BY_CATEGORY = {category: name for name, category in HOUSEHOLD_AGGREGATES.items()}
+
+
+class HouseholdAggregates:
+    """Ids of the devices currently powered on, per aggregate.
+
+    Only the devices in a poll's diff are looked at, so an update costs
+    O(changed devices) instead of a pass over the whole household.
+    """
+
+    def __init__(self) -> None:
+        self.members: dict[str, set[str]] = {name: set() for name in HOUSEHOLD_AGGREGATES}
+
+    def apply(self, changes: Iterable[DeviceChange]) -> set[str]:
+        """Apply a poll's device changes; return the aggregates that changed."""
+        changed: set[str] = set()
+        for change in changes:
+            name = _AGGREGATE_BY_CATEGORY.get(change.category)
+            if name is None or "power" not in change.status:
+                continue
+            members = self.members[name]
+            powered = change.status["power"] == "on"
+            if powered != (change.device_id in members):
+                if powered:
+                    members.add(change.device_id)
+                else:
+                    members.discard(change.device_id)
+                changed.add(name)
+        return changed
+
+    def count(self, name: str) -> int:
+        """Return the number of devices in an aggregate."""
+        return len(self.members[name])
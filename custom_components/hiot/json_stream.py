@@ -0,0 +1,167 @@
+"""Incremental extraction of list items from large JSON responses."""
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any
+
+_WHITESPACE = " \t\r\n"
+_STRUCTURAL = re.compile(r'["\[\]{},]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+_SEEK_KEY = 0
+_SEEK_COLON = 1
+_SEEK_ARRAY = 2
+_SEEK_ITEM = 3
+_IN_ITEM = 4
+_DONE = 5
+
+
+class JsonListItemParser:
+    """Decode the items of one JSON array as response chunks arrive.
+
+    Only the array stored under ``list_key`` is parsed. Each item is decoded
+    as soon as its closing bracket arrives and dropped from the buffer, so
+    memory is bounded by the largest single item rather than the response.
+    """
+
+    def __init__(self, list_key: str) -> None:
+        self._marker = json.dumps(list_key)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _SEEK_KEY
+        self._depth = 0
+        self._in_string = False
+
+    @property
+    def done(self) -> bool:
+        """Return True once the end of the array has been reached."""
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk of the response and return the items it completed."""
+        if self._state == _DONE:
+            return []
+        self._buffer += self._decoder.decode(chunk)
+        return self._parse()
+
+    def close(self) -> list[Any]:
+        """Flush the decoder; raise ValueError if an item was left unfinished."""
+        self._buffer += self._decoder.decode(b"", final=True)
+        items = self._parse() if self._state != _DONE else []
+        if self._state in (_SEEK_COLON, _SEEK_ARRAY, _SEEK_ITEM, _IN_ITEM):
+            raise ValueError("Truncated JSON list")
+        return items
+
+    def _skip(self, characters: str) -> bool:
+        """Advance past the given characters; return False if the buffer ran out."""
+        buffer = self._buffer
+        while self._pos < len(buffer) and buffer[self._pos] in characters:
+            self._pos += 1
+        return self._pos < len(buffer)
+
+    def _parse(self) -> list[Any]:
+        items: list[Any] = []
+        while True:
+            if self._state == _SEEK_KEY:
+                index = self._buffer.find(self._marker, self._pos)
+                if index < 0:
+                    # Keep enough of the tail to match a marker split across chunks
+                    self._buffer = self._buffer[-(len(self._marker) - 1) :]
+                    self._pos = 0
+                    return items
+                self._pos = index + len(self._marker)
+                self._state = _SEEK_COLON
+
+            elif self._state == _SEEK_COLON:
+                if not self._skip(_WHITESPACE):
+                    return items
+                # The marker was a string value rather than the key; keep looking
+                if self._buffer[self._pos] == ":":
+                    self._pos += 1
+                    self._state = _SEEK_ARRAY
+                else:
+                    self._state = _SEEK_KEY
+
+            elif self._state == _SEEK_ARRAY:
+                if not self._skip(_WHITESPACE):
+                    return items
+                if self._buffer[self._pos] != "[":
+                    # Not a list under this key (e.g. null); look for another one
+                    self._state = _SEEK_KEY
+                    continue
+                self._pos += 1
+                self._state = _SEEK_ITEM
+
+            elif self._state == _SEEK_ITEM:
+                if not self._skip(_WHITESPACE + ","):
+                    return items
+                if self._buffer[self._pos] == "]":
+                    self._state = _DONE
+                    continue
+                # Drop everything before the item so the buffer stays small
+                self._buffer = self._buffer[self._pos :]
+                self._pos = 0
+                self._depth = 0
+                self._in_string = False
+                self._state = _IN_ITEM
+
+            elif self._state == _IN_ITEM:
+                end = self._scan_item()
+                if end is None:
+                    return items
+                items.append(json.loads(self._buffer[:end]))
+                self._pos = end
+                self._state = _SEEK_ITEM
+
+            else:
+                self._buffer = ""
+                self._pos = 0
+                return items
+
+    def _scan_item(self) -> int | None:
+        """Return the end offset of the item at the buffer start, if complete."""
+        buffer = self._buffer
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, self._pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    return None
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # Wait for the escaped character
+                        self._pos = match.start()
+                        return None
+                    self._pos = match.end() + 1
+                    continue
+                self._in_string = False
+                self._pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                return None
+
+            character = match.group()
+            if character == '"':
+                self._in_string = True
+                self._pos = match.end()
+            elif character in "[{":
+                self._depth += 1
+                self._pos = match.end()
+            elif character in "]}":
+                if self._depth == 0:
+                    # Closing bracket of the list after a scalar item
+                    return match.start()
+                self._depth -= 1
+                self._pos = match.end()
+                if self._depth == 0:
+                    return self._pos
+            elif self._depth == 0:
+                return match.start()
+            else:
+                self._pos = match.end()
@@ -11,7 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CATEGORY_LIGHT, DOMAIN
 from .coordinator import HiotDataUpdateCoordinator
-from .entity import HiotEntity
+from .entity import HiotEntity, HiotGroupEntity, light_group_locations, lights_by_location
 
 
 def _build_device_name(device: dict, fallback_prefix: str) -> str:
@@ -31,7 +31,7 @@ async def async_setup_entry(
     """Set up HT HomeService lights."""
     coordinator: HiotDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    entities = [
+    entities: list[LightEntity] = [
         HiotLight(
             coordinator,
             device["deviceId"],
@@ -42,6 +42,14 @@ async def async_setup_entry(
         if device.get("deviceType") == "light"
     ]
 
+    locations = lights_by_location(coordinator.devices)
+    selected = light_group_locations(entry, coordinator.devices)
+    entities.extend(
+        HiotLightGroup(coordinator, entry.entry_id, f"light_group_{location}", light_ids, location)
+        for location, light_ids in locations.items()
+        if location in selected
+    )
+
     async_add_entities(entities)
 
 
@@ -59,17 +67,40 @@ class HiotLight(HiotEntity, LightEntity):
         return value == "on"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_LIGHT,
-            self._device_id,
-            [{"command": "power", "value": "on"}],
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands([{"command": "power", "value": "on"}])
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_LIGHT,
-            self._device_id,
-            [{"command": "power", "value": "off"}],
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands([{"command": "power", "value": "off"}])
+
+
+class HiotLightGroup(HiotGroupEntity, LightEntity):
+    """All lights of one location, switched together."""
+
+    _category = CATEGORY_LIGHT
+    _attr_icon = "mdi:lightbulb-group"
+    _attr_color_mode = ColorMode.ONOFF
+    _attr_supported_color_modes = {ColorMode.ONOFF}
+
+    def __init__(
+        self,
+        coordinator: HiotDataUpdateCoordinator,
+        entry_id: str,
+        group_key: str,
+        member_ids: list[str],
+        location: str,
+    ) -> None:
+        """Initialize the light group."""
+        self._attr_name = f"{location} 전체 조명"
+        super().__init__(coordinator, entry_id, group_key, member_ids)
+
+    def _update_aggregates(self) -> None:
+        statuses = [status for status in self._member_statuses() if "power" in status]
+        lights_on = sum(status["power"] == "on" for status in statuses)
+        self._attr_is_on = bool(lights_on) if statuses else None
+        self._attr_extra_state_attributes = {"lights_on": lights_on}
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        await self._async_send_to_members([{"command": "power", "value": "on"}])
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        await self._async_send_to_members([{"command": "power", "value": "off"}])
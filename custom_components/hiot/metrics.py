@@ -0,0 +1,167 @@
+"""Request metrics for the HT HomeService API client."""
+from __future__ import annotations
+
+import math
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from .const import (
+    PATH_CTOC_TOKEN,
+    PATH_DEVICES,
+    PATH_DEVICES_WITH_STATUS,
+    PATH_EMS_FEE,
+    PATH_EMS_USAGE,
+    PATH_EMS_USAGE_GOAL,
+    PATH_EMS_USAGE_HISTORY,
+    PATH_HOUSEHOLD,
+    PATH_LOGIN,
+)
+
+METRICS_WINDOW_SIZE = 200
+REAUTH_HISTORY_SIZE = 20
+BATCH_ERROR_HISTORY_SIZE = 50
+
+ENDPOINT_LOGIN = "login"
+ENDPOINT_CTOC = "ctoc"
+ENDPOINT_HOUSEHOLD = "household"
+ENDPOINT_DEVICES = "devices"
+ENDPOINT_BULK_STATUS = "bulk_status"
+ENDPOINT_DEVICE_GET = "device_get"
+ENDPOINT_DEVICE_PUT = "device_put"
+ENDPOINT_EMS_USAGE = "ems_usage"
+ENDPOINT_EMS_FEE = "ems_fee"
+ENDPOINT_EMS_GOAL = "ems_goal"
+ENDPOINT_EMS_HISTORY = "ems_history"
+ENDPOINT_OTHER = "other"
+
+# Endpoints surfaced as diagnostic sensors
+MONITORED_ENDPOINTS = (
+    ENDPOINT_LOGIN,
+    ENDPOINT_CTOC,
+    ENDPOINT_BULK_STATUS,
+    ENDPOINT_DEVICE_PUT,
+    ENDPOINT_EMS_USAGE,
+    ENDPOINT_EMS_FEE,
+    ENDPOINT_EMS_GOAL,
+)
+
+# Longest prefix first so goal/history are not classified as plain usage
+_PATH_ENDPOINTS = (
+    (PATH_EMS_USAGE_GOAL, ENDPOINT_EMS_GOAL),
+    (PATH_EMS_USAGE_HISTORY, ENDPOINT_EMS_HISTORY),
+    (PATH_EMS_USAGE, ENDPOINT_EMS_USAGE),
+    (PATH_EMS_FEE, ENDPOINT_EMS_FEE),
+    (PATH_DEVICES_WITH_STATUS, ENDPOINT_BULK_STATUS),
+    (PATH_DEVICES, ENDPOINT_DEVICES),
+    (PATH_HOUSEHOLD, ENDPOINT_HOUSEHOLD),
+    (PATH_CTOC_TOKEN, ENDPOINT_CTOC),
+    (PATH_LOGIN, ENDPOINT_LOGIN),
+)
+
+
+def classify_endpoint(method: str, path: str) -> str:
+    """Map a request to its logical endpoint name."""
+    for prefix, endpoint in _PATH_ENDPOINTS:
+        if path == prefix or path.startswith(f"{prefix}?"):
+            return endpoint
+
+    if path.startswith("proxy/ctoc/"):
+        return ENDPOINT_DEVICE_PUT if method == "PUT" else ENDPOINT_DEVICE_GET
+
+    return ENDPOINT_OTHER
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float | None:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and rolling latency window for one logical endpoint."""
+
+    requests: int = 0
+    reauths: int = 0
+    last_payload_bytes: int | None = None
+    errors: Counter[str] = field(default_factory=Counter)
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=METRICS_WINDOW_SIZE)
+    )
+
+    @property
+    def error_count(self) -> int:
+        """Return the total number of failed requests."""
+        return sum(self.errors.values())
+
+    def latency_percentile(self, percent: float) -> float | None:
+        """Return a latency percentile in seconds over the rolling window."""
+        return _percentile(sorted(self.latencies), percent)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return a JSON-serialisable snapshot."""
+        latencies = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "reauths": self.reauths,
+            "last_payload_bytes": self.last_payload_bytes,
+            "latency_p50": _percentile(latencies, 50),
+            "latency_p95": _percentile(latencies, 95),
+            "latency_p99": _percentile(latencies, 99),
+            "latency_samples": len(latencies),
+        }
+
+
+class HiotApiMetrics:
+    """Per-endpoint request metrics collected by ``HiotApiClient``."""
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self.reauth_history: deque[dict[str, str]] = deque(maxlen=REAUTH_HISTORY_SIZE)
+        self.batch_errors: deque[dict[str, str]] = deque(maxlen=BATCH_ERROR_HISTORY_SIZE)
+
+    def get(self, endpoint: str) -> EndpointMetrics:
+        """Return metrics for an endpoint, creating an empty record if needed."""
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def record_success(
+        self, endpoint: str, latency: float, payload_bytes: int | None = None
+    ) -> None:
+        """Record a completed request."""
+        metrics = self.get(endpoint)
+        metrics.requests += 1
+        metrics.latencies.append(latency)
+        if payload_bytes is not None:
+            metrics.last_payload_bytes = payload_bytes
+
+    def record_error(self, endpoint: str, error: BaseException, latency: float) -> None:
+        """Record a failed request by exception class."""
+        metrics = self.get(endpoint)
+        metrics.requests += 1
+        metrics.errors[type(error).__name__] += 1
+        metrics.latencies.append(latency)
+
+    def record_reauth(self, endpoint: str) -> None:
+        """Record a 401-triggered re-authentication."""
+        self.get(endpoint).reauths += 1
+        self.reauth_history.append(
+            {"time": datetime.now(UTC).isoformat(), "endpoint": endpoint}
+        )
+
+    def record_batch_error(self, error: dict[str, str]) -> None:
+        """Record a failed item of a batched fan-out."""
+        self.batch_errors.append({"time": datetime.now(UTC).isoformat(), **error})
+
+    def as_dict(self) -> dict[str, dict[str, object]]:
+        """Return a JSON-serialisable snapshot of all endpoints."""
+        return {
+            endpoint: metrics.as_dict()
+            for endpoint, metrics in sorted(self._endpoints.items())
+        }
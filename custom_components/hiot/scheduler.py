@@ -0,0 +1,175 @@
+"""Delayed device commands kept in one persisted timer heap per entry."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.ulid import ulid_now
+
+from .const import DOMAIN
+from .coordinator import HiotDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEDULER_STORAGE_VERSION = 1
+# Coalesce bursts of schedule/dispatch changes into one storage write
+SCHEDULER_SAVE_DELAY = 1
+
+
+def _scheduler_storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.scheduled_commands"
+
+
+async def async_remove_scheduler_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the scheduled commands of a removed entry."""
+    await Store[dict[str, Any]](
+        hass, SCHEDULER_STORAGE_VERSION, _scheduler_storage_key(entry_id)
+    ).async_remove()
+
+
+@dataclass(frozen=True)
+class ScheduledCommand:
+    """Commands for one device, due at a UTC timestamp."""
+
+    id: str
+    due: float
+    category: str
+    device_id: str
+    commands: list[dict[str, str]]
+
+
+def coalesce_commands(
+    scheduled: list[ScheduledCommand],
+) -> dict[tuple[str, str], list[dict[str, str]]]:
+    """Merge commands per device; a later entry wins for the same command."""
+    controls: dict[tuple[str, str], dict[str, dict[str, str]]] = {}
+    for item in scheduled:
+        merged = controls.setdefault((item.category, item.device_id), {})
+        for command in item.commands:
+            merged.pop(command["command"], None)
+            merged[command["command"]] = command
+    return {key: list(merged.values()) for key, merged in controls.items()}
+
+
+class HiotCommandScheduler:
+    """Run device commands at a later time.
+
+    Pending commands live in a min-heap ordered by due time, with a single
+    timer armed for the earliest one, so scheduling costs O(log n) however
+    many commands are waiting. When the timer fires, everything that is due
+    is sent as one batch through the coordinator's control path.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: HiotDataUpdateCoordinator,
+    ) -> None:
+        self.hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._store = Store[dict[str, Any]](
+            hass, SCHEDULER_STORAGE_VERSION, _scheduler_storage_key(entry.entry_id)
+        )
+        self._heap: list[tuple[float, int, ScheduledCommand]] = []
+        self._sequence = itertools.count()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self.runs = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of commands waiting to run."""
+        return len(self._heap)
+
+    @property
+    def next_due(self) -> datetime | None:
+        """Return when the next command is due."""
+        if not self._heap:
+            return None
+        return dt_util.utc_from_timestamp(self._heap[0][0])
+
+    async def async_load(self) -> None:
+        """Restore pending commands and arm the timer; overdue ones run at once."""
+        stored = await self._store.async_load() or {}
+        self._heap = [
+            (item.due, next(self._sequence), item)
+            for item in (ScheduledCommand(**raw) for raw in stored.get("commands", []))
+        ]
+        heapq.heapify(self._heap)
+        self._arm_timer()
+
+    async def async_unload(self) -> None:
+        """Stop the timer and write pending commands."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_schedule(
+        self,
+        category: str,
+        device_id: str,
+        commands: list[dict[str, str]],
+        due: datetime,
+    ) -> ScheduledCommand:
+        """Add commands for one device, due at the given time."""
+        item = ScheduledCommand(
+            id=ulid_now(),
+            due=dt_util.as_utc(due).timestamp(),
+            category=category,
+            device_id=device_id,
+            commands=commands,
+        )
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (item.due, next(self._sequence), item))
+        if earliest is None or item.due < earliest:
+            self._arm_timer()
+        self._store.async_delay_save(self._data_to_save, SCHEDULER_SAVE_DELAY)
+        return item
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"commands": [asdict(item) for _, _, item in sorted(self._heap)]}
+
+    @callback
+    def _arm_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._heap:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._async_timer_fired, dt_util.utc_from_timestamp(self._heap[0][0])
+            )
+
+    @callback
+    def _async_timer_fired(self, now: datetime) -> None:
+        self._unsub_timer = None
+        self._entry.async_create_background_task(
+            self.hass, self._async_run_due(), f"{DOMAIN} scheduled commands"
+        )
+
+    async def _async_run_due(self) -> None:
+        """Send every due command in one batch, then re-arm for the next."""
+        now = dt_util.utcnow().timestamp()
+        due: list[ScheduledCommand] = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        self._arm_timer()
+        if not due:
+            return
+
+        self._store.async_delay_save(self._data_to_save, SCHEDULER_SAVE_DELAY)
+        self.runs += 1
+        result = await self._coordinator.async_send_commands(coalesce_commands(due))
+        for error in result.errors.values():
+            _LOGGER.warning("Scheduled command for %s failed: %s", error.as_dict()["key"], error.message)
@@ -2,34 +2,43 @@
 """Sensor platform for HT HomeService."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ENERGY_TYPES, MANUFACTURER
-from .coordinator import HiotEnergyCoordinator
-
-
-ENERGY_METRICS = ("usage", "fee", "goal", "same_area_usage")
+from .const import (
+    DEVICE_CATEGORY_MAP,
+    DOMAIN,
+    ENERGY_LABELS,
+    ENERGY_TYPES,
+    ENERGY_UNITS,
+    MANUFACTURER,
+)
+from .coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
+from .energy_projection import PROJECTION_METRICS
+from .energy_store import HiotEnergyStore
+from .energy_view import EnergyView
+from .entity import recorder_writes_reduced
+from .household import HOUSEHOLD_AGGREGATES
+from .metrics import MONITORED_ENDPOINTS
+
+
+ENERGY_METRICS = ("usage", "fee", "goal", "same_area_usage", "daily_usage")
 
 METRIC_LABELS = {
     "usage": "사용량",
     "fee": "요금",
     "goal": "목표",
     "same_area_usage": "동일평형 사용량",
-}
-
-METRIC_DATA_FIELDS = {
-    "usage": "usage",
-    "fee": "fee",
-    "goal": "goal",
-    "same_area_usage": "sameAreaTypeUsage",
+    "daily_usage": "오늘 사용량",
 }
 
 METRIC_ICONS = {
@@ -53,6 +62,11 @@ METRIC_ICONS = {
         "WATER": "mdi:home-group-plus",
         "GAS": "mdi:home-group-plus",
     },
+    "daily_usage": {
+        "ELEC": "mdi:calendar-today",
+        "WATER": "mdi:calendar-today",
+        "GAS": "mdi:calendar-today",
+    },
 }
 
 METRIC_STATE_CLASSES = {
@@ -60,12 +74,7 @@ METRIC_STATE_CLASSES = {
     "fee": SensorStateClass.TOTAL,
     "goal": None,
     "same_area_usage": SensorStateClass.TOTAL,
-}
-
-ENERGY_LABELS = {
-    "ELEC": "전기",
-    "WATER": "수도",
-    "GAS": "가스",
+    "daily_usage": SensorStateClass.TOTAL,
 }
 
 ENERGY_DEVICE_CLASSES = {
@@ -74,30 +83,121 @@ ENERGY_DEVICE_CLASSES = {
     "GAS": SensorDeviceClass.GAS,
 }
 
-ENERGY_UNITS = {
-    "ELEC": "kWh",
-    "WATER": "m³",
-    "GAS": "m³",
+PROJECTION_LABELS = {
+    "average_daily_usage": "이번 달 일평균 사용량",
+    "projected_usage": "월말 예상 사용량",
+    "projected_fee": "월말 예상 요금",
+    "projected_goal_percent": "월말 예상 목표 대비",
+}
+
+PROJECTION_ICONS = {
+    "average_daily_usage": "mdi:chart-line",
+    "projected_usage": "mdi:chart-timeline-variant",
+    "projected_fee": "mdi:cash-clock",
+    "projected_goal_percent": "mdi:target-variant",
+}
+
+# Comparison -> the readings it is computed from, shown as attributes
+COMPARISON_METRICS = {
+    "year_over_year_change": ("month_to_date", "same_period_last_year"),
+    "day_over_day_change": ("today", "yesterday"),
+}
+
+COMPARISON_LABELS = {
+    "year_over_year_change": "전년 동기 대비 사용량",
+    "day_over_day_change": "전일 대비 사용량",
+}
+
+COMPARISON_ICONS = {
+    "year_over_year_change": "mdi:calendar-compare",
+    "day_over_day_change": "mdi:compare-horizontal",
 }
 
-ENERGY_CONVERSION_DIVISORS = {
-    "ELEC": 1000.0,
-    "WATER": 1000.0,
-    "GAS": 1000.0,
+HOUSEHOLD_LABELS = {
+    "lights_on": "켜진 조명",
+    "active_heating_zones": "난방 중인 구역",
+    "running_aircons": "가동 중인 에어컨",
+    "open_gas_valves": "열린 가스 밸브",
+    "energised_wall_sockets": "전원 켜진 대기전력 콘센트",
 }
 
+HOUSEHOLD_ICONS = {
+    "lights_on": "mdi:lightbulb-group",
+    "active_heating_zones": "mdi:radiator",
+    "running_aircons": "mdi:air-conditioner",
+    "open_gas_valves": "mdi:valve-open",
+    "energised_wall_sockets": "mdi:power-socket-eu",
+}
+
+
+API_METRICS = ("requests", "errors", "reauths", "latency_p50", "latency_p95")
+
+API_ENDPOINT_LABELS = {
+    "login": "Login",
+    "ctoc": "CTOC token",
+    "bulk_status": "Bulk status",
+    "device_put": "Device control",
+    "ems_usage": "EMS usage",
+    "ems_fee": "EMS fee",
+    "ems_goal": "EMS goal",
+}
+
+API_METRIC_LABELS = {
+    "requests": "requests",
+    "errors": "errors",
+    "reauths": "re-authentications",
+    "latency_p50": "latency p50",
+    "latency_p95": "latency p95",
+}
+
+
+def _build_device_name(device: dict, fallback_prefix: str) -> str:
+    """Build a device name including location for uniqueness."""
+    name = device.get("deviceName", f"{fallback_prefix} {device.get('deviceId', '')}")
+    location = device.get("deviceLocation", "")
+    if location:
+        return f"{name} {location}"
+    return name
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up HT HomeService sensors."""
-    coordinator: HiotEnergyCoordinator = hass.data[DOMAIN][entry.entry_id]["energy_coordinator"]
-    entities = [
-        HiotEnergySensor(coordinator, entry.entry_id, energy_type, metric)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    energy_coordinator: HiotEnergyCoordinator = entry_data["energy_coordinator"]
+    entities: list[SensorEntity] = [
+        HiotEnergySensor(energy_coordinator, entry.entry_id, energy_type, metric)
         for energy_type in ENERGY_TYPES
         for metric in ENERGY_METRICS
     ]
+
+    entities.extend(
+        HiotEnergyProjectionSensor(energy_coordinator, entry.entry_id, energy_type, metric)
+        for energy_type in ENERGY_TYPES
+        for metric in PROJECTION_METRICS
+    )
+
+    energy_store: HiotEnergyStore | None = entry_data.get("energy_store")
+    if energy_store is not None:
+        entities.extend(
+            HiotEnergyComparisonSensor(energy_store, entry.entry_id, energy_type, metric)
+            for energy_type in ENERGY_TYPES
+            for metric in COMPARISON_METRICS
+        )
+
+    coordinator: HiotDataUpdateCoordinator = entry_data["coordinator"]
+    entities.extend(
+        HiotHouseholdSensor(coordinator, entry.entry_id, aggregate)
+        for aggregate in HOUSEHOLD_AGGREGATES
+    )
+    entities.extend(
+        HiotApiMetricSensor(coordinator, entry.entry_id, endpoint, metric)
+        for endpoint in MONITORED_ENDPOINTS
+        for metric in API_METRICS
+    )
     async_add_entities(entities)
 
 
@@ -105,6 +205,8 @@ class HiotEnergySensor(CoordinatorEntity[HiotEnergyCoordinator], SensorEntity):
     """Energy sensor entity for apartment-level usage and fee data."""
 
     _attr_has_entity_name = True
+    # Changes with every update and is recorded by the same-area usage sensor
+    _unrecorded_attributes = frozenset({"sameAreaTypeUsage"})
 
     def __init__(
         self,
@@ -142,74 +244,292 @@ class HiotEnergySensor(CoordinatorEntity[HiotEnergyCoordinator], SensorEntity):
         if METRIC_STATE_CLASSES[metric] is not None:
             self._attr_state_class = METRIC_STATE_CLASSES[metric]
 
+        self._attr_native_value = None
+        self._attr_last_reset = None
+        self._attr_extra_state_attributes = {}
         self._refresh_state_from_coordinator()
+        self._written_available = self.available
 
-    def _get_metric_data(self) -> dict[str, Any]:
-        """Return metric data from coordinator cache."""
-        if not self.coordinator.data:
-            return {}
+    def _get_last_reset(self, view: EnergyView) -> datetime | None:
+        """Return the start of the day or month the reported total belongs to."""
+        if METRIC_STATE_CLASSES[self._metric] is None:
+            return None
+        if self._metric == "daily_usage":
+            return view.day_start
+        return view.month_start
+
+    def _refresh_state_from_coordinator(self) -> bool:
+        """Read this sensor's values from the shared view; return True if changed."""
+        view = self.coordinator.energy_view
+        native_value = view.value(self._energy_type, self._metric)
+        last_reset = self._get_last_reset(view)
+        extra_attributes: dict[str, Any] = {}
+        if self._metric == "usage":
+            same_area_usage = view.value(self._energy_type, "same_area_usage")
+            if same_area_usage is not None:
+                extra_attributes = {"sameAreaTypeUsage": same_area_usage}
+
+        changed = (
+            native_value != self._attr_native_value
+            or last_reset != self._attr_last_reset
+            or extra_attributes != self._attr_extra_state_attributes
+        )
+        self._attr_native_value = native_value
+        self._attr_last_reset = last_reset
+        self._attr_extra_state_attributes = extra_attributes
+        return changed
 
-        type_data = self.coordinator.data.get(self._energy_type)
-        if not isinstance(type_data, dict):
-            return {}
+    def _handle_coordinator_update(self) -> None:
+        changed = self._refresh_state_from_coordinator()
+        if changed or self.available != self._written_available:
+            self._written_available = self.available
+            self.async_write_ha_state()
+        else:
+            self.coordinator.suppressed_writes += 1
 
-        if self._metric == "same_area_usage":
-            metric_data = type_data.get("usage")
-            if isinstance(metric_data, dict):
-                return metric_data
-            return {}
 
-        metric_data = type_data.get(self._metric)
-        if not isinstance(metric_data, dict):
-            return {}
+class HiotEnergyProjectionSensor(CoordinatorEntity[HiotEnergyCoordinator], SensorEntity):
+    """Month-end projection derived from month-to-date usage and fee."""
 
-        return metric_data
+    _attr_has_entity_name = True
 
-    def _normalize_numeric_value(self, raw_value: Any) -> float | int | None:
-        """Convert API raw value to sensor native units."""
-        if raw_value is None:
-            return None
+    def __init__(
+        self,
+        coordinator: HiotEnergyCoordinator,
+        entry_id: str,
+        energy_type: str,
+        metric: str,
+    ) -> None:
+        """Initialize projection sensor."""
+        super().__init__(coordinator)
+        self._energy_type = energy_type
+        self._metric = metric
 
-        try:
-            numeric_value = float(raw_value)
-        except (TypeError, ValueError):
-            return None
+        self._attr_unique_id = f"{entry_id}_energy_{energy_type.lower()}_{metric}"
+        self._attr_name = f"{ENERGY_LABELS[energy_type]} {PROJECTION_LABELS[metric]}"
+        self._attr_icon = PROJECTION_ICONS[metric]
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_energy")},
+            name="에너지 모니터링",
+            manufacturer=MANUFACTURER,
+            model="Energy Monitor",
+        )
+
+        # Estimates are not meter totals, so no energy/water/gas device class
+        if metric == "projected_fee":
+            self._attr_device_class = SensorDeviceClass.MONETARY
+            self._attr_native_unit_of_measurement = "KRW"
+        elif metric == "projected_goal_percent":
+            self._attr_native_unit_of_measurement = PERCENTAGE
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_native_unit_of_measurement = ENERGY_UNITS[energy_type]
+            self._attr_state_class = SensorStateClass.MEASUREMENT
 
-        if self._metric == "fee":
-            return int(numeric_value)
+        self._attr_native_value = self._projected_value()
+        self._written_available = self.available
 
-        if self._metric not in ("usage", "goal", "same_area_usage"):
-            return numeric_value
+    def _projected_value(self) -> float | int | None:
+        return self.coordinator.projections[self._energy_type].value(self._metric)
 
-        divisor = ENERGY_CONVERSION_DIVISORS[self._energy_type]
-        converted_value = numeric_value / divisor
+    def _handle_coordinator_update(self) -> None:
+        native_value = self._projected_value()
+        if (
+            native_value == self._attr_native_value
+            and self.available == self._written_available
+            and recorder_writes_reduced(self.coordinator)
+        ):
+            self.coordinator.suppressed_writes += 1
+            return
+        self._attr_native_value = native_value
+        self._written_available = self.available
+        self.async_write_ha_state()
 
-        if converted_value.is_integer():
-            return int(converted_value)
 
-        return round(converted_value, 3)
+class HiotEnergyComparisonSensor(SensorEntity):
+    """Usage change against an earlier period, answered by the local energy store."""
 
-    def _get_native_value(self) -> float | int | None:
-        metric_data = self._get_metric_data()
-        data_field = METRIC_DATA_FIELDS[self._metric]
-        return self._normalize_numeric_value(metric_data.get(data_field))
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _get_extra_state_attributes(self) -> dict[str, Any] | None:
-        if self._metric != "usage":
-            return None
+    def __init__(
+        self,
+        energy_store: HiotEnergyStore,
+        entry_id: str,
+        energy_type: str,
+        metric: str,
+    ) -> None:
+        """Initialize comparison sensor."""
+        self._energy_store = energy_store
+        self._energy_type = energy_type
+        self._metric = metric
 
-        metric_data = self._get_metric_data()
-        same_area_usage = self._normalize_numeric_value(metric_data.get("sameAreaTypeUsage"))
-        if same_area_usage is None:
-            return None
+        self._attr_unique_id = f"{entry_id}_energy_{energy_type.lower()}_{metric}"
+        self._attr_name = f"{ENERGY_LABELS[energy_type]} {COMPARISON_LABELS[metric]}"
+        self._attr_icon = COMPARISON_ICONS[metric]
+        self._attr_native_unit_of_measurement = ENERGY_UNITS[energy_type]
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_energy")},
+            name="에너지 모니터링",
+            manufacturer=MANUFACTURER,
+            model="Energy Monitor",
+        )
+        self._attr_extra_state_attributes = {}
+        self._refresh_state_from_store()
+
+    def _refresh_state_from_store(self) -> bool:
+        """Read this sensor's comparison; return True if it changed."""
+        comparison = self._energy_store.comparisons.get(self._energy_type, {})
+        native_value = comparison.get(self._metric)
+        extra_attributes = {key: comparison.get(key) for key in COMPARISON_METRICS[self._metric]}
+        changed = (
+            native_value != self._attr_native_value
+            or extra_attributes != self._attr_extra_state_attributes
+        )
+        self._attr_native_value = native_value
+        self._attr_extra_state_attributes = extra_attributes
+        return changed
 
-        return {"sameAreaTypeUsage": same_area_usage}
+    async def async_added_to_hass(self) -> None:
+        """Follow the store's comparisons."""
+        self.async_on_remove(self._energy_store.async_add_listener(self._handle_store_update))
 
-    def _refresh_state_from_coordinator(self) -> None:
-        self._attr_native_value = self._get_native_value()
-        extra_attributes = self._get_extra_state_attributes()
-        self._attr_extra_state_attributes = extra_attributes or {}
+    @callback
+    def _handle_store_update(self) -> None:
+        if self._refresh_state_from_store():
+            self.async_write_ha_state()
 
-    def _handle_coordinator_update(self) -> None:
+
+class HiotHouseholdSensor(CoordinatorEntity[HiotDataUpdateCoordinator], SensorEntity):
+    """Number of household devices of one kind that are powered on."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: HiotDataUpdateCoordinator,
+        entry_id: str,
+        aggregate: str,
+    ) -> None:
+        """Initialize household sensor."""
+        super().__init__(coordinator)
+        self._aggregate = aggregate
+        self._category = HOUSEHOLD_AGGREGATES[aggregate]
+        self._device_names = {
+            device["deviceId"]: _build_device_name(device, device.get("deviceType") or "Device")
+            for device in coordinator.devices
+            if DEVICE_CATEGORY_MAP.get(device.get("deviceType", "")) == self._category
+        }
+
+        self._attr_unique_id = f"{entry_id}_household_{aggregate}"
+        self._attr_name = HOUSEHOLD_LABELS[aggregate]
+        self._attr_icon = HOUSEHOLD_ICONS[aggregate]
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_household")},
+            name="우리집",
+            manufacturer=MANUFACTURER,
+            model="Household",
+        )
+
+        self._members: tuple[str, ...] | None = None
         self._refresh_state_from_coordinator()
+        self._written_available = self.available
+
+    def _refresh_state_from_coordinator(self) -> bool:
+        """Read the aggregate's members; return True if they changed."""
+        members = tuple(sorted(self.coordinator.household.members[self._aggregate]))
+        if members == self._members:
+            return False
+        self._members = members
+        self._attr_native_value = len(members)
+        self._attr_extra_state_attributes = {
+            "devices": [self._device_names.get(device_id, device_id) for device_id in members]
+        }
+        return True
+
+    def _handle_coordinator_update(self) -> None:
+        changed = self._refresh_state_from_coordinator()
+        if (
+            not changed
+            and self.available == self._written_available
+            and recorder_writes_reduced(self.coordinator)
+        ):
+            self.coordinator.suppressed_writes += 1
+            return
+        self._written_available = self.available
+        self.async_write_ha_state()
+
+
+class HiotApiMetricSensor(CoordinatorEntity[HiotDataUpdateCoordinator], SensorEntity):
+    """Diagnostic sensor exposing request metrics for one API endpoint."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: HiotDataUpdateCoordinator,
+        entry_id: str,
+        endpoint: str,
+        metric: str,
+    ) -> None:
+        """Initialize API metric sensor."""
+        super().__init__(coordinator)
+        self._endpoint = endpoint
+        self._metric = metric
+
+        self._attr_unique_id = f"{entry_id}_api_{endpoint}_{metric}"
+        self._attr_name = f"{API_ENDPOINT_LABELS[endpoint]} {API_METRIC_LABELS[metric]}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_api")},
+            name="HT HomeService API",
+            manufacturer=MANUFACTURER,
+            model="Cloud API",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+        if metric.startswith("latency_"):
+            self._attr_icon = "mdi:timer-outline"
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_icon = "mdi:alert-circle-outline" if metric == "errors" else "mdi:counter"
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+        self._attr_native_value = None
+        self._attr_extra_state_attributes = {}
+        self._refresh_state_from_client()
+        self._written_available = self.available
+
+    def _refresh_state_from_client(self) -> bool:
+        """Read this sensor's values from the client metrics; return True if changed."""
+        metrics = self.coordinator.api_client.metrics.get(self._endpoint)
+        previous = (self._attr_native_value, self._attr_extra_state_attributes)
+
+        if self._metric == "requests":
+            self._attr_native_value = metrics.requests
+        elif self._metric == "errors":
+            self._attr_native_value = metrics.error_count
+            self._attr_extra_state_attributes = dict(metrics.errors)
+        elif self._metric == "reauths":
+            self._attr_native_value = metrics.reauths
+        else:
+            latency = metrics.latency_percentile(float(self._metric.removeprefix("latency_p")))
+            self._attr_native_value = None if latency is None else round(latency * 1000, 1)
+        return previous != (self._attr_native_value, self._attr_extra_state_attributes)
+
+    def _handle_coordinator_update(self) -> None:
+        changed = self._refresh_state_from_client()
+        if (
+            not changed
+            and self.available == self._written_available
+            and recorder_writes_reduced(self.coordinator)
+        ):
+            self.coordinator.suppressed_writes += 1
+            return
+        self._written_available = self.available
         self.async_write_ha_state()
@@ -0,0 +1,166 @@
+"""Services for HT HomeService."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, time, timedelta
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    AIRCON_MAX_TEMP,
+    AIRCON_MIN_TEMP,
+    AIRCON_MODE_MAP,
+    AIRCON_WIND_MAP,
+    CATEGORY_AIRCON,
+    CATEGORY_FAN,
+    CATEGORY_GAS,
+    CATEGORY_HEATER,
+    CATEGORY_LIGHT,
+    CATEGORY_WALLSOCKET,
+    DEVICE_CATEGORY_MAP,
+    DOMAIN,
+    HEATER_MAX_TEMP,
+    HEATER_MIN_TEMP,
+    ORDERED_NAMED_FAN_SPEEDS,
+)
+from .scheduler import HiotCommandScheduler
+
+SERVICE_SCHEDULE_COMMAND = "schedule_command"
+
+ATTR_COMMAND = "command"
+ATTR_VALUE = "value"
+ATTR_DELAY = "delay"
+ATTR_AT = "at"
+
+SCHEDULE_COMMAND_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+            vol.Required(ATTR_COMMAND): cv.string,
+            vol.Required(ATTR_VALUE): cv.string,
+            vol.Exclusive(ATTR_DELAY, "when"): cv.positive_time_period,
+            vol.Exclusive(ATTR_AT, "when"): vol.Any(cv.datetime, cv.time),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_DELAY, ATTR_AT),
+)
+
+
+def _temperature(minimum: int, maximum: int) -> Callable[[Any], str]:
+    """Validate a target temperature and send it as whole degrees, like the climate entities."""
+    return vol.All(
+        vol.Coerce(float),
+        vol.Range(min=minimum, max=maximum),
+        lambda value: str(int(value)),
+    )
+
+
+_POWER = vol.In(["on", "off"])
+
+# Commands the service may schedule, with the values each one accepts
+SCHEDULABLE_COMMANDS: dict[str, dict[str, Callable[[Any], str]]] = {
+    CATEGORY_LIGHT: {"power": _POWER},
+    CATEGORY_WALLSOCKET: {"power": _POWER},
+    CATEGORY_HEATER: {
+        "power": _POWER,
+        "setTemperature": _temperature(HEATER_MIN_TEMP, HEATER_MAX_TEMP),
+    },
+    CATEGORY_AIRCON: {
+        "power": _POWER,
+        "mode": vol.In(list(AIRCON_MODE_MAP)),
+        "wind": vol.In(list(AIRCON_WIND_MAP)),
+        "setTemperature": _temperature(AIRCON_MIN_TEMP, AIRCON_MAX_TEMP),
+    },
+    CATEGORY_FAN: {"power": _POWER, "wind": vol.In(ORDERED_NAMED_FAN_SPEEDS)},
+    # Gas valves can only be closed remotely
+    CATEGORY_GAS: {"power": vol.In(["off"], msg="opening a gas valve remotely is not supported")},
+}
+
+
+def _validate_command(entity_id: str, category: str, command: str, value: str) -> str:
+    """Return the value to send, or raise if the device does not accept it."""
+    validator = SCHEDULABLE_COMMANDS.get(category, {}).get(command)
+    if validator is None:
+        raise ServiceValidationError(f"{entity_id} does not support the command {command!r}")
+    try:
+        return validator(value)
+    except vol.Invalid as err:
+        raise ServiceValidationError(
+            f"Invalid value {value!r} for {command} of {entity_id}: {err.msg}"
+        ) from err
+
+
+def _resolve_device(hass: HomeAssistant, entity_id: str) -> tuple[dict[str, Any], str, str]:
+    """Return (entry data, category, device id) of the device behind an entity."""
+    entity_entry = er.async_get(hass).async_get(entity_id)
+    if entity_entry is None or entity_entry.platform != DOMAIN:
+        raise ServiceValidationError(f"{entity_id} is not an HT HomeService entity")
+    entry_data: dict[str, Any] | None = hass.data.get(DOMAIN, {}).get(
+        entity_entry.config_entry_id
+    )
+    if entry_data is None:
+        raise ServiceValidationError(f"The config entry of {entity_id} is not loaded")
+
+    device_entry = (
+        dr.async_get(hass).async_get(entity_entry.device_id) if entity_entry.device_id else None
+    )
+    identifiers = (
+        {identifier for domain, identifier in device_entry.identifiers if domain == DOMAIN}
+        if device_entry is not None
+        else set()
+    )
+    for device in entry_data["coordinator"].devices:
+        category = DEVICE_CATEGORY_MAP.get(device.get("deviceType", ""))
+        if category and f"{entity_entry.config_entry_id}_{device['deviceId']}" in identifiers:
+            return entry_data, category, device["deviceId"]
+    raise ServiceValidationError(f"{entity_id} does not control a single device")
+
+
+def _due_time(data: dict[str, Any]) -> datetime:
+    """Return when a command is due; a bare time means its next occurrence."""
+    now = dt_util.now()
+    if ATTR_DELAY in data:
+        delay: timedelta = data[ATTR_DELAY]
+        return now + delay
+    at: datetime | time = data[ATTR_AT]
+    if isinstance(at, datetime):
+        return at if at.tzinfo is not None else at.replace(tzinfo=dt_util.get_default_time_zone())
+    due = datetime.combine(now.date(), at, tzinfo=now.tzinfo)
+    return due if due > now else due + timedelta(days=1)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def _async_schedule_command(call: ServiceCall) -> ServiceResponse:
+        entity_id: str = call.data[ATTR_ENTITY_ID]
+        entry_data, category, device_id = _resolve_device(hass, entity_id)
+        command: str = call.data[ATTR_COMMAND]
+        value = _validate_command(entity_id, category, command, call.data[ATTR_VALUE])
+        scheduler: HiotCommandScheduler = entry_data["scheduler"]
+        item = scheduler.async_schedule(
+            category,
+            device_id,
+            [{"command": command, "value": value}],
+            _due_time(call.data),
+        )
+        if not call.return_response:
+            return None
+        return {"id": item.id, "due": dt_util.utc_from_timestamp(item.due).isoformat()}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SCHEDULE_COMMAND,
+        _async_schedule_command,
+        schema=SCHEDULE_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -10,7 +10,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CATEGORY_GAS, CATEGORY_WALLSOCKET, DOMAIN
+from .const import DOMAIN
 from .coordinator import HiotDataUpdateCoordinator
 from .entity import HiotEntity
 
@@ -68,12 +68,7 @@ class HiotGasValve(HiotEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Shut off the gas valve."""
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_GAS,
-            self._device_id,
-            [{"command": "power", "value": "off"}],
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands([{"command": "power", "value": "off"}])
 
 
 class HiotWallSocket(HiotEntity, SwitchEntity):
@@ -91,18 +86,8 @@ class HiotWallSocket(HiotEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the outlet."""
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_WALLSOCKET,
-            self._device_id,
-            [{"command": "power", "value": "on"}],
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands([{"command": "power", "value": "on"}])
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the outlet (cut standby power)."""
-        await self.coordinator.api_client.async_control_device(
-            CATEGORY_WALLSOCKET,
-            self._device_id,
-            [{"command": "power", "value": "off"}],
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_send_commands([{"command": "power", "value": "off"}])
@@ -0,0 +1,163 @@
+"""WebSocket commands for HT HomeService."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, ENERGY_TYPES
+from .coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
+from .device_diff import StatusMaps
+from .energy_view import METRIC_SOURCES
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the snapshot commands."""
+    websocket_api.async_register_command(hass, websocket_snapshot)
+    websocket_api.async_register_command(hass, websocket_subscribe_snapshot)
+
+
+def _devices_payload(status_maps: StatusMaps) -> dict[str, dict[str, dict[str, Any]]]:
+    """Group {command: value} status maps by category and device id."""
+    devices: dict[str, dict[str, dict[str, Any]]] = {}
+    for (category, device_id), statuses in status_maps.items():
+        devices.setdefault(category, {})[device_id] = statuses
+    return devices
+
+
+def _energy_payload(energy_coordinator: HiotEnergyCoordinator) -> dict[str, Any]:
+    """Return the normalised energy values with the period they belong to."""
+    view = energy_coordinator.energy_view
+    return {
+        "month": energy_coordinator.data_month,
+        "day": energy_coordinator.data_day,
+        "values": {
+            energy_type: {metric: view.value(energy_type, metric) for metric in METRIC_SOURCES}
+            for energy_type in ENERGY_TYPES
+        },
+    }
+
+
+def _energy_changes(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Return the period keys and metric values that differ between payloads."""
+    changes = {key: current[key] for key in ("month", "day") if current[key] != previous[key]}
+    values = {
+        energy_type: changed
+        for energy_type, metrics in current["values"].items()
+        if (
+            changed := {
+                metric: value
+                for metric, value in metrics.items()
+                if previous["values"][energy_type].get(metric) != value
+            }
+        )
+    }
+    if values:
+        changes["values"] = values
+    return changes
+
+
+def _snapshot(
+    coordinator: HiotDataUpdateCoordinator, energy_coordinator: HiotEnergyCoordinator
+) -> dict[str, Any]:
+    return {
+        "devices": _devices_payload(coordinator.status_maps),
+        "energy": _energy_payload(energy_coordinator),
+    }
+
+
+def _get_entry_data(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Return the loaded entry's data, or send a not-found error."""
+    entry_data: dict[str, Any] | None = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if entry_data is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not found or not loaded"
+        )
+    return entry_data
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hiot/snapshot",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_snapshot(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return all device states and the energy view of an entry."""
+    entry_data = _get_entry_data(hass, connection, msg)
+    if entry_data is None:
+        return
+    connection.send_result(
+        msg["id"], _snapshot(entry_data["coordinator"], entry_data["energy_coordinator"])
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hiot/snapshot/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_snapshot(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send the snapshot once, then only what each poll changed."""
+    entry_data = _get_entry_data(hass, connection, msg)
+    if entry_data is None:
+        return
+    coordinator: HiotDataUpdateCoordinator = entry_data["coordinator"]
+    energy_coordinator: HiotEnergyCoordinator = entry_data["energy_coordinator"]
+    # Listeners also run for failed polls; only forward data not sent yet
+    sent_data = coordinator.data
+    sent_energy = _energy_payload(energy_coordinator)
+
+    @callback
+    def _forward_device_changes() -> None:
+        nonlocal sent_data
+        if coordinator.data is sent_data or not coordinator.last_update_success:
+            return
+        sent_data = coordinator.data
+        if coordinator.last_changes:
+            connection.send_message(
+                websocket_api.event_message(
+                    msg["id"],
+                    {"changes": [change.as_dict() for change in coordinator.last_changes]},
+                )
+            )
+
+    @callback
+    def _forward_energy_changes() -> None:
+        nonlocal sent_energy
+        current = _energy_payload(energy_coordinator)
+        changes = _energy_changes(sent_energy, current)
+        sent_energy = current
+        if changes:
+            connection.send_message(websocket_api.event_message(msg["id"], {"energy": changes}))
+
+    unsubscribers = [
+        coordinator.async_add_listener(_forward_device_changes),
+        energy_coordinator.async_add_listener(_forward_energy_changes),
+    ]
+
+    @callback
+    def _unsubscribe() -> None:
+        for unsubscribe in unsubscribers:
+            unsubscribe()
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"], {"snapshot": _snapshot(coordinator, energy_coordinator)}
+        )
+    )
@@ -20,6 +20,8 @@ from custom_components.hiot.const import (
     CONF_SITE_NAME,
     DOMAIN,
 )
+from custom_components.hiot.api import HiotBatchItemError, HiotBatchResult
+from custom_components.hiot.metrics import HiotApiMetrics
 
 MOCK_CONFIG_DATA = {
     CONF_USERNAME: "testuser",
@@ -95,21 +97,51 @@ def mock_api_client() -> AsyncMock:
                 "usage": {"usage": 64400, "sameAreaTypeUsage": 123000},
                 "fee": {"fee": 7860},
                 "goal": {"goal": 400000},
+                "daily_usage": {"usage": 2100},
             },
             "WATER": {
                 "usage": {"usage": 22800, "sameAreaTypeUsage": 20000},
                 "fee": {"fee": 28500},
                 "goal": {"goal": 200000},
+                "daily_usage": {"usage": 700},
             },
             "GAS": {
                 "usage": {"usage": 72500, "sameAreaTypeUsage": 60000},
                 "fee": {"fee": 0},
                 "goal": {"goal": 200000},
+                "daily_usage": {"usage": 2300},
             },
         }
     )
     client.async_control_device = AsyncMock(return_value={})
+
+    async def _control_devices(controls, **kwargs):
+        result = HiotBatchResult()
+        for (category, device_id), commands in controls.items():
+            try:
+                result.results[(category, device_id)] = await client.async_control_device(
+                    category, device_id, commands
+                )
+            except Exception as err:  # noqa: BLE001
+                result.errors[(category, device_id)] = HiotBatchItemError.from_exception(
+                    (category, device_id), err
+                )
+        return result
+
+    client.async_control_devices = AsyncMock(side_effect=_control_devices)
+
+    async def _run_batch(jobs, **kwargs):
+        result = HiotBatchResult()
+        for key, job in jobs.items():
+            try:
+                result.results[key] = await job()
+            except Exception as err:  # noqa: BLE001
+                result.errors[key] = HiotBatchItemError.from_exception(key, err)
+        return result
+
+    client.async_run_batch = AsyncMock(side_effect=_run_batch)
     client.async_close = AsyncMock()
+    client.metrics = HiotApiMetrics()
     client.get_category_for_device_type = MagicMock(
         side_effect=lambda t: {
             "light": "lights",
@@ -0,0 +1,456 @@
+"""Local stand-in for the HT HomeService cloud API.
+
+Serves the subset of endpoints used by ``HiotApiClient`` from memory so the
+client and coordinators can be exercised offline, with configurable household
+count, device count, latency and fault injection.
+
+Run standalone with::
+
+    python -m tests.simulator --households 10 --devices 50 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from aiohttp import web
+
+from custom_components.hiot.const import (
+    DEVICE_CATEGORY_MAP,
+    ENERGY_TYPES,
+    PATH_CTOC_TOKEN,
+    PATH_DEVICES,
+    PATH_EMS_FEE,
+    PATH_EMS_USAGE,
+    PATH_EMS_USAGE_GOAL,
+    PATH_EMS_USAGE_HISTORY,
+    PATH_HOUSEHOLD,
+    PATH_LOGIN,
+)
+
+SESSION_COOKIE = "SESSION"
+
+DEVICE_TYPE_CYCLE = ("light", "heating", "fan", "gas", "aircon", "wallsocket")
+
+DEFAULT_STATUS: dict[str, dict[str, str]] = {
+    "light": {"power": "off"},
+    "heating": {"power": "off", "currTemperature": "22", "setTemperature": "24"},
+    "fan": {"power": "off", "wind": "stop"},
+    "gas": {"power": "on"},
+    "aircon": {
+        "power": "off",
+        "mode": "cool",
+        "wind": "auto",
+        "currTemperature": "26",
+        "setTemperature": "24",
+    },
+    "wallsocket": {"power": "on", "currentWatt": "5"},
+}
+
+ENERGY_BASE_USAGE = {"ELEC": 250000, "WATER": 15000, "GAS": 60000}
+ENERGY_UNIT_FEE = {"ELEC": 0.12, "WATER": 1.5, "GAS": 0.9}
+
+
+@dataclass
+class SimulatorConfig:
+    """Tunable behaviour of the simulated vendor."""
+
+    households: int = 1
+    devices_per_household: int = 12
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    session_ttl: float | None = None
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_delay: float = 30.0
+    history_length: int = 24
+    password: str | None = None
+    seed: int = 0
+
+
+@dataclass
+class SimulatedHousehold:
+    """One apartment with its devices and metering state."""
+
+    site_id: str
+    site_name: str
+    dong: str
+    ho: str
+    devices: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class _Session:
+    created: float
+    household: SimulatedHousehold | None = None
+
+
+def build_household(index: int, device_count: int) -> SimulatedHousehold:
+    """Build a synthetic household cycling through every supported device type."""
+    household = SimulatedHousehold(
+        site_id=f"site{index // 100 + 1:03d}",
+        site_name=f"Sim Apartment {index // 100 + 1}",
+        dong=f"{101 + (index % 100) // 10}",
+        ho=f"{1001 + index % 10}",
+    )
+    for device_index in range(device_count):
+        device_type = DEVICE_TYPE_CYCLE[device_index % len(DEVICE_TYPE_CYCLE)]
+        device_id = f"{device_type}{device_index:04d}"
+        household.devices[device_id] = {
+            "id": device_id,
+            "deviceType": device_type,
+            "deviceName": f"{device_type} {device_index}",
+            "deviceLocation": f"room{device_index // len(DEVICE_TYPE_CYCLE) + 1}",
+            "statusList": [
+                {"command": command, "value": value}
+                for command, value in DEFAULT_STATUS[device_type].items()
+            ],
+        }
+    return household
+
+
+def _month_offset(day: date, months: int) -> date:
+    month_index = day.year * 12 + day.month - 1 - months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+class HiotSimulator:
+    """In-memory HT HomeService server built on ``aiohttp.web``."""
+
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        self.config = config or SimulatorConfig()
+        self.households = [
+            build_household(index, self.config.devices_per_household)
+            for index in range(self.config.households)
+        ]
+        self.request_counts: Counter[str] = Counter()
+        self.status_counts: Counter[int] = Counter()
+        self._sessions: dict[str, _Session] = {}
+        self._random = random.Random(self.config.seed)
+        self._runner: web.AppRunner | None = None
+        self._site: web.TCPSite | None = None
+        self.url = ""
+
+    def find_household(self, site_id: str, dong: str, ho: str) -> SimulatedHousehold | None:
+        """Return the household matching the CTOC selection."""
+        for household in self.households:
+            if (household.site_id, household.dong, household.ho) == (site_id, dong, ho):
+                return household
+        return None
+
+    def expire_sessions(self) -> None:
+        """Invalidate every issued session so the next call returns 401."""
+        self._sessions.clear()
+
+    def build_app(self) -> web.Application:
+        """Create the aiohttp application with all simulated routes."""
+        app = web.Application(middlewares=[self._fault_middleware])
+        app.router.add_post(f"/{PATH_LOGIN}", self._handle_login)
+        app.router.add_get(f"/{PATH_HOUSEHOLD}", self._handle_household)
+        app.router.add_post(f"/{PATH_CTOC_TOKEN}", self._handle_ctoc_token)
+        app.router.add_get(f"/{PATH_DEVICES}", self._handle_devices)
+        app.router.add_get(f"/{PATH_EMS_USAGE_HISTORY}", self._handle_ems_history)
+        app.router.add_get(f"/{PATH_EMS_USAGE_GOAL}", self._handle_ems_goal)
+        app.router.add_get(f"/{PATH_EMS_USAGE}", self._handle_ems_usage)
+        app.router.add_get(f"/{PATH_EMS_FEE}", self._handle_ems_fee)
+        app.router.add_get("/proxy/ctoc/{category}/{device_id}", self._handle_device_get)
+        app.router.add_put("/proxy/ctoc/{category}/{device_id}", self._handle_device_put)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, host, port)
+        await self._site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving and release the listening socket."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+        self._runner = None
+        self._site = None
+
+    async def __aenter__(self) -> HiotSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    @web.middleware
+    async def _fault_middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        resource = request.match_info.route.resource
+        route_name = resource.canonical if resource is not None else request.path
+        self.request_counts[route_name] += 1
+
+        config = self.config
+        delay = config.latency
+        if config.latency_jitter:
+            delay += self._random.uniform(0, config.latency_jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < config.timeout_rate:
+            # Stall long enough for the client to give up, then answer anyway.
+            await asyncio.sleep(config.timeout_delay)
+
+        if config.timeout_rate <= roll < config.timeout_rate + config.error_rate:
+            response: web.StreamResponse = web.json_response(
+                {"message": "Internal Server Error"}, status=500
+            )
+        else:
+            try:
+                response = await handler(request)
+            except web.HTTPException as exc:
+                self.status_counts[exc.status] += 1
+                raise
+
+        self.status_counts[response.status] += 1
+        return response
+
+    def _get_session(self, request: web.Request) -> _Session | None:
+        token = request.cookies.get(SESSION_COOKIE)
+        if token is None:
+            return None
+        session = self._sessions.get(token)
+        if session is None:
+            return None
+        ttl = self.config.session_ttl
+        if ttl is not None and time.monotonic() - session.created > ttl:
+            del self._sessions[token]
+            return None
+        return session
+
+    def _require_household(self, request: web.Request) -> SimulatedHousehold:
+        session = self._get_session(request)
+        if session is None:
+            raise web.HTTPUnauthorized()
+        if session.household is None:
+            raise web.HTTPForbidden()
+        return session.household
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        if not body.get("id") or not body.get("password"):
+            raise web.HTTPUnauthorized()
+        if self.config.password is not None and body.get("password") != self.config.password:
+            raise web.HTTPUnauthorized()
+
+        token = secrets.token_hex(16)
+        self._sessions[token] = _Session(created=time.monotonic())
+        response = web.json_response({"resultCode": "SUCCESS"})
+        response.set_cookie(SESSION_COOKIE, token)
+        return response
+
+    async def _handle_household(self, request: web.Request) -> web.Response:
+        if self._get_session(request) is None:
+            raise web.HTTPUnauthorized()
+        danji_list = [
+            {
+                "siteId": household.site_id,
+                "siteName": household.site_name,
+                "dong": household.dong,
+                "ho": household.ho,
+                "homepageDomain": "sim.hthomeservice.local",
+            }
+            for household in self.households
+        ]
+        return web.json_response({"resultData": {"danjiList": danji_list}})
+
+    async def _handle_ctoc_token(self, request: web.Request) -> web.Response:
+        session = self._get_session(request)
+        if session is None:
+            raise web.HTTPUnauthorized()
+        body = await request.json()
+        household = self.find_household(
+            str(body.get("siteId")), str(body.get("dong")), str(body.get("ho"))
+        )
+        if household is None:
+            raise web.HTTPNotFound()
+        session.household = household
+        return web.json_response({"resultCode": "SUCCESS"})
+
+    async def _handle_devices(self, request: web.Request) -> web.Response:
+        household = self._require_household(request)
+        include_status = request.query.get("includeStatus") == "true"
+        device_list = []
+        for device in household.devices.values():
+            entry = {key: value for key, value in device.items() if key != "statusList"}
+            if include_status:
+                entry["statusList"] = [dict(status) for status in device["statusList"]]
+            device_list.append(entry)
+        return web.json_response({"data": {"deviceList": device_list}})
+
+    def _find_device(self, request: web.Request) -> dict[str, Any]:
+        household = self._require_household(request)
+        device = household.devices.get(request.match_info["device_id"])
+        category = request.match_info["category"]
+        if device is None or DEVICE_CATEGORY_MAP.get(device["deviceType"]) != category:
+            raise web.HTTPNotFound()
+        return device
+
+    async def _handle_device_get(self, request: web.Request) -> web.Response:
+        device = self._find_device(request)
+        return web.json_response({"data": {"statusList": device["statusList"]}})
+
+    async def _handle_device_put(self, request: web.Request) -> web.Response:
+        device = self._find_device(request)
+        body = await request.json()
+        statuses = {status["command"]: status for status in device["statusList"]}
+        for command in body.get("commandList", []):
+            name = command.get("command")
+            if name in statuses:
+                statuses[name]["value"] = command.get("value")
+            else:
+                device["statusList"].append(
+                    {"command": name, "value": command.get("value")}
+                )
+        return web.json_response({"resultCode": "SUCCESS"})
+
+    @staticmethod
+    def _parse_query(request: web.Request) -> tuple[str, str, date]:
+        energy_type = request.query.get("energyType", "")
+        period = request.query.get("period", "MONTH")
+        if energy_type not in ENERGY_TYPES:
+            raise web.HTTPBadRequest()
+        try:
+            query_date = datetime.strptime(request.query.get("date", ""), "%Y-%m-%d").date()
+        except ValueError as err:
+            raise web.HTTPBadRequest() from err
+        return energy_type, period, query_date
+
+    @staticmethod
+    def _usage_for(household: SimulatedHousehold, energy_type: str, day: date) -> int:
+        seed = sum(map(ord, f"{household.site_id}{household.ho}{energy_type}"))
+        base = ENERGY_BASE_USAGE[energy_type]
+        return base + (seed * 37 + day.year * 12 + day.month) % (base // 2)
+
+    async def _handle_ems_usage(self, request: web.Request) -> web.Response:
+        household = self._require_household(request)
+        energy_type, period, query_date = self._parse_query(request)
+        usage = self._usage_for(household, energy_type, query_date)
+        if period == "DAY":
+            usage //= 30
+        else:
+            query_date = query_date.replace(day=1)
+        return web.json_response(
+            {
+                "data": {
+                    "usageList": [
+                        {
+                            "energyType": energy_type,
+                            "date": query_date.isoformat(),
+                            "usage": usage,
+                            "sameAreaTypeUsage": ENERGY_BASE_USAGE[energy_type],
+                        }
+                    ]
+                }
+            }
+        )
+
+    async def _handle_ems_fee(self, request: web.Request) -> web.Response:
+        household = self._require_household(request)
+        energy_type, _period, query_date = self._parse_query(request)
+        usage = self._usage_for(household, energy_type, query_date)
+        return web.json_response(
+            {
+                "data": {
+                    "feeList": [
+                        {
+                            "energyType": energy_type,
+                            "date": query_date.replace(day=1).isoformat(),
+                            "fee": int(usage * ENERGY_UNIT_FEE[energy_type]),
+                        }
+                    ]
+                }
+            }
+        )
+
+    async def _handle_ems_goal(self, request: web.Request) -> web.Response:
+        self._require_household(request)
+        energy_type, _period, query_date = self._parse_query(request)
+        return web.json_response(
+            {
+                "data": {
+                    "goalList": [
+                        {
+                            "energyType": energy_type,
+                            "date": query_date.replace(day=1).isoformat(),
+                            "goal": ENERGY_BASE_USAGE[energy_type] * 2,
+                        }
+                    ]
+                }
+            }
+        )
+
+    async def _handle_ems_history(self, request: web.Request) -> web.Response:
+        household = self._require_household(request)
+        energy_type, _period, query_date = self._parse_query(request)
+        usage_list = []
+        for months_back in range(self.config.history_length - 1, -1, -1):
+            month = _month_offset(query_date, months_back)
+            usage_list.append(
+                {
+                    "energyType": energy_type,
+                    "date": month.isoformat(),
+                    "usage": self._usage_for(household, energy_type, month),
+                }
+            )
+        return web.json_response({"data": {"usageList": usage_list}})
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--households", type=int, default=1)
+    parser.add_argument("--devices", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--session-ttl", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-delay", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    simulator = HiotSimulator(
+        SimulatorConfig(
+            households=args.households,
+            devices_per_household=args.devices,
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            session_ttl=args.session_ttl,
+            error_rate=args.error_rate,
+            timeout_rate=args.timeout_rate,
+            timeout_delay=args.timeout_delay,
+            seed=args.seed,
+        )
+    )
+    url = await simulator.start(args.host, args.port)
+    print(f"HT HomeService simulator listening on {url}")  # noqa: T201
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_serve(_parse_args()))
+    except KeyboardInterrupt:
+        pass
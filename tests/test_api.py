@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 from unittest.mock import call
 from unittest.mock import patch
 
@@ -25,10 +28,12 @@ from custom_components.hiot.const import (
     PATH_EMS_FEE,
     PATH_EMS_USAGE,
     PATH_EMS_USAGE_GOAL,
+    PATH_EMS_USAGE_HISTORY,
     PATH_HOUSEHOLD,
     PATH_LOGIN,
 )
 from custom_components.hiot.crypto import encrypt
+from custom_components.hiot.json_stream import JsonListItemParser
 
 _WARMUP_ENCRYPT = encrypt("warmup")
 
@@ -397,6 +402,25 @@ async def test_async_get_energy_usage_selects_latest_item_when_usage_list_has_mu
         assert result["usage"] == 300
 
 
+async def test_async_get_energy_usage_for_day_period() -> None:
+    async with _session() as session:
+        client = HiotApiClient(session)
+        url = f"{API_BASE_URL}/{PATH_EMS_USAGE}?energyType=ELEC&period=DAY&date=2025-02-14"
+
+        with aioresponses() as mocked:
+            mocked.get(
+                url,
+                payload={"data": {"usageList": [{"date": "2025-02-14", "usage": 2100}]}},
+                status=200,
+            )
+            result = await client.async_get_energy_usage("ELEC", "2025-02-14", "DAY")
+
+        with pytest.raises(ValueError):
+            await client.async_get_energy_usage("ELEC", "2025-02-14", "WEEK")
+
+    assert result == {"date": "2025-02-14", "usage": 2100}
+
+
 async def test_async_get_energy_fee() -> None:
     async with _session() as session:
         client = HiotApiClient(session)
@@ -449,6 +473,34 @@ async def test_async_get_energy_goal() -> None:
         assert result == {"energyType": "GAS", "goal": 200000}
 
 
+async def test_async_get_energy_usage_history() -> None:
+    async with _session() as session:
+        client = HiotApiClient(session)
+        url = f"{API_BASE_URL}/{PATH_EMS_USAGE_HISTORY}?energyType=ELEC&period=MONTH&date=2025-02-01"
+
+        with aioresponses() as mocked:
+            mocked.get(
+                url,
+                payload={
+                    "data": {
+                        "usageList": [
+                            {"date": "2025-01-01", "usage": 250000},
+                            "garbage",
+                            {"date": "2025-02-01", "usage": 64400},
+                        ]
+                    }
+                },
+                status=200,
+            )
+
+            result = await client.async_get_energy_usage_history("ELEC", "2025-02-01")
+
+        assert result == [
+            {"date": "2025-01-01", "usage": 250000},
+            {"date": "2025-02-01", "usage": 64400},
+        ]
+
+
 async def test_async_get_all_energy_data_allows_partial_failures() -> None:
     async with _session() as session:
         client = HiotApiClient(session)
@@ -457,6 +509,9 @@ async def test_async_get_all_energy_data_allows_partial_failures() -> None:
                 {"usage": 64400},
                 HiotApiError("usage fail"),
                 {"usage": 72500},
+                {"usage": 2100},
+                HiotApiError("day fail"),
+                {"usage": 2400},
             ]
         )
         client.async_get_energy_fee = AsyncMock(
@@ -485,3 +540,291 @@ async def test_async_get_all_energy_data_allows_partial_failures() -> None:
     assert result["GAS"]["usage"] == {"usage": 72500}
     assert result["GAS"]["fee"] == {}
     assert result["GAS"]["goal"] == {"goal": 200000}
+    assert result["ELEC"]["daily_usage"] == {"usage": 2100}
+    assert result["WATER"]["daily_usage"] == {}
+    assert client.async_get_energy_usage.await_args_list[3] == call(
+        "ELEC", "2025-02-01", "DAY"
+    )
+
+
+async def test_request_metrics_track_success_reauth_and_errors() -> None:
+    async with _session() as session:
+        client = HiotApiClient(session)
+        client._authenticated = True
+        client._username = "testuser"
+        client._password = "testpass"
+
+        status_url = f"{API_BASE_URL}/{PATH_DEVICES_WITH_STATUS}"
+        login_url = f"{API_BASE_URL}/{PATH_LOGIN}"
+
+        with (
+            aioresponses() as mocked,
+            patch("custom_components.hiot.api.asyncio.sleep", new=AsyncMock()),
+        ):
+            mocked.get(status_url, status=401)
+            mocked.post(login_url, payload={"ok": True}, status=200)
+            mocked.get(status_url, payload={"data": {"deviceList": []}}, status=200)
+            mocked.get(status_url, status=500)
+            mocked.put(f"{API_BASE_URL}/proxy/ctoc/lights/light001", payload={}, status=200)
+
+            await client.async_get_all_device_states()
+            with pytest.raises(HiotConnectionError):
+                await client.async_get_all_device_states()
+            await client.async_control_device("lights", "light001", [])
+
+    bulk = client.metrics.get("bulk_status")
+    assert bulk.requests == 2
+    assert bulk.reauths == 1
+    assert bulk.errors == {"ClientResponseError": 1}
+    assert len(bulk.latencies) == 2
+    assert client.metrics.get("login").requests == 1
+    assert client.metrics.get("device_put").requests == 1
+
+
+async def test_request_latency_excludes_reauth_backoff() -> None:
+    clock = MagicMock()
+    clock.monotonic.return_value = 100.0
+
+    async def _sleep(delay: float) -> None:
+        clock.monotonic.return_value += delay
+
+    async with _session() as session:
+        client = HiotApiClient(session)
+        client._authenticated = True
+        client._username = "testuser"
+        client._password = "testpass"
+
+        status_url = f"{API_BASE_URL}/{PATH_DEVICES_WITH_STATUS}"
+        with (
+            aioresponses() as mocked,
+            patch("custom_components.hiot.api.time", new=clock),
+            patch("custom_components.hiot.api.asyncio.sleep", new=AsyncMock(side_effect=_sleep)),
+        ):
+            mocked.get(status_url, status=401)
+            mocked.post(f"{API_BASE_URL}/{PATH_LOGIN}", payload={"ok": True}, status=200)
+            mocked.get(status_url, payload={"data": {"deviceList": []}}, status=200)
+
+            await client.async_get_all_device_states()
+
+    assert list(client.metrics.get("bulk_status").latencies) == [0.0]
+
+
+async def test_async_get_all_energy_data_fetches_only_requested_items() -> None:
+    async with _session() as session:
+        client = HiotApiClient(session)
+        client.async_get_energy_usage = AsyncMock(return_value={"usage": 64400})
+        client.async_get_energy_fee = AsyncMock(return_value={"fee": 7860})
+        client.async_get_energy_goal = AsyncMock(return_value={"goal": 400000})
+
+        result = await client.async_get_all_energy_data(
+            "2025-02-01", [("ELEC", "usage"), ("GAS", "fee")]
+        )
+
+    assert client.async_get_energy_usage.await_args_list == [
+        call("ELEC", "2025-02-01", "MONTH")
+    ]
+    assert client.async_get_energy_fee.await_args_list == [call("GAS", "2025-02-01", "MONTH")]
+    client.async_get_energy_goal.assert_not_awaited()
+    assert result["ELEC"] == {
+        "usage": {"usage": 64400},
+        "fee": {},
+        "goal": {},
+        "daily_usage": {},
+    }
+    assert result["GAS"]["fee"] == {"fee": 7860}
+
+
+async def test_async_run_batch_caps_concurrency() -> None:
+    async with _session() as session:
+        client = HiotApiClient(session)
+        running = 0
+        peak = 0
+
+        async def _job(value: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return value * 2
+
+        batch = await client.async_run_batch(
+            {index: (lambda index=index: _job(index)) for index in range(10)},
+            concurrency=3,
+        )
+
+    assert peak == 3
+    assert batch.results == {index: index * 2 for index in range(10)}
+    assert batch.errors == {}
+
+
+async def test_async_run_batch_reports_per_item_errors_and_timeouts() -> None:
+    async with _session() as session:
+        client = HiotApiClient(session)
+
+        async def _slow() -> str:
+            await asyncio.sleep(10)
+            return "late"
+
+        async def _fail() -> str:
+            raise HiotApiError("server error")
+
+        async def _ok() -> str:
+            return "ok"
+
+        batch = await client.async_run_batch(
+            {("ELEC", "usage"): _slow, ("GAS", "fee"): _fail, ("WATER", "goal"): _ok},
+            item_timeout=0.01,
+        )
+
+    assert batch.results == {("WATER", "goal"): "ok"}
+    assert batch.errors[("ELEC", "usage")].error_type == "TimeoutError"
+    assert batch.errors[("GAS", "fee")].as_dict() == {
+        "key": "GAS/fee",
+        "error_type": "HiotApiError",
+        "message": "server error",
+    }
+    assert [error["key"] for error in client.metrics.batch_errors] == [
+        "ELEC/usage",
+        "GAS/fee",
+    ]
+
+
+async def test_async_close_cancels_in_flight_batch_items() -> None:
+    async with _session() as session:
+        client = HiotApiClient(session)
+        started = asyncio.Event()
+
+        async def _hang() -> str:
+            started.set()
+            await asyncio.sleep(10)
+            return "never"
+
+        batch_task = asyncio.create_task(client.async_run_batch({"slow": _hang}))
+        await started.wait()
+        await client.async_close()
+        batch = await batch_task
+
+    assert batch.results == {}
+    assert batch.errors["slow"].error_type == "CancelledError"
+    assert not client._batch_tasks
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-02-01",
+        "2025-02",
+        "202502",
+        "20250201",
+        "2024-02-29",
+        "2025-02-29",
+        "2025-13",
+        "202513",
+        "2025-2-1",
+        " 2025-02 ",
+        "0000-01-01",
+        "２０２５-02-01",
+        "",
+        "n/a",
+    ],
+)
+def test_parse_sortable_date_matches_strptime(value: str) -> None:
+    expected = None
+    for date_format in ("%Y-%m-%d", "%Y-%m", "%Y%m", "%Y%m%d"):
+        try:
+            expected = datetime.strptime(value.strip(), date_format)
+        except ValueError:
+            continue
+        break
+
+    assert HiotApiClient._parse_sortable_date(value) == expected
+
+
+def test_select_latest_list_item_remembers_date_key_per_response_type() -> None:
+    client = HiotApiClient(MagicMock())
+    items = [
+        {"usageDate": "2025-01", "usage": 1},
+        "skip",
+        {"usageDate": "2025-03", "usage": 3},
+        {"usageDate": "2025-02", "usage": 2},
+    ]
+
+    assert client._select_latest_list_item(items, "testList")["usage"] == 3
+    assert client._date_key_memo["testList"] == "usageDate"
+
+    # A different key still works when the remembered one is missing
+    assert client._select_latest_list_item(
+        [{"ym": "202501"}, {"ym": "202412"}], "testList"
+    ) == {"ym": "202501"}
+    assert client._date_key_memo["testList"] == "ym"
+    assert client._select_latest_list_item([{"usage": 1}, {"usage": 2}]) == {
+        "usage": 1
+    }
+    assert HiotApiClient(MagicMock())._date_key_memo == {}
+
+
+async def test_async_stream_energy_usage_history_delivers_items_incrementally() -> None:
+    items = [{"date": f"2024-{month:02d}-01", "usage": month * 1000} for month in range(1, 13)]
+    body = json.dumps({"data": {"note": "usageList", "usageList": items}})
+
+    async with _session() as session:
+        client = HiotApiClient(session)
+        url = f"{API_BASE_URL}/{PATH_EMS_USAGE_HISTORY}?energyType=GAS&period=MONTH&date=2024-12-31"
+        received: list[dict] = []
+
+        with (
+            aioresponses() as mocked,
+            patch("custom_components.hiot.api.STREAM_CHUNK_SIZE", 7),
+        ):
+            mocked.get(url, body=body, status=200, content_type="application/json")
+            count = await client.async_stream_energy_usage_history(
+                "GAS", "2024-12-31", received.append
+            )
+
+            mocked.get(url, body=body[:-20], status=200, content_type="application/json")
+            with pytest.raises(HiotApiError):
+                await client.async_stream_energy_usage_history("GAS", "2024-12-31", [].append)
+
+    assert count == 12
+    assert received == items
+    assert client.metrics.get("ems_history").last_payload_bytes == len(body)
+
+
+def test_json_list_item_parser_handles_split_chunks() -> None:
+    items = [{"s": 'a"b]}\\', "n": [1, {"x": "가"}]}, 3, "plain", None]
+    raw = json.dumps({"usageList": "usageList", "data": {"usageList": items}}, ensure_ascii=False)
+    encoded = raw.encode()
+
+    for size in (1, 2, 3, 5, 64):
+        parser = JsonListItemParser("usageList")
+        parsed = []
+        for start in range(0, len(encoded), size):
+            parsed.extend(parser.feed(encoded[start : start + size]))
+        parsed.extend(parser.close())
+        assert parsed == items
+
+
+async def test_control_devices_runs_batch_with_per_device_errors() -> None:
+    client = HiotApiClient(MagicMock())
+    calls: list[tuple[str, str]] = []
+
+    async def _control(category, device_id, commands):
+        calls.append((category, device_id))
+        if device_id == "light002":
+            raise HiotConnectionError("offline")
+        return {"result": "ok"}
+
+    client.async_control_device = _control  # type: ignore[method-assign]
+    result = await client.async_control_devices(
+        {
+            ("lights", "light001"): [{"command": "power", "value": "off"}],
+            ("lights", "light002"): [{"command": "power", "value": "off"}],
+        },
+        concurrency=1,
+    )
+
+    assert calls == [("lights", "light001"), ("lights", "light002")]
+    assert result.results == {("lights", "light001"): {"result": "ok"}}
+    assert result.errors[("lights", "light002")].error_type == "HiotConnectionError"
+    assert client.metrics.batch_errors[-1]["key"] == "lights/light002"
@@ -0,0 +1,235 @@
+# pyright: reportMissingImports=false
+"""Offline benchmarks for the integration's hot paths.
+
+By default every benchmark runs once at the smallest home size as a smoke
+test. Set ``HIOT_BENCHMARK=1`` to run the full 10/100/1,000 device matrix and
+``HIOT_BENCHMARK_OUTPUT=path.json`` to write the timings as JSON, e.g.::
+
+    HIOT_BENCHMARK=1 HIOT_BENCHMARK_OUTPUT=bench_output.json pytest tests/test_benchmark.py
+"""
+from __future__ import annotations
+
+import copy
+import json
+import os
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from custom_components.hiot import climate, fan, light, switch
+from custom_components.hiot.api import HiotApiClient
+from custom_components.hiot.const import DOMAIN
+from custom_components.hiot.coordinator import HiotDataUpdateCoordinator
+from custom_components.hiot.entity import HiotEntity
+from custom_components.hiot.light import HiotLight
+from tests.simulator import build_household
+
+FULL_RUN = os.environ.get("HIOT_BENCHMARK") == "1"
+OUTPUT_PATH = os.environ.get("HIOT_BENCHMARK_OUTPUT")
+HOME_SIZES = (10, 100, 1000) if FULL_RUN else (10,)
+REPEATS = 7 if FULL_RUN else 1
+EMS_LIST_LENGTH = 1000 if FULL_RUN else 50
+
+_RESULTS: list[dict[str, Any]] = []
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _write_results():
+    yield
+    if OUTPUT_PATH and _RESULTS:
+        with open(OUTPUT_PATH, "w", encoding="utf-8") as output:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "full_run": FULL_RUN,
+                    "results": _RESULTS,
+                },
+                output,
+                indent=2,
+            )
+
+
+def _record(name: str, size: int, samples: list[float], loops: int) -> None:
+    per_loop = [sample / loops for sample in samples]
+    median = statistics.median(per_loop)
+    _RESULTS.append(
+        {
+            "name": name,
+            "size": size,
+            "loops": loops,
+            "repeats": len(samples),
+            "best_s": min(per_loop),
+            "median_s": median,
+            "per_item_us": median / size * 1e6,
+        }
+    )
+
+
+def _bench(
+    name: str,
+    size: int,
+    func: Callable[..., Any],
+    loops: int = 100,
+    setup: Callable[[], Any] | None = None,
+) -> None:
+    """Time ``func``; with ``setup``, each call gets a fresh untimed input."""
+    samples = []
+    for _ in range(REPEATS):
+        inputs = [setup() for _ in range(loops)] if setup is not None else None
+        start = time.perf_counter()
+        if inputs is None:
+            for _ in range(loops):
+                func()
+        else:
+            for value in inputs:
+                func(value)
+        samples.append(time.perf_counter() - start)
+    _record(name, size, samples, loops)
+
+
+async def _abench(
+    name: str, size: int, func: Callable[[], Awaitable[Any]], loops: int = 20
+) -> None:
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(loops):
+            await func()
+        samples.append(time.perf_counter() - start)
+    _record(name, size, samples, loops)
+
+
+def _device_payload(device_count: int) -> dict[str, Any]:
+    household = build_household(0, device_count)
+    return {"data": {"deviceList": list(household.devices.values())}}
+
+
+def _ems_list(length: int) -> list[dict[str, Any]]:
+    items = []
+    for index in range(length):
+        month_index = 2000 * 12 + index
+        items.append(
+            {
+                "energyType": "ELEC",
+                "date": date(month_index // 12, month_index % 12 + 1, 1).isoformat(),
+                "usage": 1000 + index,
+            }
+        )
+    # Put the newest item first so the scan cannot short-circuit on order.
+    items.insert(0, items.pop())
+    return items
+
+
+@pytest.mark.parametrize("device_count", HOME_SIZES)
+def test_bench_parse_device_list(device_count: int) -> None:
+    payload = _device_payload(device_count)
+
+    _bench(
+        "parse_device_list",
+        device_count,
+        HiotApiClient._parse_device_list,
+        # The parser normalises device dicts in place, so every call needs its own
+        setup=lambda: copy.deepcopy(payload),
+    )
+
+    assert len(HiotApiClient._parse_device_list(payload)) == device_count
+
+
+@pytest.mark.parametrize("device_count", HOME_SIZES)
+async def test_bench_get_all_device_states(device_count: int) -> None:
+    payload = _device_payload(device_count)
+    client = HiotApiClient(MagicMock())
+
+    async def _request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return payload
+
+    client._async_request = _request  # type: ignore[method-assign]
+
+    await _abench("get_all_device_states", device_count, client.async_get_all_device_states)
+
+    result = await client.async_get_all_device_states()
+    assert sum(len(devices) for devices in result.values()) == device_count
+
+
+def test_bench_select_latest_list_item() -> None:
+    items = _ems_list(EMS_LIST_LENGTH)
+    client = HiotApiClient(MagicMock())
+
+    _bench(
+        "select_latest_list_item",
+        EMS_LIST_LENGTH,
+        lambda: client._select_latest_list_item(items, "usageList"),
+        loops=10,
+    )
+
+    assert client._select_latest_list_item(items, "usageList") is items[0]
+
+
+async def test_bench_get_status_value(hass, mock_config_entry, mock_api_client) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.data = {
+        "lights": {
+            "light001": {
+                "statusList": [
+                    {"command": command, "value": str(index)}
+                    for index, command in enumerate(
+                        ("mode", "wind", "currTemperature", "setTemperature", "power")
+                    )
+                ]
+            }
+        }
+    }
+    entity = HiotLight(coordinator, "light001", "조명", "light")
+
+    _bench("get_status_value", 1, lambda: entity._get_status_value("power"), loops=10000)
+
+    assert entity._get_status_value("power") == "4"
+
+
+@pytest.mark.parametrize("device_count", HOME_SIZES)
+async def test_bench_coordinator_update_fan_out(
+    hass, mock_config_entry, mock_api_client, device_count: int
+) -> None:
+    payload = _device_payload(device_count)
+    devices = HiotApiClient._parse_device_list(payload)
+    client = HiotApiClient(MagicMock())
+
+    async def _request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return payload
+
+    client._async_request = _request  # type: ignore[method-assign]
+    states = await client.async_get_all_device_states()
+    mock_api_client.async_get_all_device_states.return_value = states
+
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = devices
+    coordinator.data = states
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {"coordinator": coordinator}
+
+    entities: list[Any] = []
+    for module in (light, climate, fan, switch):
+        add_entities = MagicMock()
+        await module.async_setup_entry(hass, mock_config_entry, add_entities)
+        entities.extend(add_entities.call_args[0][0])
+
+    entity_platform = MockEntityPlatform(hass)
+    await entity_platform.async_add_entities(entities)
+    assert len(hass.states.async_all()) == len(entities)
+    assert sum(isinstance(entity, HiotEntity) for entity in entities) == device_count
+
+    def _fan_out() -> None:
+        coordinator.async_set_updated_data(states)
+
+    _bench("coordinator_update_fan_out", device_count, _fan_out, loops=5)
+
+    await entity_platform.async_reset()
+    hass.data[DOMAIN].pop(mock_config_entry.entry_id)
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from homeassistant.components.climate import HVACMode
 from homeassistant.const import ATTR_TEMPERATURE
-
-from custom_components.hiot.climate import HiotAircon, HiotHeater, async_setup_entry
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.hiot.api import HiotApiError
+from custom_components.hiot.climate import (
+    HiotAircon,
+    HiotHeater,
+    HiotHeatingGroup,
+    async_setup_entry,
+)
 from custom_components.hiot.const import DOMAIN
 from custom_components.hiot.coordinator import HiotDataUpdateCoordinator
 
@@ -68,6 +76,38 @@ async def test_heater_state_and_controls(hass, mock_config_entry, mock_api_clien
     )
 
 
+async def test_heater_skips_setpoint_already_reported(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_api_client.async_get_all_device_states.return_value = {
+        "heaters": {
+            "heat001": {
+                "statusList": [
+                    {"command": "power", "value": "on"},
+                    {"command": "setTemperature", "value": "24.0"},
+                ]
+            }
+        },
+    }
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+
+    entity = HiotHeater(coordinator, "heat001", "난방", "heating")
+    await entity.async_set_temperature(**{ATTR_TEMPERATURE: 24})
+    await entity.async_set_hvac_mode(HVACMode.HEAT)
+
+    mock_api_client.async_control_device.assert_not_called()
+    assert coordinator.skipped_commands == 2
+
+    await entity.async_set_temperature(**{ATTR_TEMPERATURE: 25})
+    mock_api_client.async_control_device.assert_awaited_once_with(
+        "heaters",
+        "heat001",
+        [{"command": "setTemperature", "value": "25"}],
+    )
+
+
 async def test_aircon_state_and_controls(hass, mock_config_entry, mock_api_client) -> None:
     coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
     coordinator.data = {
@@ -288,3 +328,77 @@ async def test_aircon_set_fan_mode(hass, mock_config_entry, mock_api_client) ->
         "air001",
         [{"command": "wind", "value": "pow"}],
     )
+
+
+async def test_heating_group_aggregates_and_fans_out_commands(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_api_client.async_get_all_device_states.return_value = {
+        "heaters": {
+            "heat001": {
+                "statusList": [
+                    {"command": "power", "value": "on"},
+                    {"command": "currTemperature", "value": "21"},
+                    {"command": "setTemperature", "value": "24"},
+                ]
+            },
+            "heat002": {
+                "statusList": [
+                    {"command": "power", "value": "on"},
+                    {"command": "currTemperature", "value": "22"},
+                    {"command": "setTemperature", "value": "22"},
+                ]
+            },
+            "heat003": {
+                "statusList": [
+                    {"command": "power", "value": "off"},
+                    {"command": "currTemperature", "value": "18"},
+                    {"command": "setTemperature", "value": "10"},
+                ]
+            },
+        },
+    }
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = [
+        {"deviceId": heater_id, "deviceType": "heating", "deviceName": "난방"}
+        for heater_id in ("heat001", "heat002", "heat003")
+    ]
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {"coordinator": coordinator}
+
+    add_entities = MagicMock()
+    await async_setup_entry(hass, mock_config_entry, add_entities)
+    groups = [e for e in add_entities.call_args[0][0] if isinstance(e, HiotHeatingGroup)]
+    assert len(groups) == 1
+    group = groups[0]
+
+    assert group.hvac_mode == HVACMode.HEAT
+    assert group.current_temperature == 20.3
+    assert group.target_temperature == 23.0
+    assert group.extra_state_attributes == {"active_zones": 2}
+
+    await group.async_set_temperature(**{ATTR_TEMPERATURE: 22})
+    assert sorted(
+        call.args for call in mock_api_client.async_control_device.await_args_list
+    ) == [
+        ("heaters", "heat001", [{"command": "setTemperature", "value": "22"}]),
+        ("heaters", "heat003", [{"command": "setTemperature", "value": "22"}]),
+    ]
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert coordinator.skipped_commands == 1
+
+
+async def test_heating_group_reports_partial_failure(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.async_request_refresh = AsyncMock()
+    group = HiotHeatingGroup(
+        coordinator, mock_config_entry.entry_id, "heating_group", ["heat001", "heat002"]
+    )
+    mock_api_client.async_control_device.side_effect = [{}, HiotApiError("boom")]
+
+    with pytest.raises(HomeAssistantError, match="1 of 2 devices"):
+        await group.async_set_hvac_mode(HVACMode.OFF)
+    coordinator.async_request_refresh.assert_awaited_once()
@@ -0,0 +1,206 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.hiot.api import HiotConnectionError
+from custom_components.hiot.command_journal import HiotCommandJournal
+from custom_components.hiot.const import EVENT_COMMANDS_REPLAYED
+from custom_components.hiot.coordinator import HiotDataUpdateCoordinator
+from custom_components.hiot.fan import HiotFan
+from custom_components.hiot.switch import HiotGasValve
+
+
+async def _coordinator(
+    hass, mock_config_entry, mock_api_client, journal: bool = True
+) -> HiotDataUpdateCoordinator:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(mock_config_entry, options={"command_journal": journal})
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+    return coordinator
+
+
+async def test_journal_collapses_commands_per_device_and_command(hass, mock_config_entry) -> None:
+    journal = HiotCommandJournal(hass, mock_config_entry.entry_id)
+
+    journal.async_queue("fans", "fan001", [{"command": "wind", "value": "mid"}])
+    journal.async_queue("lights", "light001", [{"command": "power", "value": "off"}])
+    journal.async_queue(
+        "fans", "fan001", [{"command": "power", "value": "on"}, {"command": "wind", "value": "low"}]
+    )
+
+    live, expired = journal.async_take()
+
+    assert expired == []
+    assert [(item.device_id, item.command, item.value) for item in live] == [
+        ("light001", "power", "off"),
+        ("fan001", "power", "on"),
+        ("fan001", "wind", "low"),
+    ]
+    assert journal.pending == 0
+
+
+async def test_journal_drops_expired_commands(hass, mock_config_entry, freezer) -> None:
+    journal = HiotCommandJournal(hass, mock_config_entry.entry_id)
+    journal.async_queue("gases", "gas001", [{"command": "power", "value": "off"}])
+    freezer.tick(timedelta(minutes=9))
+    journal.async_queue("lights", "light001", [{"command": "power", "value": "off"}])
+    freezer.tick(timedelta(minutes=2))
+
+    live, expired = journal.async_take()
+
+    assert [item.device_id for item in live] == ["light001"]
+    assert [item.device_id for item in expired] == ["gas001"]
+
+
+async def test_journal_restore_keeps_commands_issued_meanwhile(hass, mock_config_entry) -> None:
+    journal = HiotCommandJournal(hass, mock_config_entry.entry_id)
+    journal.async_queue("fans", "fan001", [{"command": "wind", "value": "mid"}])
+    journal.async_queue("lights", "light001", [{"command": "power", "value": "off"}])
+    live, _ = journal.async_take()
+    journal.async_queue("fans", "fan001", [{"command": "wind", "value": "high"}])
+
+    journal.async_restore(live)
+
+    live, _ = journal.async_take()
+    assert [(item.device_id, item.value) for item in live] == [
+        ("light001", "off"),
+        ("fan001", "high"),
+    ]
+
+
+async def test_journal_survives_restart(hass, mock_config_entry, hass_storage) -> None:
+    journal = HiotCommandJournal(hass, mock_config_entry.entry_id)
+    journal.async_queue("gases", "gas001", [{"command": "power", "value": "off"}])
+    await journal._store.async_save(journal._data_to_save())
+
+    restored = HiotCommandJournal(hass, mock_config_entry.entry_id)
+    await restored.async_load()
+
+    live, _ = restored.async_take()
+    assert [(item.category, item.device_id, item.command, item.value) for item in live] == [
+        ("gases", "gas001", "power", "off")
+    ]
+
+
+async def test_command_during_outage_is_replayed_after_next_poll(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = await _coordinator(hass, mock_config_entry, mock_api_client)
+    events = async_capture_events(hass, EVENT_COMMANDS_REPLAYED)
+    entity = HiotGasValve(coordinator, "gas001", "가스 밸브", "gas")
+    mock_api_client.async_control_device.side_effect = HiotConnectionError("down")
+
+    with pytest.raises(HomeAssistantError, match="queued"):
+        await entity.async_turn_off()
+
+    assert coordinator.command_journal.pending == 1
+    coordinator.async_request_refresh.assert_not_awaited()
+
+    mock_api_client.async_control_device.side_effect = None
+    mock_api_client.async_control_device.reset_mock()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_api_client.async_control_device.assert_awaited_once_with(
+        "gases", "gas001", [{"command": "power", "value": "off"}]
+    )
+    assert coordinator.command_journal.pending == 0
+    assert coordinator.command_journal.replays == 1
+    assert len(events) == 1
+    (result,) = events[0].data["results"]
+    assert result["device_id"] == "gas001"
+    assert result["result"] == "sent"
+    assert coordinator.command_journal.last_replay == events[0].data["results"]
+
+
+async def test_replay_requeues_commands_still_unreachable(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = await _coordinator(hass, mock_config_entry, mock_api_client)
+    events = async_capture_events(hass, EVENT_COMMANDS_REPLAYED)
+    coordinator.command_journal.async_queue("fans", "fan001", [{"command": "power", "value": "off"}])
+    coordinator.command_journal.async_queue(
+        "lights", "light001", [{"command": "power", "value": "off"}]
+    )
+
+    async def _control(category, device_id, commands):
+        if category == "fans":
+            raise HiotConnectionError("down")
+        if category == "lights":
+            raise ValueError("rejected")
+        return {}
+
+    mock_api_client.async_control_device.side_effect = _control
+    await coordinator.async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    results = {result["device_id"]: result for result in events[0].data["results"]}
+    assert results["fan001"]["result"] == "queued"
+    assert results["light001"]["result"] == "failed"
+    assert results["light001"]["error"] == "rejected"
+    assert coordinator.command_journal.pending == 1
+
+
+async def test_batch_commands_during_outage_are_journaled(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = await _coordinator(hass, mock_config_entry, mock_api_client)
+    mock_api_client.async_control_device.side_effect = HiotConnectionError("down")
+
+    result = await coordinator.async_send_commands(
+        {("lights", "light001"): [{"command": "power", "value": "off"}]}
+    )
+
+    assert result.errors == {}
+    assert result.queued == [("lights", "light001")]
+    assert coordinator.command_journal.pending == 1
+
+
+async def test_batch_timeouts_are_journaled(hass, mock_config_entry, mock_api_client) -> None:
+    coordinator = await _coordinator(hass, mock_config_entry, mock_api_client)
+    mock_api_client.async_control_device.side_effect = TimeoutError
+
+    result = await coordinator.async_send_commands(
+        {("lights", "light001"): [{"command": "power", "value": "off"}]}
+    )
+
+    assert result.queued == [("lights", "light001")]
+    assert coordinator.command_journal.pending == 1
+
+
+async def test_sent_command_drops_queued_value(hass, mock_config_entry, mock_api_client) -> None:
+    coordinator = await _coordinator(hass, mock_config_entry, mock_api_client)
+    entity = HiotFan(coordinator, "fan001", "환기", "fan")
+    coordinator.command_journal.async_queue("fans", "fan001", [{"command": "power", "value": "on"}])
+    coordinator.command_journal.async_queue(
+        "lights", "light001", [{"command": "power", "value": "on"}]
+    )
+
+    await entity.async_turn_off()
+    await coordinator.async_send_commands(
+        {("lights", "light001"): [{"command": "power", "value": "off"}]}
+    )
+
+    assert coordinator.command_journal.pending == 0
+
+
+async def test_outage_errors_propagate_when_journal_disabled(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = await _coordinator(hass, mock_config_entry, mock_api_client, journal=False)
+    entity = HiotFan(coordinator, "fan001", "환기", "fan")
+    mock_api_client.async_control_device.side_effect = HiotConnectionError("down")
+
+    with pytest.raises(HiotConnectionError):
+        await entity.async_turn_off()
+
+    assert coordinator.command_journal.pending == 0
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import async_capture_events
 
 from custom_components.hiot.api import HiotApiError, HiotAuthError
-from custom_components.hiot.coordinator import HiotDataUpdateCoordinator
+from custom_components.hiot.const import EVENT_DEVICES_CHANGED
+from custom_components.hiot.coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
 
 
 async def test_async_setup_fetches_devices(hass, mock_config_entry, mock_api_client) -> None:
@@ -97,3 +100,485 @@ async def test_async_update_data_api_error_raises_update_failed(
 
     with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
+
+
+async def test_async_update_data_records_poll_history(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+
+    await coordinator._async_update_data()
+    mock_api_client.async_get_all_device_states = AsyncMock(
+        side_effect=HiotApiError("server error")
+    )
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert [poll["success"] for poll in coordinator.poll_history] == [True, False]
+    assert all(poll["duration"] >= 0 for poll in coordinator.poll_history)
+
+
+async def test_energy_update_fetches_only_expired_items(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 03:00:00+00:00")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+
+    first = await coordinator._async_update_data()
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert len(requested) == 12
+    assert first["ELEC"]["goal"] == {"goal": 400000}
+
+    mock_api_client.async_get_all_energy_data.reset_mock()
+    cached = await coordinator._async_update_data()
+    mock_api_client.async_get_all_energy_data.assert_not_awaited()
+    assert cached == first
+
+    freezer.tick(timedelta(minutes=20))
+    await coordinator._async_update_data()
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert {item_type for _, item_type in requested} == {"usage", "daily_usage"}
+    assert len(requested) == 6
+
+    freezer.tick(timedelta(hours=6))
+    await coordinator._async_update_data()
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert {item_type for _, item_type in requested} == {"usage", "fee", "daily_usage"}
+
+    assert coordinator.cache_misses == 12 + 6 + 9
+    assert coordinator.cache_hits == 12 + 6 + 3
+
+
+async def test_energy_update_follows_short_scan_interval_for_usage(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 03:00:00+00:00")
+    coordinator = HiotEnergyCoordinator(
+        hass, mock_config_entry, mock_api_client, scan_interval=timedelta(seconds=300)
+    )
+    await coordinator._async_update_data()
+
+    mock_api_client.async_get_all_energy_data.reset_mock()
+    freezer.tick(timedelta(minutes=5))
+    await coordinator._async_update_data()
+
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert {item_type for _, item_type in requested} == {"usage", "daily_usage"}
+
+
+async def test_energy_update_forces_usage_only_on_aligned_refresh(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 03:00:00+00:00")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.publish_schedule._candidates = {5, 6}
+    await coordinator._async_update_data()
+    assert coordinator._publish_refresh_at == datetime(2025, 3, 15, 4, 8, tzinfo=UTC)
+
+    mock_api_client.async_get_all_energy_data.reset_mock()
+    freezer.tick(timedelta(minutes=5))
+    await coordinator._async_update_data()
+    mock_api_client.async_get_all_energy_data.assert_not_awaited()
+
+    coordinator._publish_refresh_at = datetime(2025, 3, 15, 3, 10, tzinfo=UTC)
+    freezer.tick(timedelta(minutes=5))
+    await coordinator._async_update_data()
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert {item_type for _, item_type in requested} == {"usage", "daily_usage"}
+
+
+async def test_energy_update_keeps_cached_value_when_item_fails(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 03:00:00+00:00")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator._async_update_data()
+
+    freezer.tick(timedelta(minutes=20))
+    mock_api_client.async_get_all_energy_data.return_value = {
+        energy_type: {"usage": {}, "fee": {}, "goal": {}, "daily_usage": {}}
+        for energy_type in ("ELEC", "WATER", "GAS")
+    }
+    data = await coordinator._async_update_data()
+
+    assert data["ELEC"]["usage"] == {"usage": 64400, "sameAreaTypeUsage": 123000}
+
+
+async def test_energy_update_closes_month_once_after_rollover(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    def _energy_data(query_date, items):
+        usage = 90000 if query_date == "2025-03-31" else 1200
+        return {
+            energy_type: {
+                "usage": {"usage": usage},
+                "fee": {"fee": usage // 10},
+                "goal": {"goal": 400000},
+            }
+            for energy_type in ("ELEC", "WATER", "GAS")
+        }
+
+    mock_api_client.async_get_all_energy_data.side_effect = _energy_data
+    # 23:30 KST on the last day of March
+    freezer.move_to("2025-03-31 14:30:00+00:00")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator._async_update_data()
+    assert coordinator.data_month == "2025-03"
+
+    # Shortly after midnight KST the closing month is still reported
+    freezer.move_to("2025-03-31 15:30:00+00:00")
+    await coordinator._async_update_data()
+    assert coordinator.data_month == "2025-03"
+    assert mock_api_client.async_get_all_energy_data.await_args[0][0] == "2025-03-31"
+
+    published = []
+    unsub = coordinator.async_add_listener(
+        lambda: published.append(
+            (coordinator.data_month, coordinator.data["ELEC"]["usage"]["usage"])
+        )
+    )
+    mock_api_client.async_get_all_energy_data.reset_mock()
+    freezer.move_to("2025-03-31 16:10:00+00:00")
+    data = await coordinator._async_update_data()
+    unsub()
+
+    calls = mock_api_client.async_get_all_energy_data.await_args_list
+    assert calls[0][0][0] == "2025-03-31"
+    assert {item_type for _, item_type in calls[0][0][1]} == {"usage", "fee"}
+    assert calls[1][0][0] == "2025-04-01"
+    assert published == [("2025-03", 90000)]
+    assert coordinator.data_month == "2025-04"
+    assert data["ELEC"]["usage"] == {"usage": 1200}
+    assert coordinator.closed_months["2025-03"]["ELEC"]["fee"] == {"fee": 9000}
+    assert coordinator.closed_months["2025-03"]["ELEC"]["goal"] == {"goal": 400000}
+
+    restored = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await restored._async_setup()
+    assert restored.closed_months == coordinator.closed_months
+
+
+async def test_energy_close_month_twice_is_a_no_op(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-04-01 00:30:00+00:00")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator._async_close_month("2025-03")
+    closed = coordinator.closed_months["2025-03"]
+    published = MagicMock()
+    unsub = coordinator.async_add_listener(published)
+
+    await coordinator._async_close_month("2025-03")
+    unsub()
+
+    mock_api_client.async_get_all_energy_data.assert_awaited_once()
+    assert coordinator.closed_months["2025-03"] is closed
+    published.assert_not_called()
+
+
+async def test_energy_update_tracks_daily_usage_per_day(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    # 23:30 KST on 15 March
+    freezer.move_to("2025-03-15 14:30:00+00:00")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    data = await coordinator._async_update_data()
+    assert data["ELEC"]["daily_usage"] == {"usage": 2100}
+    assert coordinator.data_day == "2025-03-15"
+
+    # After the close delay the new day is queried and the old one is dropped
+    freezer.move_to("2025-03-15 16:05:00+00:00")
+    mock_api_client.async_get_all_energy_data.return_value = {
+        energy_type: {"usage": {}, "fee": {}, "goal": {}, "daily_usage": {}}
+        for energy_type in ("ELEC", "WATER", "GAS")
+    }
+    data = await coordinator._async_update_data()
+
+    assert mock_api_client.async_get_all_energy_data.await_args[0][0] == "2025-03-16"
+    assert coordinator.data_day == "2025-03-16"
+    assert data["ELEC"]["daily_usage"] == {}
+
+
+async def test_energy_update_backs_off_when_daily_usage_unsupported(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 03:00:00+00:00")
+    mock_api_client.async_get_all_energy_data.return_value = {
+        energy_type: {
+            "usage": {"usage": 64400},
+            "fee": {"fee": 7860},
+            "goal": {"goal": 400000},
+            "daily_usage": {},
+        }
+        for energy_type in ("ELEC", "WATER", "GAS")
+    }
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator._async_update_data()
+
+    freezer.tick(timedelta(minutes=20))
+    await coordinator._async_update_data()
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert {item_type for _, item_type in requested} == {"usage"}
+
+    freezer.tick(timedelta(hours=6))
+    await coordinator._async_update_data()
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert ("ELEC", "daily_usage") in requested
+
+
+async def test_energy_update_does_not_back_off_when_all_items_fail(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 03:00:00+00:00")
+    mock_api_client.async_get_all_energy_data.return_value = {
+        energy_type: {"usage": {}, "fee": {}, "goal": {}, "daily_usage": {}}
+        for energy_type in ("ELEC", "WATER", "GAS")
+    }
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator._async_update_data()
+
+    freezer.tick(timedelta(minutes=1))
+    await coordinator._async_update_data()
+    requested = mock_api_client.async_get_all_energy_data.await_args[0][1]
+    assert ("ELEC", "daily_usage") in requested
+
+
+async def test_energy_update_maintains_month_end_projections(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    # Noon KST on 11 March: 10.5 of 31 days elapsed
+    freezer.move_to("2025-03-11 03:00:00+00:00")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator._async_update_data()
+
+    elec = coordinator.projections["ELEC"]
+    assert elec.average_daily_usage == round(64.4 / 10.5, 3)
+    assert elec.projected_usage == round(elec.average_daily_usage * 31, 3)
+    assert elec.projected_fee == int(7860 / 64.4 * elec.projected_usage)
+    assert elec.projected_goal_percent == round(elec.projected_usage / 400 * 100, 1)
+    assert coordinator.projections["GAS"].projected_fee == 0
+
+    # A new month starts the projection over
+    freezer.move_to("2025-04-02 03:00:00+00:00")
+    mock_api_client.async_get_all_energy_data.return_value = {
+        energy_type: {"usage": {"usage": 3000}, "fee": {}, "goal": {}, "daily_usage": {}}
+        for energy_type in ("ELEC", "WATER", "GAS")
+    }
+    await coordinator._async_update_data()
+
+    assert elec.month == "2025-04"
+    assert elec.average_daily_usage == round(3 / 1.5, 3)
+    assert elec.projected_fee is None
+
+
+async def test_async_update_data_fires_device_diffs(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    events = async_capture_events(hass, "hiot_devices_changed")
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert events == []
+    assert coordinator.last_changes == []
+
+    mock_api_client.async_get_all_device_states.return_value = {
+        "lights": {
+            "light001": {
+                "statusList": [
+                    {"command": "power", "value": "off"},
+                    {"command": "dimming", "value": "3"},
+                ]
+            }
+        },
+        "heaters": {"heat001": {"statusList": [{"command": "power", "value": "on"}]}},
+        "aircons": {"air001": {"statusList": [{"command": "power", "value": "on"}]}},
+        "fans": {"fan001": {"statusList": [{"command": "power", "value": "on"}]}},
+        "gases": {"gas001": {"statusList": [{"command": "power", "value": "on"}]}},
+        "wall-sockets": {},
+    }
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data == {
+        "entry_id": mock_config_entry.entry_id,
+        "changes": [
+            {
+                "category": "lights",
+                "device_id": "light001",
+                "status": {"power": "off", "dimming": "3"},
+                "previous": {"power": "on", "dimming": None},
+            },
+            {
+                "category": "wall-sockets",
+                "device_id": "ws001",
+                "status": {"power": None},
+                "previous": {"power": "on"},
+            },
+        ],
+    }
+
+
+async def test_failed_poll_keeps_previous_snapshot_for_diffs(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    events = async_capture_events(hass, "hiot_devices_changed")
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    assert len(coordinator.last_changes) == 6
+
+    mock_api_client.async_get_all_device_states.side_effect = HiotApiError("boom")
+    await coordinator.async_refresh()
+    mock_api_client.async_get_all_device_states.side_effect = None
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert events == []
+    assert coordinator.last_changes == []
+
+
+async def test_household_aggregates_update_from_changed_devices_only(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    assert coordinator.household.members["lights_on"] == {"light001"}
+    assert coordinator.household.count("running_aircons") == 1
+
+    mock_api_client.async_get_all_device_states.return_value = {
+        **mock_api_client.async_get_all_device_states.return_value,
+        "lights": {
+            "light001": {"statusList": [{"command": "power", "value": "off"}]},
+            "light002": {"statusList": [{"command": "power", "value": "on"}]},
+        },
+        "aircons": {},
+    }
+    await coordinator.async_refresh()
+
+    assert coordinator.household.members["lights_on"] == {"light002"}
+    assert coordinator.household.count("running_aircons") == 0
+    assert coordinator.household.count("active_heating_zones") == 1
+
+
+async def _fast_poll_coordinator(hass, mock_config_entry, mock_api_client):
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = await mock_api_client.async_get_devices()
+    await coordinator.async_refresh()
+    mock_api_client.async_get_device_state.return_value = {
+        "statusList": [{"command": "power", "value": "off"}]
+    }
+    return coordinator
+
+
+async def test_fast_poll_publishes_gas_valve_change_without_bulk_poll(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = await _fast_poll_coordinator(hass, mock_config_entry, mock_api_client)
+    events = async_capture_events(hass, EVENT_DEVICES_CHANGED)
+    listener = MagicMock()
+    unsubscribe = coordinator.async_add_listener(listener)
+
+    await coordinator.async_fast_poll()
+
+    mock_api_client.async_get_device_state.assert_awaited_once_with("gases", "gas001")
+    assert mock_api_client.async_get_all_device_states.await_count == 1
+    assert coordinator.data["gases"]["gas001"]["statusList"] == [
+        {"command": "power", "value": "off"}
+    ]
+    assert coordinator.status_maps[("gases", "gas001")] == {"power": "off"}
+    assert coordinator.household.count("open_gas_valves") == 0
+    assert events[0].data["changes"] == [
+        {
+            "category": "gases",
+            "device_id": "gas001",
+            "status": {"power": "off"},
+            "previous": {"power": "on"},
+        }
+    ]
+    listener.assert_called_once()
+
+    # Unchanged readings do not wake up the listeners
+    await coordinator.async_fast_poll()
+    listener.assert_called_once()
+    assert coordinator.fast_polls == 2
+    assert coordinator.fast_poll_changes == 1
+    unsubscribe()
+
+
+async def test_fast_poll_ignores_readings_without_status(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = await _fast_poll_coordinator(hass, mock_config_entry, mock_api_client)
+    events = async_capture_events(hass, EVENT_DEVICES_CHANGED)
+    mock_api_client.async_get_device_state.return_value = {}
+
+    await coordinator.async_fast_poll()
+    await coordinator.async_fast_poll()
+
+    assert events == []
+    assert coordinator.status_maps[("gases", "gas001")] == {"power": "on"}
+    assert coordinator.household.count("open_gas_valves") == 1
+    assert coordinator._fast_poll_readings == {}
+
+
+async def test_fast_poll_reading_wins_over_older_bulk_poll(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = await _fast_poll_coordinator(hass, mock_config_entry, mock_api_client)
+    stale = mock_api_client.async_get_all_device_states.return_value
+
+    async def _bulk_poll_outrun_by_fast_poll():
+        await coordinator.async_fast_poll()
+        return stale
+
+    mock_api_client.async_get_all_device_states.side_effect = _bulk_poll_outrun_by_fast_poll
+    await coordinator.async_refresh()
+    assert coordinator.status_maps[("gases", "gas001")] == {"power": "off"}
+
+    # A bulk poll requested after the reading is authoritative again
+    mock_api_client.async_get_all_device_states.side_effect = None
+    await coordinator.async_refresh()
+    assert coordinator.status_maps[("gases", "gas001")] == {"power": "on"}
+
+
+async def test_fast_poll_follows_selection_and_bulk_interval(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(mock_config_entry, options={"fast_poll_devices": []})
+    coordinator = await _fast_poll_coordinator(hass, mock_config_entry, mock_api_client)
+
+    await coordinator.async_fast_poll()
+    mock_api_client.async_get_device_state.assert_not_awaited()
+
+    hass.config_entries.async_update_entry(mock_config_entry, options={})
+    coordinator.update_interval = timedelta(seconds=5)
+    await coordinator.async_fast_poll()
+    mock_api_client.async_get_device_state.assert_not_awaited()
+
+    coordinator.update_interval = timedelta(seconds=20)
+    await coordinator.async_fast_poll()
+    mock_api_client.async_get_device_state.assert_awaited_once()
+
+
+async def test_batch_commands_are_not_skipped_until_next_poll(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+    light = {("lights", "light001"): [{"command": "power", "value": "on"}]}
+
+    await coordinator.async_send_commands(
+        {("lights", "light001"): [{"command": "power", "value": "off"}]}
+    )
+    # The poll still shows the light on, but it predates the command
+    await coordinator.async_send_commands(light)
+    assert mock_api_client.async_control_devices.await_count == 2
+    assert coordinator.skipped_commands == 0
+
+    await coordinator.async_refresh()
+    await coordinator.async_send_commands(light)
+    assert mock_api_client.async_control_devices.await_count == 2
+    assert coordinator.skipped_commands == 1
@@ -0,0 +1,49 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from custom_components.hiot.const import DOMAIN
+from custom_components.hiot.coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
+from custom_components.hiot.diagnostics import async_get_config_entry_diagnostics
+
+
+async def test_diagnostics_redacts_config_and_reports_performance(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    energy_coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = await mock_api_client.async_get_devices()
+    coordinator.data = await coordinator._async_update_data()
+    energy_coordinator.data = await energy_coordinator._async_update_data()
+    mock_api_client.metrics.record_success("bulk_status", 0.25, 2048)
+    mock_api_client.metrics.record_reauth("bulk_status")
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {
+        "coordinator": coordinator,
+        "energy_coordinator": energy_coordinator,
+    }
+
+    result = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    entry_data = result["entry"]["data"]
+    assert entry_data["username"] == "**REDACTED**"
+    assert entry_data["password"] == "**REDACTED**"
+    assert entry_data["ho"] == "**REDACTED**"
+    assert entry_data["site_id"] == "site001"
+
+    performance = result["performance"]
+    device_perf = performance["device_coordinator"]
+    assert device_perf["update_interval"] == 20
+    assert device_perf["device_list_size"] == 6
+    assert device_perf["categories"]["lights"] == {"devices": 1, "statuses": 1}
+    assert device_perf["skipped_commands"] == 0
+    assert device_perf["suppressed_writes"] == 0
+    assert device_perf["fast_poll"] == {"devices": ["gas001"], "polls": 0, "changes": 0}
+    assert device_perf["command_journal"] == {"pending": 0, "replays": 0, "last_replay": []}
+    assert len(device_perf["poll_history"]) == 1
+    assert device_perf["poll_history"][0]["success"] is True
+    assert performance["energy_coordinator"]["update_interval"] == 1800
+    assert len(performance["energy_coordinator"]["poll_history"]) == 1
+    assert performance["endpoints"]["bulk_status"]["last_payload_bytes"] == 2048
+    assert performance["endpoints"]["bulk_status"]["latency_p50"] == 0.25
+    assert performance["reauth_history"][0]["endpoint"] == "bulk_status"
+    assert performance["batch_errors"] == []
@@ -0,0 +1,157 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from custom_components.hiot.coordinator import HiotEnergyCoordinator
+from custom_components.hiot.energy_history import HiotEnergyHistoryImporter, statistic_id_for
+
+
+def _history_stream(history_for) -> AsyncMock:
+    """Mock async_stream_energy_usage_history from a per-type item factory."""
+
+    async def _stream(energy_type, date, on_item):
+        items = history_for(energy_type)
+        for item in items:
+            on_item(item)
+        return len(items)
+
+    return AsyncMock(side_effect=_stream)
+
+
+def _importer(hass, mock_config_entry, mock_api_client) -> HiotEnergyHistoryImporter:
+    hass.config.components.add("recorder")
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.data = {
+        "ELEC": {"usage": {"usage": 64400}},
+        "WATER": {"usage": {}},
+        "GAS": {"usage": {}},
+    }
+    return HiotEnergyHistoryImporter(hass, mock_config_entry, coordinator)
+
+
+async def test_import_backfills_history_and_persists_cursor(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 12:00:00+09:00")
+    mock_api_client.async_stream_energy_usage_history = _history_stream(
+        lambda energy_type: (
+            [
+                {"date": "2025-01-01", "usage": 250000},
+                {"date": "2025-02-01", "usage": 200000},
+                {"date": "2025-03-01", "usage": 10000},
+            ]
+            if energy_type == "ELEC"
+            else []
+        )
+    )
+    importer = _importer(hass, mock_config_entry, mock_api_client)
+
+    with patch(
+        "custom_components.hiot.energy_history.async_add_external_statistics"
+    ) as mock_add:
+        await importer.async_import()
+
+    assert mock_api_client.async_stream_energy_usage_history.await_count == 3
+    assert mock_add.call_count == 1
+    metadata, statistics = mock_add.call_args[0][1:]
+    assert metadata["statistic_id"] == statistic_id_for(mock_config_entry.entry_id, "ELEC")
+    assert metadata["unit_of_measurement"] == "kWh"
+    assert [stat["start"].month for stat in statistics] == [1, 2, 3]
+    assert [stat["state"] for stat in statistics] == [250, 200, 64.4]
+    assert [stat["sum"] for stat in statistics] == [250, 450, 514.4]
+    assert importer.cursors["ELEC"] == {"last_period": "2025-02-01", "sum": 450}
+    assert importer.cursors["WATER"] == {"last_period": "2025-02-01", "sum": 0.0}
+
+
+async def test_import_skips_history_when_cursor_is_current(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-20 12:00:00+09:00")
+    mock_api_client.async_stream_energy_usage_history = _history_stream(lambda _: [])
+    importer = _importer(hass, mock_config_entry, mock_api_client)
+    importer._cursors = {
+        energy_type: {"last_period": "2025-02-01", "sum": 450.0}
+        for energy_type in ("ELEC", "WATER", "GAS")
+    }
+
+    with patch(
+        "custom_components.hiot.energy_history.async_add_external_statistics"
+    ) as mock_add:
+        await importer.async_import()
+
+    mock_api_client.async_stream_energy_usage_history.assert_not_awaited()
+    statistics = mock_add.call_args[0][2]
+    assert len(statistics) == 1
+    assert statistics[0]["sum"] == 514.4
+
+
+async def test_import_fetches_only_after_month_rollover(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-04-02 12:00:00+09:00")
+    mock_api_client.async_stream_energy_usage_history = _history_stream(
+        lambda _: [
+            {"date": "2025-02-01", "usage": 200000},
+            {"date": "2025-03-01", "usage": 300000},
+        ]
+    )
+    importer = _importer(hass, mock_config_entry, mock_api_client)
+    importer._cursors = {"ELEC": {"last_period": "2025-02-01", "sum": 450.0}}
+
+    with patch("custom_components.hiot.energy_history.async_add_external_statistics"):
+        await importer.async_import()
+
+    assert importer.cursors["ELEC"] == {"last_period": "2025-03-01", "sum": 750.0}
+
+
+async def test_import_waits_for_just_closed_month_missing_from_history(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-04-02 12:00:00+09:00")
+    mock_api_client.async_stream_energy_usage_history = _history_stream(
+        lambda _: [{"date": "2025-02-01", "usage": 200000}]
+    )
+    importer = _importer(hass, mock_config_entry, mock_api_client)
+    importer._cursors = {"ELEC": {"last_period": "2025-01-01", "sum": 250.0}}
+
+    with patch(
+        "custom_components.hiot.energy_history.async_add_external_statistics"
+    ) as mock_add:
+        await importer.async_import()
+
+    assert importer.cursors["ELEC"] == {"last_period": "2025-02-01", "sum": 450.0}
+    assert [stat["sum"] for stat in mock_add.call_args_list[0][0][2]] == [450.0, 514.4]
+
+    # The next run reads history again and picks up March once it is reported
+    mock_api_client.async_stream_energy_usage_history = _history_stream(
+        lambda _: [
+            {"date": "2025-02-01", "usage": 200000},
+            {"date": "2025-03-01", "usage": 300000},
+        ]
+    )
+    with patch(
+        "custom_components.hiot.energy_history.async_add_external_statistics"
+    ) as mock_add:
+        await importer.async_import()
+
+    assert importer.cursors["ELEC"] == {"last_period": "2025-03-01", "sum": 750.0}
+    assert [stat["sum"] for stat in mock_add.call_args_list[0][0][2]] == [750.0, 814.4]
+
+
+async def test_import_fills_history_gap_from_closed_month(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-04-02 12:00:00+09:00")
+    mock_api_client.async_stream_energy_usage_history = _history_stream(
+        lambda _: [{"date": "2025-02-01", "usage": 200000}]
+    )
+    importer = _importer(hass, mock_config_entry, mock_api_client)
+    importer._coordinator.closed_months["2025-03"] = {"ELEC": {"usage": {"usage": 300000}}}
+    importer._cursors = {"ELEC": {"last_period": "2025-01-01", "sum": 250.0}}
+
+    with patch("custom_components.hiot.energy_history.async_add_external_statistics"):
+        await importer.async_import()
+
+    assert importer.cursors["ELEC"] == {"last_period": "2025-03-01", "sum": 750.0}
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.hiot.energy_schedule import PublishScheduleEstimator
+
+INTERVAL = timedelta(minutes=30)
+FETCH_DURATION = timedelta(seconds=2)
+
+
+def _published_value(
+    now: datetime, publish_offset: timedelta, period: timedelta = timedelta(hours=1)
+) -> int:
+    """Return how many publications have happened by ``now``."""
+    return int((now - publish_offset).timestamp() // period.total_seconds())
+
+
+def _run(
+    estimator: PublishScheduleEstimator,
+    start: datetime,
+    hours: int,
+    publish_offset: timedelta,
+    period: timedelta = timedelta(hours=1),
+) -> tuple[datetime, list[datetime]]:
+    now = start
+    fetches = []
+    end = start + timedelta(hours=hours)
+    while now < end:
+        fetches.append(now)
+        estimator.observe(now, now + FETCH_DURATION, _published_value(now, publish_offset, period))
+        next_refresh = estimator.next_refresh(now + FETCH_DURATION, INTERVAL)
+        now = next_refresh if next_refresh is not None else now + INTERVAL
+    return now, fetches
+
+
+def test_estimator_keeps_fixed_interval_until_something_is_learned() -> None:
+    estimator = PublishScheduleEstimator()
+    now = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+
+    estimator.observe(now, now + FETCH_DURATION, 1)
+
+    assert not estimator.learned
+    assert estimator.next_refresh(now, INTERVAL) is None
+
+
+def test_estimator_aligns_refreshes_after_publish_minute() -> None:
+    estimator = PublishScheduleEstimator()
+    start = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+
+    _, fetches = _run(estimator, start, 12, timedelta(minutes=5, seconds=30))
+
+    assert estimator.aligned
+    assert 5 in estimator.candidates
+    last_hours = [fetch for fetch in fetches if fetch >= start + timedelta(hours=8)]
+    assert len(last_hours) == 4
+    assert all(6 <= fetch.minute <= 9 for fetch in last_hours)
+
+
+def test_estimator_relearns_when_publish_time_moves() -> None:
+    estimator = PublishScheduleEstimator()
+    start = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+    now, _ = _run(estimator, start, 12, timedelta(minutes=5, seconds=30))
+
+    _, fetches = _run(estimator, now, 24, timedelta(minutes=35, seconds=30))
+
+    assert estimator.aligned
+    assert 35 in estimator.candidates
+    assert all(36 <= fetch.minute <= 39 for fetch in fetches[-4:])
+
+
+def test_estimator_respects_longer_configured_interval_once_aligned() -> None:
+    estimator = PublishScheduleEstimator()
+    start = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+    now, _ = _run(estimator, start, 12, timedelta(minutes=5, seconds=30))
+
+    next_refresh = estimator.next_refresh(now, timedelta(hours=3))
+
+    assert next_refresh is not None
+    assert next_refresh - now >= timedelta(hours=3)
+    assert 6 <= next_refresh.minute <= 9
+
+
+def test_estimator_never_refreshes_sooner_than_interval() -> None:
+    for period in (timedelta(days=1), timedelta(hours=1), timedelta(minutes=15)):
+        estimator = PublishScheduleEstimator()
+        start = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+
+        _, fetches = _run(estimator, start, 72, timedelta(minutes=5, seconds=30), period)
+
+        assert min(later - earlier for earlier, later in zip(fetches, fetches[1:])) >= INTERVAL
+        assert len([fetch for fetch in fetches if fetch >= start + timedelta(hours=48)]) <= 48
+
+
+def test_estimator_gives_up_on_backends_without_hourly_publish() -> None:
+    estimator = PublishScheduleEstimator()
+    start = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+
+    now, _ = _run(estimator, start, 24, timedelta(minutes=5, seconds=30), timedelta(days=1))
+
+    assert estimator.abandoned
+    assert not estimator.learned
+    assert estimator.next_refresh(now, INTERVAL) is None
+
+
+def test_estimator_does_not_align_on_sub_hourly_publish() -> None:
+    estimator = PublishScheduleEstimator()
+    start = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+
+    now, fetches = _run(
+        estimator, start, 72, timedelta(minutes=5, seconds=30), timedelta(minutes=15)
+    )
+
+    assert not estimator.aligned
+    assert estimator.next_refresh(now, INTERVAL) is None
+    assert len([fetch for fetch in fetches if fetch >= start + timedelta(hours=48)]) == 48
+
+
+def test_estimator_treats_scattered_narrow_windows_as_contradiction() -> None:
+    estimator = PublishScheduleEstimator()
+    estimator._candidates = {5, 6, 20, 35, 50}
+    now = datetime(2025, 3, 1, 0, 10, tzinfo=UTC)
+
+    assert not estimator.aligned
+    assert estimator.next_refresh(now, INTERVAL) is None
@@ -0,0 +1,87 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+import os
+from datetime import date
+from unittest.mock import patch
+
+from custom_components.hiot.coordinator import HiotEnergyCoordinator
+from custom_components.hiot.energy_store import (
+    HEADER,
+    RECORD,
+    EnergySeriesFile,
+    HiotEnergyStore,
+    async_remove_energy_store,
+    series_path,
+)
+
+
+def test_series_file_appends_and_rebuilds_index(tmp_path) -> None:
+    path = str(tmp_path / "series.bin")
+    series = EnergySeriesFile(path)
+    series.open()
+
+    with patch("custom_components.hiot.energy_store.GROWTH_RECORDS", 2):
+        assert series.append(date(2025, 3, 1), 1.5, 1.5)
+        assert not series.append(date(2025, 3, 1), 1.5, 1.5)
+        assert series.append(date(2025, 3, 1), 2.0, None)
+        assert series.append(date(2025, 3, 2), 3.25, 1.25)
+    series.close()
+
+    reopened = EnergySeriesFile(path)
+    reopened.open()
+    assert reopened.count == 3
+    assert reopened.last_reading(date(2025, 3, 1)) == (2.0, None)
+    assert reopened.last_reading(date(2025, 3, 2)) == (3.25, 1.25)
+    assert reopened.last_reading(date(2025, 3, 3)) is None
+    reopened.close()
+
+
+def test_series_file_discards_unreadable_file(tmp_path) -> None:
+    path = tmp_path / "series.bin"
+    path.write_bytes(b"not a series file")
+
+    series = EnergySeriesFile(str(path))
+    series.open()
+
+    assert series.count == 0
+    assert series.append(date(2025, 3, 1), 1.0, None)
+    series.close()
+    assert path.stat().st_size >= HEADER.size + RECORD.size
+
+
+async def test_store_answers_comparisons_from_recorded_readings(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    store = HiotEnergyStore(hass, mock_config_entry, coordinator)
+    await store.async_open()
+
+    readings = {
+        date(2024, 3, 15): (95.0, None),
+        date(2025, 3, 14): (60.0, 4.0),
+        date(2025, 3, 15): (64.4, None),
+    }
+    for day, (month_usage, daily_usage) in readings.items():
+        await hass.async_add_executor_job(
+            store._append, day, {"ELEC": (month_usage, daily_usage), "GAS": (None, None)}
+        )
+
+    comparisons = await store.async_comparisons("ELEC", date(2025, 3, 15))
+    assert comparisons == {
+        "month_to_date": 64.4,
+        "same_period_last_year": 95.0,
+        "year_over_year_change": -30.6,
+        "today": 4.4,
+        "yesterday": 4.0,
+        "day_over_day_change": 0.4,
+    }
+    # Days without a reading fall back to the latest earlier one in the month
+    assert (await store.async_comparisons("ELEC", date(2025, 3, 20)))["month_to_date"] == 64.4
+    assert store.record_counts() == {"ELEC": 3, "WATER": 0, "GAS": 0}
+
+    await store.async_close()
+    await async_remove_energy_store(hass, mock_config_entry.entry_id)
+    paths = [series_path(hass, mock_config_entry.entry_id, t) for t in ("ELEC", "GAS")]
+    assert not any(os.path.exists(path) for path in paths)
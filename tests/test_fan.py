@@ -6,9 +6,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 from homeassistant.util.percentage import ordered_list_item_to_percentage
 
-from custom_components.hiot.const import DOMAIN
+from custom_components.hiot.const import DOMAIN, ORDERED_NAMED_FAN_SPEEDS
 from custom_components.hiot.coordinator import HiotDataUpdateCoordinator
-from custom_components.hiot.fan import HiotFan, ORDERED_NAMED_FAN_SPEEDS, async_setup_entry
+from custom_components.hiot.fan import HiotFan, async_setup_entry
 
 
 async def test_fan_setup_entry_creates_entities(hass, mock_config_entry, mock_api_client) -> None:
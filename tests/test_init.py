@@ -0,0 +1,65 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.hiot.const import DOMAIN
+
+
+async def test_setup_and_unload_entry(hass, mock_config_entry, mock_api_client) -> None:
+    mock_config_entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.hiot.async_create_clientsession", return_value=MagicMock()),
+        patch("custom_components.hiot.HiotApiClient", return_value=mock_api_client),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.async_entity_ids("switch")
+    energy_store = hass.data[DOMAIN][mock_config_entry.entry_id]["energy_store"]
+    assert energy_store.record_counts() == {"ELEC": 1, "WATER": 1, "GAS": 1}
+    assert set(energy_store.comparisons) == {"ELEC", "WATER", "GAS"}
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_options_update_reloads_only_when_light_groups_change(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_config_entry.add_to_hass(hass)
+    mock_api_client.async_get_devices.return_value = [
+        {"deviceId": "light001", "deviceType": "light", "deviceName": "조명1", "deviceLocation": "거실"},
+        {"deviceId": "light002", "deviceType": "light", "deviceName": "조명2", "deviceLocation": "거실"},
+    ]
+    with (
+        patch("custom_components.hiot.async_create_clientsession", return_value=MagicMock()),
+        patch("custom_components.hiot.HiotApiClient", return_value=mock_api_client),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as schedule_reload:
+        # The first save of the options form writes the default selection
+        hass.config_entries.async_update_entry(
+            mock_config_entry,
+            options={"device_scan_interval": "30", "light_group_locations": ["거실"]},
+        )
+        await hass.async_block_till_done()
+        schedule_reload.assert_not_called()
+
+        hass.config_entries.async_update_entry(
+            mock_config_entry,
+            options={"device_scan_interval": "30", "light_group_locations": []},
+        )
+        await hass.async_block_till_done()
+        schedule_reload.assert_called_once_with(mock_config_entry.entry_id)
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 from custom_components.hiot.const import DOMAIN
 from custom_components.hiot.coordinator import HiotDataUpdateCoordinator
-from custom_components.hiot.light import HiotLight, async_setup_entry
+from custom_components.hiot.light import HiotLight, HiotLightGroup, async_setup_entry
 
 
 async def test_light_setup_entry_creates_entities(hass, mock_config_entry, mock_api_client) -> None:
@@ -51,3 +51,232 @@ async def test_light_state_and_controls(hass, mock_config_entry, mock_api_client
         "light001",
         [{"command": "power", "value": "on"}],
     )
+
+
+async def test_light_skips_command_matching_fresh_state(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+
+    entity = HiotLight(coordinator, "light001", "거실 조명", "light")
+
+    await entity.async_turn_on()
+    mock_api_client.async_control_device.assert_not_called()
+    coordinator.async_request_refresh.assert_not_called()
+    assert coordinator.skipped_commands == 1
+
+    await entity.async_turn_off()
+    mock_api_client.async_control_device.assert_awaited_once_with(
+        "lights",
+        "light001",
+        [{"command": "power", "value": "off"}],
+    )
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert coordinator.skipped_commands == 1
+
+
+async def test_light_on_off_on_within_refresh_cooldown(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    device_power = {"value": "off"}
+
+    async def _control(category, device_id, commands):
+        device_power["value"] = commands[-1]["value"]
+        return {}
+
+    async def _states():
+        return {"lights": {"light001": {"statusList": [{"command": "power", **device_power}]}}}
+
+    mock_api_client.async_control_device.side_effect = _control
+    mock_api_client.async_get_all_device_states.side_effect = _states
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    entity = HiotLight(coordinator, "light001", "거실 조명", "light")
+
+    # The first refresh runs at once; the second waits out the debouncer cooldown
+    await entity.async_turn_on()
+    await entity.async_turn_off()
+    await entity.async_turn_on()
+
+    assert device_power["value"] == "on"
+    assert mock_api_client.async_control_device.await_count == 3
+    assert coordinator.skipped_commands == 0
+    await coordinator.async_shutdown()
+
+
+async def test_light_sends_command_when_state_is_stale(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.data_updated_at -= 120
+
+    entity = HiotLight(coordinator, "light001", "거실 조명", "light")
+    await entity.async_turn_on()
+
+    mock_api_client.async_control_device.assert_awaited_once()
+    assert coordinator.skipped_commands == 0
+
+
+async def test_light_skipping_can_be_disabled(hass, mock_config_entry, mock_api_client) -> None:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"skip_redundant_commands": False}
+    )
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+
+    entity = HiotLight(coordinator, "light001", "거실 조명", "light")
+    await entity.async_turn_on()
+
+    mock_api_client.async_control_device.assert_awaited_once()
+    assert coordinator.skipped_commands == 0
+
+
+async def test_light_skips_unchanged_state_writes_when_enabled(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"reduce_recorder_writes": True}
+    )
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+
+    entity = HiotLight(coordinator, "light001", "거실 조명", "light")
+    entity.async_write_ha_state = MagicMock()
+
+    entity._handle_coordinator_update()
+    await coordinator.async_refresh()
+    entity._handle_coordinator_update()
+    entity.async_write_ha_state.assert_called_once()
+    assert coordinator.suppressed_writes == 1
+
+    mock_api_client.async_get_all_device_states.return_value = {
+        "lights": {"light001": {"statusList": [{"command": "power", "value": "off"}]}},
+    }
+    await coordinator.async_refresh()
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+    assert entity.is_on is False
+
+
+async def test_light_writes_every_update_by_default(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+
+    entity = HiotLight(coordinator, "light001", "거실 조명", "light")
+    entity.async_write_ha_state = MagicMock()
+
+    entity._handle_coordinator_update()
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+    assert coordinator.suppressed_writes == 0
+
+
+def _living_room_lights(mock_api_client) -> list[dict]:
+    mock_api_client.async_get_all_device_states.return_value = {
+        "lights": {
+            "light001": {"statusList": [{"command": "power", "value": "on"}]},
+            "light002": {"statusList": [{"command": "power", "value": "off"}]},
+            "light003": {"statusList": [{"command": "power", "value": "off"}]},
+        },
+    }
+    return [
+        {"deviceId": "light001", "deviceType": "light", "deviceName": "조명1", "deviceLocation": "거실"},
+        {"deviceId": "light002", "deviceType": "light", "deviceName": "조명2", "deviceLocation": "거실"},
+        {"deviceId": "light003", "deviceType": "light", "deviceName": "조명", "deviceLocation": "안방"},
+    ]
+
+
+async def test_light_group_per_location(hass, mock_config_entry, mock_api_client) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = _living_room_lights(mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {"coordinator": coordinator}
+
+    add_entities = MagicMock()
+    await async_setup_entry(hass, mock_config_entry, add_entities)
+    groups = [e for e in add_entities.call_args[0][0] if isinstance(e, HiotLightGroup)]
+
+    assert len(groups) == 1
+    group = groups[0]
+    assert group.name == "거실 전체 조명"
+    assert group.unique_id == f"{mock_config_entry.entry_id}_light_group_거실"
+    assert group.is_on is True
+    assert group.extra_state_attributes == {"lights_on": 1}
+
+    await group.async_turn_on()
+    mock_api_client.async_control_devices.assert_awaited_once_with(
+        {("lights", "light002"): [{"command": "power", "value": "on"}]}
+    )
+    coordinator.async_request_refresh.assert_awaited_once()
+
+    mock_api_client.async_get_all_device_states.return_value = {
+        "lights": {
+            "light001": {"statusList": [{"command": "power", "value": "off"}]},
+            "light002": {"statusList": [{"command": "power", "value": "off"}]},
+        },
+    }
+    await coordinator.async_refresh()
+    group.async_write_ha_state = MagicMock()
+    group._handle_coordinator_update()
+    assert group.is_on is False
+    group.async_write_ha_state.assert_called_once()
+
+
+async def test_light_group_skips_unchanged_state_writes_when_enabled(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"reduce_recorder_writes": True}
+    )
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = _living_room_lights(mock_api_client)
+    await coordinator.async_refresh()
+    group = HiotLightGroup(
+        coordinator, mock_config_entry.entry_id, "light_group_거실", ["light001", "light002"], "거실"
+    )
+    group.async_write_ha_state = MagicMock()
+
+    group._handle_coordinator_update()
+    await coordinator.async_refresh()
+    group._handle_coordinator_update()
+    group.async_write_ha_state.assert_called_once()
+    assert coordinator.suppressed_writes == 1
+
+    mock_api_client.async_get_all_device_states.return_value = {
+        "lights": {
+            "light001": {"statusList": [{"command": "power", "value": "off"}]},
+            "light002": {"statusList": [{"command": "power", "value": "off"}]},
+        },
+    }
+    await coordinator.async_refresh()
+    group._handle_coordinator_update()
+    assert group.is_on is False
+    assert group.async_write_ha_state.call_count == 2
+
+
+async def test_light_group_locations_follow_options(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"light_group_locations": []}
+    )
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = _living_room_lights(mock_api_client)
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {"coordinator": coordinator}
+
+    add_entities = MagicMock()
+    await async_setup_entry(hass, mock_config_entry, add_entities)
+
+    assert not any(isinstance(e, HiotLightGroup) for e in add_entities.call_args[0][0])
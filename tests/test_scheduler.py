@@ -0,0 +1,234 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.hiot.const import DOMAIN
+from custom_components.hiot.coordinator import HiotDataUpdateCoordinator
+from custom_components.hiot.scheduler import (
+    HiotCommandScheduler,
+    ScheduledCommand,
+    coalesce_commands,
+)
+from custom_components.hiot.services import async_setup_services
+
+
+async def _scheduler(hass, mock_config_entry, mock_api_client) -> HiotCommandScheduler:
+    mock_config_entry.add_to_hass(hass)
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator._devices = await mock_api_client.async_get_devices()
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+    scheduler = HiotCommandScheduler(hass, mock_config_entry, coordinator)
+    await scheduler.async_load()
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {
+        "coordinator": coordinator,
+        "scheduler": scheduler,
+    }
+    return scheduler
+
+
+def _register_entity(
+    hass, mock_config_entry, domain: str, device_type: str, device_id: str, object_id: str
+) -> None:
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={(DOMAIN, f"{mock_config_entry.entry_id}_{device_id}")},
+    )
+    er.async_get(hass).async_get_or_create(
+        domain,
+        DOMAIN,
+        f"{mock_config_entry.entry_id}_{device_type}_{device_id}",
+        config_entry=mock_config_entry,
+        device_id=device.id,
+        suggested_object_id=object_id,
+    )
+
+
+def test_coalesce_commands_merges_per_device() -> None:
+    controls = coalesce_commands(
+        [
+            ScheduledCommand("a", 1.0, "fans", "fan001", [{"command": "wind", "value": "mid"}]),
+            ScheduledCommand("b", 1.0, "fans", "fan001", [{"command": "power", "value": "off"}]),
+            ScheduledCommand("c", 1.0, "fans", "fan001", [{"command": "wind", "value": "low"}]),
+            ScheduledCommand("d", 1.0, "lights", "light001", [{"command": "power", "value": "off"}]),
+        ]
+    )
+
+    assert controls == {
+        ("fans", "fan001"): [
+            {"command": "power", "value": "off"},
+            {"command": "wind", "value": "low"},
+        ],
+        ("lights", "light001"): [{"command": "power", "value": "off"}],
+    }
+
+
+async def test_commands_due_together_run_as_one_batch(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 12:00:00+00:00")
+    scheduler = await _scheduler(hass, mock_config_entry, mock_api_client)
+    due = dt_util.utcnow() + timedelta(minutes=30)
+
+    scheduler.async_schedule("fans", "fan001", [{"command": "power", "value": "off"}], due)
+    scheduler.async_schedule("lights", "light001", [{"command": "power", "value": "off"}], due)
+    scheduler.async_schedule(
+        "wall-sockets", "ws001", [{"command": "power", "value": "off"}], due + timedelta(hours=1)
+    )
+    assert scheduler.pending == 3
+    assert scheduler.next_due == due
+
+    freezer.tick(timedelta(minutes=29))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_api_client.async_control_devices.assert_not_called()
+
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    mock_api_client.async_control_devices.assert_awaited_once_with(
+        {
+            ("fans", "fan001"): [{"command": "power", "value": "off"}],
+            ("lights", "light001"): [{"command": "power", "value": "off"}],
+        }
+    )
+    assert scheduler.pending == 1
+    assert scheduler.runs == 1
+    await scheduler.async_unload()
+
+
+async def test_pending_commands_survive_restart(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 12:00:00+00:00")
+    scheduler = await _scheduler(hass, mock_config_entry, mock_api_client)
+    scheduler.async_schedule(
+        "fans", "fan001", [{"command": "power", "value": "off"}], dt_util.utcnow() + timedelta(minutes=5)
+    )
+    await scheduler.async_unload()
+
+    freezer.tick(timedelta(minutes=10))
+    restored = HiotCommandScheduler(
+        hass, mock_config_entry, hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    )
+    await restored.async_load()
+    assert restored.pending == 1
+
+    # Overdue commands run as soon as the timer is armed
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_api_client.async_control_devices.assert_awaited_once()
+    assert restored.pending == 0
+    await restored.async_unload()
+
+
+async def test_schedule_command_service(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 12:00:00+00:00")
+    scheduler = await _scheduler(hass, mock_config_entry, mock_api_client)
+    _register_entity(hass, mock_config_entry, "switch", "wallsocket", "ws001", "standby_power")
+    async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "schedule_command",
+        {"entity_id": "switch.standby_power", "command": "power", "value": "off", "delay": {"minutes": 30}},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["due"] == "2025-03-15T12:30:00+00:00"
+    assert scheduler.pending == 1
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "schedule_command",
+            {"entity_id": "switch.unknown", "command": "power", "value": "off", "delay": 60},
+            blocking=True,
+        )
+    await scheduler.async_unload()
+
+
+@pytest.mark.parametrize(
+    ("entity_id", "command", "value"),
+    [
+        ("switch.gas_valve", "power", "on"),
+        ("switch.gas_valve", "wind", "off"),
+        ("climate.heater", "setTemperature", "90"),
+        ("climate.heater", "setTemperature", "warm"),
+        ("climate.heater", "mode", "cool"),
+    ],
+)
+async def test_schedule_command_rejects_unsupported_commands(
+    hass, mock_config_entry, mock_api_client, entity_id, command, value
+) -> None:
+    scheduler = await _scheduler(hass, mock_config_entry, mock_api_client)
+    _register_entity(hass, mock_config_entry, "switch", "gas", "gas001", "gas_valve")
+    _register_entity(hass, mock_config_entry, "climate", "heating", "heat001", "heater")
+    async_setup_services(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "schedule_command",
+            {"entity_id": entity_id, "command": command, "value": value, "delay": 60},
+            blocking=True,
+        )
+
+    assert scheduler.pending == 0
+    await scheduler.async_unload()
+
+
+async def test_schedule_command_sends_temperature_as_whole_degrees(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    scheduler = await _scheduler(hass, mock_config_entry, mock_api_client)
+    _register_entity(hass, mock_config_entry, "climate", "heating", "heat001", "heater")
+    async_setup_services(hass)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "schedule_command",
+        {"entity_id": "climate.heater", "command": "setTemperature", "value": "22.5", "delay": 60},
+        blocking=True,
+    )
+
+    ((_, _, item),) = scheduler._heap
+    assert item.commands == [{"command": "setTemperature", "value": "22"}]
+    await scheduler.async_unload()
+
+
+async def test_scheduled_gas_shut_off_is_sent_when_already_closed(
+    hass, mock_config_entry, mock_api_client, freezer
+) -> None:
+    freezer.move_to("2025-03-15 12:00:00+00:00")
+    mock_api_client.async_get_all_device_states.return_value = {
+        "gases": {"gas001": {"statusList": [{"command": "power", "value": "off"}]}}
+    }
+    scheduler = await _scheduler(hass, mock_config_entry, mock_api_client)
+
+    scheduler.async_schedule(
+        "gases", "gas001", [{"command": "power", "value": "off"}], dt_util.utcnow() + timedelta(seconds=5)
+    )
+    # Due while the poll still shows the valve closed
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    mock_api_client.async_control_devices.assert_awaited_once()
+    (controls,) = mock_api_client.async_control_devices.await_args.args
+    assert controls == {("gases", "gas001"): [{"command": "power", "value": "off"}]}
+    await scheduler.async_unload()
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+from datetime import date
 from unittest.mock import MagicMock
 
+from homeassistant.const import EntityCategory
+
+from custom_components.hiot.api import HiotConnectionError
 from custom_components.hiot.const import DOMAIN
-from custom_components.hiot.coordinator import HiotEnergyCoordinator
-from custom_components.hiot.sensor import HiotEnergySensor, async_setup_entry
+from custom_components.hiot.coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
+from custom_components.hiot.energy_store import HiotEnergyStore
+from custom_components.hiot.sensor import (
+    HiotApiMetricSensor,
+    HiotEnergyComparisonSensor,
+    HiotEnergyProjectionSensor,
+    HiotEnergySensor,
+    HiotHouseholdSensor,
+    async_setup_entry,
+)
 
 
 async def test_sensor_setup_entry_creates_energy_entities(
@@ -14,18 +26,62 @@ async def test_sensor_setup_entry_creates_energy_entities(
 ) -> None:
     coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
     hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {
+        "coordinator": HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client),
         "energy_coordinator": coordinator,
     }
 
     add_entities = MagicMock()
     await async_setup_entry(hass, mock_config_entry, add_entities)
 
-    entities = add_entities.call_args[0][0]
-    assert len(entities) == 12
+    entities = [
+        entity for entity in add_entities.call_args[0][0] if isinstance(entity, HiotEnergySensor)
+    ]
+    assert len(entities) == 15
     assert any(entity.unique_id == f"{mock_config_entry.entry_id}_energy_elec_usage" for entity in entities)
     assert any(entity.unique_id == f"{mock_config_entry.entry_id}_energy_water_fee" for entity in entities)
     assert any(entity.unique_id == f"{mock_config_entry.entry_id}_energy_gas_goal" for entity in entities)
     assert any(entity.unique_id == f"{mock_config_entry.entry_id}_energy_elec_same_area_usage" for entity in entities)
+    assert (
+        sum(
+            isinstance(entity, HiotEnergyProjectionSensor)
+            for entity in add_entities.call_args[0][0]
+        )
+        == 12
+    )
+
+
+async def test_comparison_sensors_follow_energy_store(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    store = HiotEnergyStore(hass, mock_config_entry, coordinator)
+    await store.async_open()
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {
+        "coordinator": HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client),
+        "energy_coordinator": coordinator,
+        "energy_store": store,
+    }
+    add_entities = MagicMock()
+    await async_setup_entry(hass, mock_config_entry, add_entities)
+    sensors = {
+        entity.unique_id: entity
+        for entity in add_entities.call_args[0][0]
+        if isinstance(entity, HiotEnergyComparisonSensor)
+    }
+    assert len(sensors) == 6
+    sensor = sensors[f"{mock_config_entry.entry_id}_energy_elec_day_over_day_change"]
+    sensor.hass = hass
+    sensor.async_write_ha_state = MagicMock()
+    await sensor.async_added_to_hass()
+    assert sensor.native_value is None
+
+    await store._async_append(date(2025, 3, 14), {"ELEC": (60.0, 4.0)})
+    await store._async_append(date(2025, 3, 15), {"ELEC": (64.4, None)})
+
+    assert sensor.native_value == 0.4
+    assert sensor.extra_state_attributes == {"today": 4.4, "yesterday": 4.0}
+    assert sensor.async_write_ha_state.call_count == 2
+    await store.async_close()
 
 
 async def test_energy_sensor_unit_conversion_and_attributes(
@@ -107,3 +163,231 @@ async def test_energy_sensor_unit_conversion_and_attributes(
         (DOMAIN, f"{mock_config_entry.entry_id}_energy")
     }
     assert elec_usage.device_info.get("manufacturer") == "Hyundai HT"
+
+
+async def test_energy_sensor_last_reset_follows_data_month(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.data = {"ELEC": {"usage": {"usage": 64400}, "goal": {"goal": 400000}}}
+    coordinator.data_month = "2025-03"
+
+    usage = HiotEnergySensor(coordinator, mock_config_entry.entry_id, "ELEC", "usage")
+    goal = HiotEnergySensor(coordinator, mock_config_entry.entry_id, "ELEC", "goal")
+
+    assert usage.last_reset is not None
+    assert usage.last_reset.isoformat() == "2025-03-01T00:00:00+09:00"
+    assert goal.last_reset is None
+
+
+async def test_daily_usage_sensor_reports_today_with_day_last_reset(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.data = {"GAS": {"daily_usage": {"usage": 2300}}}
+    coordinator.data_month = "2025-03"
+    coordinator.data_day = "2025-03-15"
+
+    daily = HiotEnergySensor(coordinator, mock_config_entry.entry_id, "GAS", "daily_usage")
+
+    assert daily.native_value == 2.3
+    assert daily.native_unit_of_measurement == "m³"
+    assert daily.unique_id == f"{mock_config_entry.entry_id}_energy_gas_daily_usage"
+    assert daily.last_reset is not None
+    assert daily.last_reset.isoformat() == "2025-03-15T00:00:00+09:00"
+
+
+async def test_energy_sensors_share_view_and_skip_unchanged_writes(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.data = {"ELEC": {"usage": {"usage": 64400}, "fee": {"fee": 7860}}}
+    usage = HiotEnergySensor(coordinator, mock_config_entry.entry_id, "ELEC", "usage")
+    fee = HiotEnergySensor(coordinator, mock_config_entry.entry_id, "ELEC", "fee")
+    usage.async_write_ha_state = MagicMock()
+    fee.async_write_ha_state = MagicMock()
+
+    view = coordinator.energy_view
+    coordinator.data = {"ELEC": {"usage": {"usage": 64400}, "fee": {"fee": 7900}}}
+    usage._handle_coordinator_update()
+    fee._handle_coordinator_update()
+
+    assert coordinator.energy_view is not view
+    assert coordinator.energy_view is coordinator.energy_view
+    usage.async_write_ha_state.assert_not_called()
+    fee.async_write_ha_state.assert_called_once()
+    assert fee.native_value == 7900
+    assert coordinator.suppressed_writes == 1
+
+    coordinator.last_update_success = False
+    usage._handle_coordinator_update()
+    usage.async_write_ha_state.assert_called_once()
+
+
+async def test_projection_sensors_read_coordinator_projections(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.projections["WATER"].update("2025-03", 31, 10.0, 5.0, 9000, 20.0)
+
+    average = HiotEnergyProjectionSensor(
+        coordinator, mock_config_entry.entry_id, "WATER", "average_daily_usage"
+    )
+    fee = HiotEnergyProjectionSensor(
+        coordinator, mock_config_entry.entry_id, "WATER", "projected_fee"
+    )
+    goal = HiotEnergyProjectionSensor(
+        coordinator, mock_config_entry.entry_id, "WATER", "projected_goal_percent"
+    )
+
+    assert average.native_value == 0.5
+    assert average.native_unit_of_measurement == "m³"
+    assert fee.native_value == 27900
+    assert fee.native_unit_of_measurement == "KRW"
+    assert goal.native_value == 77.5
+    assert goal.unique_id == f"{mock_config_entry.entry_id}_energy_water_projected_goal_percent"
+
+    average.async_write_ha_state = MagicMock()
+    average._handle_coordinator_update()
+    average.async_write_ha_state.assert_called_once()
+
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"reduce_recorder_writes": True}
+    )
+    average._handle_coordinator_update()
+    average.async_write_ha_state.assert_called_once()
+    assert coordinator.suppressed_writes == 1
+
+
+async def test_sensor_setup_entry_creates_disabled_api_metric_entities(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {
+        "coordinator": HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client),
+        "energy_coordinator": HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client),
+    }
+
+    add_entities = MagicMock()
+    await async_setup_entry(hass, mock_config_entry, add_entities)
+
+    entities = [
+        entity for entity in add_entities.call_args[0][0] if isinstance(entity, HiotApiMetricSensor)
+    ]
+    assert len(entities) == 35
+    assert all(entity.entity_category == EntityCategory.DIAGNOSTIC for entity in entities)
+    assert not any(entity.entity_registry_enabled_default for entity in entities)
+    assert any(
+        entity.unique_id == f"{mock_config_entry.entry_id}_api_bulk_status_latency_p95"
+        for entity in entities
+    )
+
+
+async def test_api_metric_sensor_values(hass, mock_config_entry, mock_api_client) -> None:
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    metrics = mock_api_client.metrics
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        metrics.record_success("bulk_status", latency)
+    metrics.record_error("bulk_status", HiotConnectionError("boom"), 1.0)
+    metrics.record_reauth("bulk_status")
+
+    requests = HiotApiMetricSensor(coordinator, mock_config_entry.entry_id, "bulk_status", "requests")
+    errors = HiotApiMetricSensor(coordinator, mock_config_entry.entry_id, "bulk_status", "errors")
+    reauths = HiotApiMetricSensor(coordinator, mock_config_entry.entry_id, "bulk_status", "reauths")
+    p50 = HiotApiMetricSensor(coordinator, mock_config_entry.entry_id, "bulk_status", "latency_p50")
+    p95 = HiotApiMetricSensor(coordinator, mock_config_entry.entry_id, "bulk_status", "latency_p95")
+    idle = HiotApiMetricSensor(coordinator, mock_config_entry.entry_id, "ems_goal", "latency_p50")
+
+    assert requests.native_value == 5
+    assert errors.native_value == 1
+    assert errors.extra_state_attributes == {"HiotConnectionError": 1}
+    assert reauths.native_value == 1
+    assert p50.native_value == 300.0
+    assert p95.native_value == 1000.0
+    assert idle.native_value is None
+    assert requests.device_info is not None
+    assert requests.device_info.get("name") == "HT HomeService API"
+
+
+async def test_same_area_usage_attribute_is_not_recorded(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    coordinator.data = {"ELEC": {"usage": {"usage": 64400, "sameAreaTypeUsage": 123000}}}
+    usage = HiotEnergySensor(coordinator, mock_config_entry.entry_id, "ELEC", "usage")
+
+    assert usage.extra_state_attributes == {"sameAreaTypeUsage": 123}
+    assert "sameAreaTypeUsage" in usage._unrecorded_attributes
+
+
+async def test_api_metric_sensor_skips_unchanged_writes_when_enabled(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"reduce_recorder_writes": True}
+    )
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    requests = HiotApiMetricSensor(coordinator, mock_config_entry.entry_id, "bulk_status", "requests")
+    requests.async_write_ha_state = MagicMock()
+
+    requests._handle_coordinator_update()
+    requests.async_write_ha_state.assert_not_called()
+    assert coordinator.suppressed_writes == 1
+
+    mock_api_client.metrics.record_success("bulk_status", 0.1)
+    requests._handle_coordinator_update()
+    requests.async_write_ha_state.assert_called_once()
+    assert requests.native_value == 1
+
+
+async def test_household_sensors_follow_device_diffs(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"reduce_recorder_writes": True}
+    )
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator._async_setup()
+    await coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {
+        "coordinator": coordinator,
+        "energy_coordinator": HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client),
+    }
+
+    add_entities = MagicMock()
+    await async_setup_entry(hass, mock_config_entry, add_entities)
+    sensors = {
+        entity.unique_id.rsplit("_household_", 1)[1]: entity
+        for entity in add_entities.call_args[0][0]
+        if isinstance(entity, HiotHouseholdSensor)
+    }
+
+    assert set(sensors) == {
+        "lights_on",
+        "active_heating_zones",
+        "running_aircons",
+        "open_gas_valves",
+        "energised_wall_sockets",
+    }
+    assert sensors["lights_on"].native_value == 1
+    assert sensors["lights_on"].extra_state_attributes == {"devices": ["거실 조명"]}
+    assert sensors["energised_wall_sockets"].extra_state_attributes == {
+        "devices": ["대기전력 거실1"]
+    }
+
+    for sensor in sensors.values():
+        sensor.async_write_ha_state = MagicMock()
+    mock_api_client.async_get_all_device_states.return_value = {
+        **mock_api_client.async_get_all_device_states.return_value,
+        "gases": {"gas001": {"statusList": [{"command": "power", "value": "off"}]}},
+    }
+    await coordinator.async_refresh()
+    for sensor in sensors.values():
+        sensor._handle_coordinator_update()
+
+    assert sensors["open_gas_valves"].native_value == 0
+    assert sensors["open_gas_valves"].extra_state_attributes == {"devices": []}
+    sensors["open_gas_valves"].async_write_ha_state.assert_called_once()
+    sensors["lights_on"].async_write_ha_state.assert_not_called()
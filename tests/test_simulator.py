@@ -0,0 +1,93 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from custom_components.hiot.api import HiotApiClient, HiotApiError
+from tests.simulator import HiotSimulator, SimulatorConfig
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@asynccontextmanager
+async def _client(config: SimulatorConfig, timeout: float | None = None):
+    async with HiotSimulator(config) as simulator:
+        connector = aiohttp.TCPConnector(
+            enable_cleanup_closed=False,
+            resolver=aiohttp.ThreadedResolver(),
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as session:
+            client = HiotApiClient(session, base_url=simulator.url)
+            household = simulator.households[0]
+            await client.async_login("simuser", "simpass")
+            await client.async_get_ctoc_token(household.site_id, household.dong, household.ho)
+            yield simulator, client
+
+
+async def test_simulator_serves_bulk_status_and_control() -> None:
+    async with _client(SimulatorConfig(households=2, devices_per_household=12)) as (
+        simulator,
+        client,
+    ):
+        devices = await client.async_get_devices()
+        states = await client.async_get_all_device_states()
+
+        assert len(devices) == 12
+        assert len(states["lights"]) == 2
+        assert states["lights"]["light0000"]["statusList"] == [{"command": "power", "value": "off"}]
+
+        await client.async_control_device("lights", "light0000", [{"command": "power", "value": "on"}])
+        state = await client.async_get_device_state("lights", "light0000")
+
+        assert state["statusList"] == [{"command": "power", "value": "on"}]
+        assert simulator.request_counts["/proxy/ctoc/{category}/{device_id}"] == 2
+
+
+async def test_simulator_serves_energy_endpoints() -> None:
+    async with _client(SimulatorConfig()) as (_simulator, client):
+        data = await client.async_get_all_energy_data("2025-02-01")
+
+    for energy_type in ("ELEC", "WATER", "GAS"):
+        assert data[energy_type]["usage"]["usage"] > 0
+        assert data[energy_type]["fee"]["fee"] > 0
+        assert data[energy_type]["goal"]["goal"] > 0
+
+
+async def test_simulator_session_expiry_triggers_reauth() -> None:
+    async with _client(SimulatorConfig()) as (simulator, client):
+        simulator.expire_sessions()
+
+        with patch("custom_components.hiot.api.asyncio.sleep", new=AsyncMock()):
+            states = await client.async_get_all_device_states()
+
+    assert states["lights"]
+    assert simulator.status_counts[401] == 1
+    assert simulator.request_counts["/login"] == 2
+
+
+async def test_simulator_injects_server_errors() -> None:
+    async with _client(SimulatorConfig()) as (simulator, client):
+        simulator.config.error_rate = 1.0
+
+        with pytest.raises(HiotApiError):
+            await client.async_get_devices()
+
+    assert simulator.status_counts[500] == 1
+
+
+async def test_simulator_injects_timeouts() -> None:
+    async with _client(SimulatorConfig(), timeout=0.2) as (simulator, client):
+        simulator.config.timeout_rate = 1.0
+        simulator.config.timeout_delay = 1.0
+
+        with pytest.raises(HiotApiError):
+            await client.async_get_devices()
@@ -49,6 +49,27 @@ async def test_switch_state_and_turn_off(hass, mock_config_entry, mock_api_clien
     )
 
 
+async def test_gas_valve_shut_off_is_always_sent(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    mock_api_client.async_get_all_device_states.return_value = {
+        "gases": {"gas001": {"statusList": [{"command": "power", "value": "off"}]}},
+    }
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    coordinator.async_request_refresh = AsyncMock()
+
+    entity = HiotGasValve(coordinator, "gas001", "가스 밸브", "gas")
+    await entity.async_turn_off()
+
+    mock_api_client.async_control_device.assert_awaited_once_with(
+        "gases",
+        "gas001",
+        [{"command": "power", "value": "off"}],
+    )
+    assert coordinator.skipped_commands == 0
+
+
 async def test_switch_turn_on_logs_warning_and_does_not_call_api(
     hass, mock_config_entry, mock_api_client, caplog
 ) -> None:
@@ -0,0 +1,107 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.hiot.api import HiotApiError
+from custom_components.hiot.const import DOMAIN
+from custom_components.hiot.coordinator import HiotDataUpdateCoordinator, HiotEnergyCoordinator
+from custom_components.hiot.websocket_api import (
+    websocket_snapshot,
+    websocket_subscribe_snapshot,
+)
+
+
+async def _setup_entry_data(hass, mock_config_entry, mock_api_client):
+    coordinator = HiotDataUpdateCoordinator(hass, mock_config_entry, mock_api_client)
+    energy_coordinator = HiotEnergyCoordinator(hass, mock_config_entry, mock_api_client)
+    await coordinator.async_refresh()
+    await energy_coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = {
+        "coordinator": coordinator,
+        "energy_coordinator": energy_coordinator,
+    }
+    return coordinator, energy_coordinator
+
+
+def _events(connection: MagicMock) -> list[dict]:
+    return [call.args[0]["event"] for call in connection.send_message.call_args_list]
+
+
+async def test_snapshot_returns_devices_and_energy(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    await _setup_entry_data(hass, mock_config_entry, mock_api_client)
+    connection = MagicMock()
+
+    websocket_snapshot(
+        hass, connection, {"id": 1, "type": "hiot/snapshot", "entry_id": mock_config_entry.entry_id}
+    )
+
+    msg_id, result = connection.send_result.call_args.args
+    assert msg_id == 1
+    assert result["devices"]["lights"] == {"light001": {"power": "on"}}
+    assert len(result["devices"]) == 6
+    assert result["energy"]["values"]["ELEC"]["usage"] == 64.4
+    assert result["energy"]["values"]["GAS"]["fee"] == 0
+    assert result["energy"]["month"] is not None
+
+
+async def test_snapshot_unknown_entry(hass) -> None:
+    connection = MagicMock()
+
+    websocket_snapshot(hass, connection, {"id": 1, "type": "hiot/snapshot", "entry_id": "missing"})
+
+    connection.send_result.assert_not_called()
+    assert connection.send_error.call_args.args[:2] == (1, "not_found")
+
+
+async def test_subscribe_sends_snapshot_then_diffs(
+    hass, mock_config_entry, mock_api_client
+) -> None:
+    coordinator, energy_coordinator = await _setup_entry_data(
+        hass, mock_config_entry, mock_api_client
+    )
+    connection = MagicMock()
+    connection.subscriptions = {}
+
+    websocket_subscribe_snapshot(
+        hass,
+        connection,
+        {"id": 5, "type": "hiot/snapshot/subscribe", "entry_id": mock_config_entry.entry_id},
+    )
+    connection.send_result.assert_called_once_with(5)
+    assert _events(connection)[0]["snapshot"]["devices"]["fans"] == {"fan001": {"power": "on"}}
+
+    # A failed poll re-runs listeners without new data
+    mock_api_client.async_get_all_device_states.side_effect = HiotApiError("boom")
+    await coordinator.async_refresh()
+    mock_api_client.async_get_all_device_states.side_effect = None
+    mock_api_client.async_get_all_device_states.return_value = {
+        **mock_api_client.async_get_all_device_states.return_value,
+        "fans": {"fan001": {"statusList": [{"command": "power", "value": "off"}]}},
+    }
+    await coordinator.async_refresh()
+    assert _events(connection)[1:] == [
+        {
+            "changes": [
+                {
+                    "category": "fans",
+                    "device_id": "fan001",
+                    "status": {"power": "off"},
+                    "previous": {"power": "on"},
+                }
+            ]
+        }
+    ]
+
+    energy_data = mock_api_client.async_get_all_energy_data.return_value
+    energy_coordinator.async_set_updated_data(
+        {**energy_data, "WATER": {**energy_data["WATER"], "fee": {"fee": 29000}}}
+    )
+    assert _events(connection)[2] == {"energy": {"values": {"WATER": {"fee": 29000}}}}
+
+    connection.subscriptions[5]()
+    await coordinator.async_refresh()
+    assert len(_events(connection)) == 3